@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Async_AES.py
+
+Prueba de carga local de AsyncImageCipher (Taller AES/Taller_AES_Async.py).
+Para cada nivel de concurrencia lanza `--requests` peticiones de cifrado +
+descifrado de `--size` KB desde otras tantas tareas asyncio y reporta la
+latencia p50/p99 (incluye la espera por el semáforo) y el throughput.
+
+Ejemplo:
+    python Benchmark_Async_AES.py --levels 1 4 16 64 --size 256 --requests 400
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Taller AES'))
+
+from Taller_AES_Async import AsyncImageCipher
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_level(concurrency: int, requests: int, payload: bytes, key: bytes, max_in_flight: int) -> dict:
+    latencies = []
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(payload)
+
+    async with AsyncImageCipher(key, max_in_flight=max_in_flight) as cipher:
+        async def client():
+            while True:
+                try:
+                    data = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                start = time.perf_counter()
+                blob = await cipher.encrypt(data)
+                if await cipher.decrypt(blob) != data:
+                    raise AssertionError('El descifrado no coincide con la entrada')
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        'concurrency': concurrency,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'mean_ms': statistics.mean(latencies) * 1000,
+        'req_s': requests / elapsed,
+        'mb_s': requests * len(payload) / elapsed / (1 << 20),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Prueba de carga de AsyncImageCipher')
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64], help='Niveles de concurrencia (clientes simultáneos)')
+    parser.add_argument('--requests', type=int, default=200, help='Peticiones por nivel. Default=200')
+    parser.add_argument('--size', type=int, default=256, help='Tamaño de cada petición en KB. Default=256')
+    parser.add_argument('--max-in-flight', type=int, default=os.cpu_count() or 1, help='Límite de trabajos en curso del cifrador. Default=núcleos')
+    args = parser.parse_args(argv)
+
+    key = os.urandom(32)
+    payload = os.urandom(args.size * 1024)
+    print(f"{'clientes':>8} | {'p50 (ms)':>9} {'p99 (ms)':>9} {'media (ms)':>10} | {'req/s':>8} {'MB/s':>8}")
+    for level in args.levels:
+        r = asyncio.run(run_level(level, args.requests, payload, key, args.max_in_flight))
+        print(f"{r['concurrency']:>8} | {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['mean_ms']:>10.2f} | "
+              f"{r['req_s']:>8.1f} {r['mb_s']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
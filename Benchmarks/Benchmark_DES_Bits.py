@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_DES_Bits.py
+
+Compara el camino que usa hoy Taller_DES.process_image con el pipeline
+original, que convertía el archivo completo en un string de bits ('0'/'1',
+8 caracteres por byte) y cifraba/descifraba en memoria.
+
+Para cada tamaño se escribe un archivo temporal y se mide:
+  - la etapa de bits: string completo y vuelta a bytes frente a
+    `_report_bits` (lee sólo la muestra de 16 bytes);
+  - el pipeline completo: bits + encrypt_des + decrypt_des en memoria frente
+    a `process_image` (cifrado por streaming, Base64 y descifrado a archivo).
+
+Ejemplo:
+    python Benchmark_DES_Bits.py --sizes 1 10 50
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Taller DES'))
+
+import Taller_DES
+
+
+def bits_legacy(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        data = f.read()
+    bits = Taller_DES.bytes_to_bitstring(data)
+    len(bits)
+    bits[:128]
+    return Taller_DES.bitstring_to_bytes(bits)
+
+
+def bits_current(path: str) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        Taller_DES._report_bits(path)
+
+
+def pipeline_legacy(path: str, key: bytes) -> None:
+    plain = bits_legacy(path)
+    iv_ct = Taller_DES.encrypt_des(plain, key)
+    if Taller_DES.decrypt_des(iv_ct, key) != plain:
+        raise AssertionError('El descifrado no coincide con la entrada')
+
+
+def pipeline_current(path: str, key: bytes) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        recovered = Taller_DES.process_image(path, key, do_show=False, preview=0)
+    with open(path, 'rb') as a, open(recovered, 'rb') as b:
+        if a.read() != b.read():
+            raise AssertionError('El descifrado no coincide con la entrada')
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de la representación de bits de Taller_DES')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 10, 50], help='Tamaños en MB. Default: 1 10 50')
+    args = parser.parse_args(argv)
+
+    key = os.urandom(8)
+    print(f"{'MB':>6} | {'bits str (s)':>12} {'_report_bits':>12} {'x':>8} | "
+          f"{'pipeline str (s)':>16} {'process_image':>13} {'x':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mb in args.sizes:
+            path = os.path.join(tmp, f'imagen_{mb:g}MB.bin')
+            with open(path, 'wb') as f:
+                f.write(os.urandom(int(mb * (1 << 20))))
+            t_old = timed(bits_legacy, path)
+            t_new = timed(bits_current, path)
+            p_old = timed(pipeline_legacy, path, key)
+            p_new = timed(pipeline_current, path, key)
+            print(f"{mb:>6g} | {t_old:>12.3f} {t_new:>12.6f} {t_old / max(t_new, 1e-9):>8.0f} | "
+                  f"{p_old:>16.3f} {p_new:>13.3f} {p_old / max(p_new, 1e-9):>6.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Homofonico_Solver.py
+
+Mide Criptoanalisis_Homofonico.romper_homofonico sobre los textos cifrados de
+Corpus/homofonico_pruebas.json (pasajes en inglés que no están en el corpus
+de entrenamiento, cifrados con permutaciones aleatorias del layout).
+
+Para cada caso se reporta:
+- aciertos: fracción de letras del descifrado que coinciden con el original;
+- pasos/s: reasignaciones de símbolo por segundo y por proceso;
+- tiempo hasta la solución: segundos hasta que algún reinicio alcanza la
+  puntuación de la clave verdadera (se usa como `objetivo`, así que esos
+  reinicios se detienen ahí); '-' si ninguno la alcanza;
+- tiempo total de la búsqueda.
+
+Ejemplo:
+    python Benchmark_Homofonico_Solver.py --reinicios 8 --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'Cifrado Homofonico'))
+
+from Criptoanalisis_Homofonico import PESO_ENTROPIA, _Problema, descifrar_con_clave, log_trigramas, romper_homofonico
+
+CASOS = os.path.join(ROOT, 'Corpus', 'homofonico_pruebas.json')
+
+
+def clave_verdadera(cifrado, claro):
+    """Clave símbolo -> letra deducida del par (cifrado, claro)."""
+    clave = np.zeros(int(cifrado.max()) + 1, dtype=np.int64)
+    clave[cifrado] = claro
+    return clave
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de Criptoanalisis_Homofonico')
+    parser.add_argument('--casos', default=CASOS, help='JSON con los casos de prueba')
+    parser.add_argument('--reinicios', type=int, default=8, help='Búsquedas independientes por caso. Default=8')
+    parser.add_argument('--iteraciones', type=int, default=300, help='Barridos por búsqueda. Default=300')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos. Default=núcleos')
+    parser.add_argument('--semilla', type=int, default=0, help='Semilla del primer reinicio. Default=0')
+    args = parser.parse_args(argv)
+
+    with open(args.casos, encoding='utf-8') as f:
+        casos = json.load(f)
+
+    print(f"{'caso':<18} {'letras':>6} | {'aciertos':>8} {'pasos/s':>9} {'solución (s)':>13} {'total (s)':>10}")
+    for caso in casos:
+        cifrado = np.array([int(x) for x in caso['cifrado'].split()], dtype=np.int64)
+        claro = ''.join(c for c in caso['claro'].upper() if 'A' <= c <= 'Z')
+        indices = np.frombuffer(claro.encode('ascii'), dtype=np.uint8).astype(np.int64) - 65
+        problema = _Problema(cifrado, log_trigramas(), PESO_ENTROPIA)
+        objetivo = problema.puntuacion(clave_verdadera(cifrado, indices)) / (len(cifrado) - 2)
+
+        inicio = time.perf_counter()
+        mejor, resultados = romper_homofonico(cifrado, args.reinicios, args.iteraciones, workers=args.workers,
+                                              semilla=args.semilla, objetivo=objetivo)
+        total = time.perf_counter() - inicio
+
+        aciertos = np.mean(np.frombuffer(descifrar_con_clave(cifrado, mejor['clave']).encode('ascii'), dtype=np.uint8)
+                           == np.frombuffer(claro.encode('ascii'), dtype=np.uint8))
+        pasos_s = sum(r['pasos'] for r in resultados) / sum(r['segundos'] for r in resultados)
+        resueltos = [r['tiempo_solucion'] for r in resultados if r['puntuacion'] >= objetivo]
+        solucion = f"{min(resueltos):.2f}" if resueltos else '-'
+        print(f"{caso['nombre']:<18} {len(claro):>6} | {aciertos:>8.1%} {pasos_s:>9,.0f} {solucion:>13} {total:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
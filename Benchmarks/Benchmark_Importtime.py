@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Importtime.py
+
+Mide el coste de arranque de Taller_AES y Taller_DES con `python -X importtime`
+y el tiempo total de un proceso que sólo importa el módulo y cifra 1 KB (el
+camino sin GUI, sin Pillow).
+
+Con `--baseline-rev` se extraen también las versiones de esa revisión de git
+para comparar antes/después:
+
+    python Benchmark_Importtime.py --baseline-rev HEAD~1
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+MODULES = {
+    'Taller_AES': ('Taller AES', 'Taller_AES.encrypt_bytes(b"x" * 1024, b"k" * 16)'),
+    'Taller_DES': ('Taller DES', 'Taller_DES.encrypt_des(b"x" * 1024, b"k" * 8)'),
+}
+# Módulos que los talleres importan desde otra carpeta (se exportan si existen en la revisión)
+SHARED = [('Taller Comun', 'Taller_Comun')]
+
+
+def importtime_us(module: str, path: str) -> int:
+    """Tiempo acumulado (us) de importar `module` según -X importtime."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=path, capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f'No se encontró {module} en la salida de -X importtime')
+
+
+def process_ms(module: str, path: str, call: str) -> float:
+    """Tiempo total (ms) de un intérprete que importa el módulo y cifra 1 KB."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', f'import {module}; {call}'], cwd=path, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(label: str, root: str, repeat: int) -> None:
+    for module, (folder, call) in MODULES.items():
+        path = os.path.join(root, folder)
+        imp = statistics.median(importtime_us(module, path) for _ in range(repeat))
+        wall = statistics.median(process_ms(module, path, call) for _ in range(repeat))
+        print(f'{label:>10} {module:>11} | import {imp / 1000:8.1f} ms | proceso (import + 1 KB) {wall:8.1f} ms')
+
+
+def export_revision(rev: str, dest: str) -> None:
+    files = [(folder, module, True) for module, (folder, _) in MODULES.items()]
+    files += [(folder, module, False) for folder, module in SHARED]
+    for folder, module, required in files:
+        rel = f'{folder}/{module}.py'
+        proc = subprocess.run(['git', 'show', f'{rev}:{rel}'], cwd=ROOT, capture_output=True, check=required)
+        if proc.returncode:
+            continue
+        os.makedirs(os.path.join(dest, folder), exist_ok=True)
+        with open(os.path.join(dest, folder, f'{module}.py'), 'wb') as f:
+            f.write(proc.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de arranque de Taller_AES / Taller_DES')
+    parser.add_argument('--repeat', type=int, default=7, help='Repeticiones por medida (se usa la mediana). Default=7')
+    parser.add_argument('--baseline-rev', help='Revisión de git a comparar (por ejemplo HEAD~1)')
+    args = parser.parse_args(argv)
+
+    if args.baseline_rev:
+        with tempfile.TemporaryDirectory() as tmp:
+            export_revision(args.baseline_rev, tmp)
+            measure(args.baseline_rev, tmp, args.repeat)
+    measure('actual', ROOT, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
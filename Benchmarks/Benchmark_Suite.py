@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Suite.py
+
+Benchmark reproducible de la función principal de cada cifrado del repositorio
+(Caesar, Vigenère, Hill, Playfair, Homofónico, Turning Grille, OTP, AES y DES)
+con entradas de 1 KB a 100 MB.
+
+Cada medida (cifrado, tamaño) se ejecuta en un proceso nuevo para que el pico
+de memoria (RSS) sea el de esa medida. Antes de medir se descartan
+`--warmup` llamadas de calentamiento (al menos una: imports perezosos, cachés,
+primera asignación de memoria). Se registran:
+- latencia por llamada (mediana de `--repeat` llamadas, en segundos)
+- throughput (MB/s, calculado con esa mediana)
+- pico de RSS del proceso (MB, no disponible en Windows)
+
+Los resultados se guardan en JSON. Con `--baseline` se comparan contra una
+ejecución anterior y el script termina con código 1 si en algún caso la
+latencia mediana sube o el throughput cae más de `--threshold` (por defecto
+20%).
+
+Los algoritmos clásicos en Python puro son lentos con entradas grandes: si un
+tamaño supera `--max-seconds`, los tamaños mayores de ese cifrado se omiten.
+
+Ejemplos:
+    python Benchmark_Suite.py --output base.json
+    python Benchmark_Suite.py --ciphers caesar vigenere --baseline base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+DEFAULT_SIZES = ['1K', '10K', '100K', '1M', '10M', '100M']
+
+# nombre -> carpeta del script
+FOLDERS = {
+    'caesar': 'Cifrado Caesar',
+    'vigenere': 'Cifrado Vigenere',
+    'hill': 'Cifrado Hill',
+    'playfair': 'Cifrado Playfair',
+    'homofonico': 'Cifrado Homofonico',
+    'turninggrill': 'Cifrado Turning Grill',
+    'otp': 'Cifrado OTP',
+    'aes': 'Taller AES',
+    'des': 'Taller DES',
+}
+
+
+def parse_size(text: str) -> int:
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper()
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def upper_text(size: int, rng: random.Random) -> str:
+    return ''.join(rng.choices(string.ascii_uppercase, k=size))
+
+
+def prepare(name: str, size: int):
+    """Importa el módulo del cifrado y devuelve una función sin argumentos a medir."""
+    sys.path.insert(0, os.path.join(ROOT, FOLDERS[name]))
+    rng = random.Random(size)
+
+    if name == 'caesar':
+        from Cifrado_Caesar import cifrar_cesar
+        text = upper_text(size, rng)
+        return lambda: cifrar_cesar(text, 3)
+    if name == 'vigenere':
+        from Cifrado_Vigenere import encrypt_vigenere
+        text = ''.join(rng.choices(string.ascii_letters + ' ,.', k=size))
+        return lambda: encrypt_vigenere('CLAVE', 26, text)
+    if name == 'hill':
+        from Cifrado_Hill import cifrar_hill
+        text = upper_text(size, rng)
+        return lambda: cifrar_hill(text, [3, 3, 2, 5])
+    if name == 'playfair':
+        from Cifrado_Playfair import build_grid_from_input, playfair_encrypt
+        _, letter_to_pos, pos_to_letter = build_grid_from_input(['PLAYF', 'IREXM', 'BCDGH', 'KNOQS', 'TUVWZ'])
+        text = upper_text(size, rng)
+        return lambda: playfair_encrypt(text, letter_to_pos, pos_to_letter)
+    if name == 'homofonico':
+        from Cifrado_Homofonico import CifradoHomofonico
+        cipher = CifradoHomofonico()
+        text = upper_text(size, rng)
+        return lambda: cipher.cifrar(text)
+    if name == 'turninggrill':
+        from Cifrado_TurningGrill import encrypt_turning_grille
+        holes = [(0, 0), (0, 1), (1, 0), (1, 1)]
+        text = upper_text(size, rng)
+        return lambda: encrypt_turning_grille(4, 1, holes, text)
+    if name == 'otp':
+        from Cifrado_OTP import encriptar_otp
+        message = ''.join(rng.choices('01', k=size))
+        key = ''.join(rng.choices('01', k=size))
+        return lambda: encriptar_otp(message, key)
+    if name == 'aes':
+        from Taller_AES import encrypt_bytes
+        data = rng.randbytes(size)
+        key = rng.randbytes(16)
+        return lambda: encrypt_bytes(data, key)
+    if name == 'des':
+        from Taller_DES import encrypt_des
+        data = rng.randbytes(size)
+        key = rng.randbytes(8)
+        return lambda: encrypt_des(data, key)
+    raise ValueError(f'Cifrado desconocido: {name}')
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux devuelve KB y macOS bytes
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_one(name: str, size: int, repeat: int, warmup: int = 1) -> dict:
+    """Mide un caso en el proceso actual (modo interno de --run-one)."""
+    func = prepare(name, size)
+    for _ in range(max(1, warmup)):
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    latency = statistics.median(times)
+    return {
+        'cipher': name,
+        'size': size,
+        'latency_s': latency,
+        'mb_s': size / (1 << 20) / latency if latency > 0 else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def measure(name: str, size: int, repeat: int, warmup: int) -> dict:
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--run-one', name, str(size), str(repeat),
+                           str(warmup)], capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {'cipher': name, 'size': size, 'error': proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """Devuelve los casos cuya latencia mediana sube o cuyo throughput cae más de `threshold` respecto a `baseline`."""
+    previous = {(r['cipher'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for r in results:
+        old = previous.get((r['cipher'], r['size']))
+        if not old or not old.get('latency_s') or not r.get('latency_s'):
+            continue
+        r['latency_change'] = r['latency_s'] / old['latency_s'] - 1
+        if old.get('mb_s') and r.get('mb_s'):
+            r['change'] = r['mb_s'] / old['mb_s'] - 1
+        if r['latency_change'] > threshold or r.get('change', 0) < -threshold:
+            regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark de todos los cifrados del repositorio')
+    parser.add_argument('--ciphers', nargs='+', choices=list(FOLDERS), default=list(FOLDERS), help='Cifrados a medir (por defecto, todos)')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help='Tamaños de entrada (1K, 10M, ...). Default: 1K..100M')
+    parser.add_argument('--repeat', type=int, default=5, help='Llamadas por medida (se usa la mediana). Default=5')
+    parser.add_argument('--warmup', type=int, default=1, help='Llamadas de calentamiento descartadas por medida (mínimo 1). Default=1')
+    parser.add_argument('--max-seconds', type=float, default=30.0, help='Omitir tamaños mayores si una llamada supera este tiempo. Default=30')
+    parser.add_argument('--output', default='benchmark_results.json', help='Archivo JSON de resultados')
+    parser.add_argument('--baseline', help='JSON de una ejecución anterior para detectar regresiones')
+    parser.add_argument('--threshold', type=float, default=0.20, help='Subida de latencia o caída de throughput tolerada respecto al baseline. Default=0.20')
+    parser.add_argument('--run-one', nargs=4, metavar=('CIFRADO', 'TAMAÑO', 'REPETICIONES', 'CALENTAMIENTO'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_one:
+        name, size, repeat, warmup = args.run_one
+        print(json.dumps(run_one(name, int(size), int(repeat), int(warmup))))
+        return
+
+    sizes = sorted(parse_size(s) for s in args.sizes)
+    results = []
+    print(f"{'cifrado':>12} {'tamaño':>10} | {'latencia (s)':>12} {'MB/s':>10} {'RSS (MB)':>9}")
+    for name in args.ciphers:
+        for size in sizes:
+            r = measure(name, size, args.repeat, args.warmup)
+            results.append(r)
+            if 'error' in r:
+                print(f"{name:>12} {size:>10} | error: {r['error']}")
+                break
+            rss = f"{r['peak_rss_mb']:9.1f}" if r['peak_rss_mb'] is not None else f"{'-':>9}"
+            print(f"{name:>12} {size:>10} | {r['latency_s']:>12.5f} {r['mb_s']:>10.2f} {rss}")
+            if r['latency_s'] > args.max_seconds:
+                print(f"{name:>12} tamaños mayores omitidos (> {args.max_seconds:g} s)")
+                break
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': args.repeat,
+            'warmup': max(1, args.warmup),
+        },
+        'results': results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f'Resultados guardados en: {args.output}')
+
+    if regressions:
+        print(f'Regresiones (latencia > {1 + args.threshold:.0%} o throughput < {1 - args.threshold:.0%} del baseline):')
+        for r in regressions:
+            change = f"{r['change']:+.1%}" if 'change' in r else '-'
+            print(f"  {r['cipher']} {r['size']} bytes: latencia {r['latency_change']:+.1%}, throughput {change}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Vigenere_Crack.py
+
+Mide la recuperación de clave de Cifrado_Vigenere.crack_vigenere según la
+longitud del texto y la longitud de la clave.
+
+Los casos se generan de forma reproducible (semilla fija) a partir del corpus
+Corpus/ingles.txt: para cada combinación se toman `--trials` fragmentos con
+`longitud` letras y se cifran con una clave aleatoria conocida. Se reporta la
+tasa de acierto (la clave recuperada en primer lugar es la original) y la
+mediana del tiempo de recuperación. Con `--save-cases` se guardan los
+textos cifrados y sus claves en JSON.
+
+Ejemplo:
+    python Benchmark_Vigenere_Crack.py --text-lengths 100 400 1600 --key-lengths 3 8 16
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'Cifrado Vigenere'))
+
+from Cifrado_Vigenere import ALPHABET, crack_vigenere, encrypt_vigenere
+
+CORPUS = os.path.join(ROOT, 'Corpus', 'ingles.txt')
+
+
+def excerpt(text: str, letters: int, rng: random.Random) -> str:
+    """Fragmento del corpus que contiene exactamente `letters` letras."""
+    start = rng.randrange(0, len(text))
+    out = []
+    count = 0
+    pos = start
+    while count < letters:
+        ch = text[pos % len(text)]
+        out.append(ch)
+        count += ch.isalpha()
+        pos += 1
+    return ''.join(out)
+
+
+def build_cases(text: str, text_lengths: list, key_lengths: list, trials: int, t: int, seed: int) -> list:
+    rng = random.Random(seed)
+    cases = []
+    for letters in text_lengths:
+        for key_len in key_lengths:
+            for _ in range(trials):
+                key = ''.join(rng.choices(ALPHABET[:t], k=key_len))
+                plaintext = excerpt(text, letters, rng)
+                cases.append({'letters': letters, 'key_len': key_len, 't': t, 'key': key,
+                              'ciphertext': encrypt_vigenere(key, t, plaintext)})
+    return cases
+
+
+def same_key(found: str, key: str) -> bool:
+    """La clave recuperada (reducida a su período mínimo) repetida reproduce la original."""
+    return len(key) % len(found) == 0 and found * (len(key) // len(found)) == key
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark del modo crack de Cifrado_Vigenere')
+    parser.add_argument('--text-lengths', type=int, nargs='+', default=[100, 200, 400, 800, 1600, 3200], help='Letras por texto')
+    parser.add_argument('--key-lengths', type=int, nargs='+', default=[3, 5, 8, 12, 16], help='Longitudes de clave')
+    parser.add_argument('--trials', type=int, default=5, help='Textos por combinación. Default=5')
+    parser.add_argument('--t', type=int, default=26, help='Parámetro t del cifrado. Default=26')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos de crack_vigenere. Default=núcleos')
+    parser.add_argument('--seed', type=int, default=1234, help='Semilla para generar los casos')
+    parser.add_argument('--save-cases', help='Guardar los casos (clave y texto cifrado) en este JSON')
+    args = parser.parse_args(argv)
+
+    with open(CORPUS, encoding='utf-8') as f:
+        text = f.read()
+    cases = build_cases(text, args.text_lengths, args.key_lengths, args.trials, args.t, args.seed)
+    if args.save_cases:
+        with open(args.save_cases, 'w', encoding='utf-8') as f:
+            json.dump(cases, f, indent=1)
+        print(f'Casos guardados en: {args.save_cases}')
+
+    results = {}
+    for case in cases:
+        start = time.perf_counter()
+        ranking = crack_vigenere(case['ciphertext'], case['t'], workers=args.workers)
+        elapsed = time.perf_counter() - start
+        cell = results.setdefault((case['letters'], case['key_len']), {'ok': 0, 'times': []})
+        cell['ok'] += same_key(ranking[0][0], case['key'])
+        cell['times'].append(elapsed)
+
+    print(f"{'letras':>7} {'clave':>6} | {'aciertos':>9} {'mediana (ms)':>13}")
+    for (letters, key_len), cell in sorted(results.items()):
+        print(f"{letters:>7} {key_len:>6} | {cell['ok']:>4}/{len(cell['times']):<4} "
+              f"{statistics.median(cell['times']) * 1000:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Vigenere_Numpy.py
+
+Compara el motor NumPy de Cifrado_Vigenere (`vigenere_numpy`) con el bucle
+original carácter a carácter sobre un texto en memoria de `--size` (por
+defecto 6 MB) generado repitiendo el corpus Corpus/ingles.txt.
+
+Reporta la mediana de `--repeat` llamadas de cada versión (tras una llamada
+de calentamiento descartada), los MB/s y la aceleración, y comprueba que
+ambas salidas coinciden.
+
+Ejemplo:
+    python Benchmark_Vigenere_Numpy.py --size 6M
+    python Benchmark_Vigenere_Numpy.py --size 50M --key CLAVESECRETA --t 26
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+CORPUS = os.path.join(ROOT, 'Corpus', 'ingles.txt')
+sys.path.insert(0, os.path.join(ROOT, 'Cifrado Vigenere'))
+
+import Cifrado_Vigenere  # noqa: E402
+
+
+def parse_size(text: str) -> int:
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper()
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def loop_vigenere(key: str, t: int, text: str) -> str:
+    """encrypt_vigenere forzando el bucle original (sin el motor NumPy)."""
+    threshold = Cifrado_Vigenere.NUMPY_MIN_LENGTH
+    Cifrado_Vigenere.NUMPY_MIN_LENGTH = float('inf')
+    try:
+        return Cifrado_Vigenere.encrypt_vigenere(key, t, text)
+    finally:
+        Cifrado_Vigenere.NUMPY_MIN_LENGTH = threshold
+
+
+def median_seconds(func, repeat: int):
+    """Mediana de `repeat` llamadas, tras una llamada de calentamiento descartada."""
+    result = func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Motor NumPy de Vigenère frente al bucle original')
+    parser.add_argument('--size', default='6M', help='Tamaño del texto (1K, 6M, 50M, ...). Default=6M')
+    parser.add_argument('--key', default='CLAVESECRETA', help='Clave. Default=CLAVESECRETA')
+    parser.add_argument('--t', type=int, default=26, help='Parámetro t. Default=26')
+    parser.add_argument('--repeat', type=int, default=5, help='Llamadas medidas por versión (se usa la mediana). Default=5')
+    args = parser.parse_args(argv)
+
+    size = parse_size(args.size)
+    with open(CORPUS, encoding='utf-8') as f:
+        block = f.read()
+    text = (block * (size // len(block) + 1))[:size]
+    if not text.isascii():
+        print('El corpus no es ASCII: el motor NumPy no se aplicaría')
+        sys.exit(1)
+
+    numpy_s, numpy_out = median_seconds(
+        lambda: Cifrado_Vigenere.vigenere_numpy(args.key, args.t, text), args.repeat)
+    if numpy_out is None:
+        print("Falta la librería 'numpy'. Instálela con: pip install numpy")
+        sys.exit(1)
+    loop_s, loop_out = median_seconds(lambda: loop_vigenere(args.key, args.t, text), args.repeat)
+
+    mb = size / (1 << 20)
+    print(f'{"bucle":>8}: {loop_s * 1000:9.1f} ms | {mb / loop_s:8.1f} MB/s')
+    print(f'{"numpy":>8}: {numpy_s * 1000:9.1f} ms | {mb / numpy_s:8.1f} MB/s')
+    print(f'Aceleración: {loop_s / numpy_s:.1f}x')
+    ok = numpy_out == loop_out
+    print('Salidas idénticas:', 'sí' if ok else 'NO')
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
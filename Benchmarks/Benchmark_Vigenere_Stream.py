@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark_Vigenere_Stream.py
+
+Throughput del modo streaming de Cifrado_Vigenere (`--in` / `--out`).
+
+Genera un archivo de texto de `--size` (por defecto 1 GB) repitiendo el corpus
+Corpus/ingles.txt, lo cifra y lo descifra con la línea de comandos en procesos
+separados y reporta el tiempo, los MB/s y el pico de memoria (RSS) de cada
+proceso, que debe mantenerse constante aunque crezca el archivo. Al final
+comprueba con SHA-256 que el descifrado coincide con el original.
+
+Ejemplo:
+    python Benchmark_Vigenere_Stream.py --size 1G
+    python Benchmark_Vigenere_Stream.py --size 100M --dir /tmp
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+SCRIPT = os.path.join(ROOT, 'Cifrado Vigenere', 'Cifrado_Vigenere.py')
+CORPUS = os.path.join(ROOT, 'Corpus', 'ingles.txt')
+
+
+def parse_size(text: str) -> int:
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    text = text.strip().upper()
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def generate(path: str, size: int) -> None:
+    """Escribe `size` bytes de texto repitiendo el corpus."""
+    with open(CORPUS, 'rb') as f:
+        block = f.read()
+    block = block * max(1, (1 << 20) // len(block))
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            f.write(block[:remaining])
+            remaining -= len(block)
+
+
+def sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def peak_rss_mb():
+    """Pico de RSS de los procesos hijos terminados (no disponible en Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+
+def run(mode: str, key: str, t: int, src: str, dst: str) -> tuple:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, SCRIPT, mode, key, str(t), '--in', src, '--out', dst], check=True)
+    return time.perf_counter() - start, peak_rss_mb()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Throughput del modo streaming de Cifrado_Vigenere')
+    parser.add_argument('--size', default='1G', help='Tamaño del archivo generado (1K, 100M, 1G, ...). Default=1G')
+    parser.add_argument('--key', default='CLAVESECRETA', help='Clave. Default=CLAVESECRETA')
+    parser.add_argument('--t', type=int, default=26, help='Parámetro t. Default=26')
+    parser.add_argument('--dir', default=None, help='Directorio para los archivos temporales')
+    args = parser.parse_args(argv)
+
+    size = parse_size(args.size)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        plain = os.path.join(tmp, 'plano.txt')
+        cipher = os.path.join(tmp, 'cifrado.txt')
+        back = os.path.join(tmp, 'descifrado.txt')
+        print(f'Generando {size / (1 << 20):.0f} MB de texto...')
+        generate(plain, size)
+
+        for label, mode, src, dst in (('cifrado', 'enc', plain, cipher), ('descifrado', 'dec', cipher, back)):
+            elapsed, rss = run(mode, args.key, args.t, src, dst)
+            rss_text = f'{rss:.1f} MB' if rss is not None else '-'
+            print(f'{label:>10}: {elapsed:8.2f} s | {size / (1 << 20) / elapsed:8.1f} MB/s | pico RSS (máx. de hijos) {rss_text}')
+
+        ok = sha256(plain) == sha256(back)
+        print('Descifrado idéntico al original:', 'sí' if ok else 'NO')
+        if not ok:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,61 +1,153 @@
-x=0
-mensaje="a"
-clave=0
+import functools
+import string
+
+# Tamaño de lectura para cifrar archivos (múltiplo de 5 para que los bloques
+# de 5 letras no se partan entre dos lecturas)
+TAMAÑO_LECTURA = 5 * (1 << 20)
+
+
+class _TablaCesar(dict):
+    """Tabla para str.translate con el desplazamiento de una clave.
+
+    Las 52 letras ASCII se calculan al crearla; cualquier otro carácter
+    alfabético (por ejemplo 'Ñ') se calcula y guarda la primera vez que
+    aparece, con la misma fórmula que el cifrado original. Los caracteres no
+    alfabéticos se mantienen.
+    """
+
+    def __init__(self, desplazamiento, quitar_espacios=False):
+        super().__init__()
+        self.desplazamiento = desplazamiento
+        for char in string.ascii_letters:
+            self[ord(char)] = (ord(char) - ord('A') + desplazamiento) % 26 + ord('A')
+        if quitar_espacios:
+            self[ord(' ')] = None
+
+    def __missing__(self, codigo):
+        if chr(codigo).isalpha():
+            valor = (codigo - ord('A') + self.desplazamiento) % 26 + ord('A')
+        else:
+            valor = codigo
+        self[codigo] = valor
+        return valor
+
+
+@functools.lru_cache(maxsize=None)
+def tabla_cesar(desplazamiento, quitar_espacios=False):
+    """Tabla de traducción (str) para un desplazamiento, cacheada por clave."""
+    return _TablaCesar(desplazamiento % 26, quitar_espacios)
+
+
+@functools.lru_cache(maxsize=None)
+def tabla_cesar_bytes(desplazamiento):
+    """Tabla de 256 bytes para bytes.translate (sólo letras ASCII)."""
+    tabla = bytearray(range(256))
+    for char in string.ascii_letters.encode():
+        tabla[char] = (char - ord('A') + desplazamiento) % 26 + ord('A')
+    return bytes(tabla)
+
 
 def dividir_en_bloques(texto, tamaño_bloque=5):
     """Divide el texto en bloques de tamaño especificado (por defecto 5)"""
-    bloques = []
-    for i in range(0, len(texto), tamaño_bloque):
-        bloques.append(texto[i:i+tamaño_bloque])
-    return ' '.join(bloques)
+    return ' '.join(texto[i:i+tamaño_bloque] for i in range(0, len(texto), tamaño_bloque))
+
+def dividir_en_bloques_bytes(datos, tamaño_bloque=5):
+    """Igual que dividir_en_bloques para bytes; usa NumPy si está instalado"""
+    completos = len(datos) - len(datos) % tamaño_bloque
+    try:
+        import numpy as np
+    except ImportError:
+        return b' '.join(datos[i:i+tamaño_bloque] for i in range(0, len(datos), tamaño_bloque))
+    filas = np.frombuffer(datos, dtype=np.uint8, count=completos).reshape(-1, tamaño_bloque)
+    salida = np.full((len(filas), tamaño_bloque + 1), ord(' '), dtype=np.uint8)
+    salida[:, :tamaño_bloque] = filas
+    agrupado = salida.tobytes()[:-1]
+    resto = datos[completos:]
+    if resto:
+        agrupado = agrupado + b' ' + resto if agrupado else bytes(resto)
+    return agrupado
 
 def cifrar_cesar(mensaje, clave):
-    mensaje_cifrado = ""
-    for char in mensaje:
-        if char.isalpha():
-            desplazamiento = (ord(char) - ord('A') + clave) % 26
-            mensaje_cifrado += chr(desplazamiento + ord('A'))
-        else:
-            mensaje_cifrado += char
+    mensaje_cifrado = mensaje.translate(tabla_cesar(clave))
     # Dividir en bloques de 5 letras
     return dividir_en_bloques(mensaje_cifrado)
 
 def descifrar_cesar(mensaje, clave):
-    # Eliminar espacios del mensaje cifrado
-    mensaje = mensaje.replace(" ", "")
-    mensaje_descifrado = ""
-    for char in mensaje:
-        if char.isalpha():
-            desplazamiento = (ord(char) - ord('A') - clave) % 26
-            mensaje_descifrado += chr(desplazamiento + ord('A'))
-        else:
-            mensaje_descifrado += char
-    return mensaje_descifrado
+    # Eliminar espacios del mensaje cifrado y descifrar en una sola pasada
+    return mensaje.translate(tabla_cesar(-clave, quitar_espacios=True))
 
-while x!=1 and x!=2:
-    try:
-        x = int(input("Ingrese la opción que desea\n1. Cifrar\n2. Descifrar\n>>"))
-    except ValueError:
-        print("Opción inválida. Por favor, ingrese 1 o 2.")
+def cifrar_cesar_bytes(datos, clave):
+    """Cifra bytes (letras ASCII) y los agrupa en bloques de 5"""
+    return dividir_en_bloques_bytes(datos.translate(tabla_cesar_bytes(clave % 26)))
 
-while clave<=0 or any(not c.isdigit() for c in str(clave)):
-    try:
-        clave = int(input("Ingrese la clave de descifrado: "))
-    except ValueError:
-        print("Clave inválida. Por favor, ingrese un número entero positivo.")
+def descifrar_cesar_bytes(datos, clave):
+    """Descifra bytes (letras ASCII) eliminando los espacios"""
+    return datos.translate(tabla_cesar_bytes(-clave % 26), b' ')
+
+def cifrar_archivo_cesar(origen, destino, clave, tamaño_lectura=TAMAÑO_LECTURA):
+    """Cifra un archivo por bloques de lectura; el resultado es igual a cifrar_cesar_bytes del archivo completo"""
+    if tamaño_lectura % 5:
+        raise ValueError("tamaño_lectura debe ser múltiplo de 5")
+    with open(origen, 'rb') as entrada, open(destino, 'wb') as salida:
+        primero = True
+        while True:
+            bloque = entrada.read(tamaño_lectura)
+            if not bloque:
+                break
+            if not primero:
+                salida.write(b' ')
+            salida.write(cifrar_cesar_bytes(bloque, clave))
+            primero = False
+
+def descifrar_archivo_cesar(origen, destino, clave, tamaño_lectura=TAMAÑO_LECTURA):
+    """Descifra un archivo por bloques de lectura"""
+    with open(origen, 'rb') as entrada, open(destino, 'wb') as salida:
+        while True:
+            bloque = entrada.read(tamaño_lectura)
+            if not bloque:
+                break
+            salida.write(descifrar_cesar_bytes(bloque, clave))
+
+def main():
+    x=0
+    mensaje="a"
+    clave=0
+
+    while x not in (1, 2, 3):
+        try:
+            x = int(input("Ingrese la opción que desea\n1. Cifrar\n2. Descifrar\n3. Romper (sin clave)\n>>"))
+        except ValueError:
+            print("Opción inválida. Por favor, ingrese 1, 2 o 3.")
+
+    if x==3:
+        from Criptoanalisis_Caesar import descifrar, romper_caesar
+        while any(not c.isupper() and c!=" " for c in mensaje):
+            mensaje = input("Ingrese el mensaje cifrado en mayusculas (puede incluir espacios): ")
+        for clave, confianza in romper_caesar([mensaje], top_k=3)[0]:
+            print(f"Clave {clave:2d} ({confianza:6.1%}):", descifrar(mensaje, clave))
+        input("Presione cualquier tecla para salir...")
+        return
+
+    while clave<=0 or any(not c.isdigit() for c in str(clave)):
+        try:
+            clave = int(input("Ingrese la clave de descifrado: "))
+        except ValueError:
+            print("Clave inválida. Por favor, ingrese un número entero positivo.")
 
-if x==1:
-    while any(not c.isupper() for c in mensaje):
-        mensaje = input("Ingrese el mensaje a cifrar en mayusculas y sin espacios: ")
-    mensaje_cifrado = cifrar_cesar(mensaje, clave)
-    print("Mensaje cifrado:", mensaje_cifrado)
+    if x==1:
+        while any(not c.isupper() for c in mensaje):
+            mensaje = input("Ingrese el mensaje a cifrar en mayusculas y sin espacios: ")
+        mensaje_cifrado = cifrar_cesar(mensaje, clave)
+        print("Mensaje cifrado:", mensaje_cifrado)
 
-elif x==2:
-    while any(not c.isupper() and c!=" " for c in mensaje):
-        mensaje = input("Ingrese el mensaje a descifrar en mayusculas (puede incluir espacios): ")
-    mensaje_descifrado = descifrar_cesar(mensaje, clave)
-    print("Mensaje descifrado:", mensaje_descifrado)
+    elif x==2:
+        while any(not c.isupper() and c!=" " for c in mensaje):
+            mensaje = input("Ingrese el mensaje a descifrar en mayusculas (puede incluir espacios): ")
+        mensaje_descifrado = descifrar_cesar(mensaje, clave)
+        print("Mensaje descifrado:", mensaje_descifrado)
 
-y= input("Presione cualquier tecla para salir...")
+    y= input("Presione cualquier tecla para salir...")
 
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Criptoanalisis_Caesar.py
+
+Recuperación automática de la clave de mensajes cifrados con cifrar_cesar.
+
+Un histograma de 26 letras por mensaje basta para puntuar los 26
+desplazamientos: si obs[j] es la cantidad de la letra j en el criptograma, con
+la clave k el texto plano tendría obs[j] veces la letra (j - k) % 26. Con la
+matriz M[j, k] = log E[(j - k) % 26] (E = frecuencias del idioma), la
+log-verosimilitud de todos los desplazamientos de todos los mensajes es un
+único producto de matrices `obs @ M` (N x 26). El chi-cuadrado también se
+reduce a un producto de matrices (ver `puntuar`).
+
+Las confianzas son el softmax de las puntuaciones sobre las 26 claves.
+
+Uso:
+    python Criptoanalisis_Caesar.py "WKLV LV D WHAW"
+    python Criptoanalisis_Caesar.py --archivo interceptados.txt --salida claves.tsv
+"""
+
+import argparse
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Falta la librería 'numpy'. Instálela con: pip install numpy")
+    raise
+
+# Frecuencias relativas (%) de la A a la Z
+FRECUENCIAS = {
+    'en': [8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+           6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074],
+    'es': [11.525, 2.215, 4.019, 5.010, 12.181, 0.692, 1.768, 0.703, 6.247, 0.493, 0.011, 4.967, 3.157,
+           6.712, 8.683, 2.510, 0.877, 6.871, 7.977, 4.632, 2.927, 1.138, 0.017, 0.215, 1.008, 0.467],
+}
+
+# Bytes leídos por lote en el modo archivo (se corta en el último salto de línea)
+TAMAÑO_LOTE = 8 << 20
+
+
+def _matriz_desplazamientos(valores):
+    """Matriz M[j, k] = valores[(j - k) % 26]."""
+    j = np.arange(26)[:, None]
+    k = np.arange(26)[None, :]
+    return np.asarray(valores, dtype=np.float64)[(j - k) % 26]
+
+
+def _frecuencias(idioma):
+    if idioma not in FRECUENCIAS:
+        raise ValueError(f"Idioma no soportado: {idioma} (opciones: {', '.join(FRECUENCIAS)})")
+    freq = np.asarray(FRECUENCIAS[idioma], dtype=np.float64)
+    return freq / freq.sum()
+
+
+def _buffer_a_letras(buf):
+    """Pasa un buffer uint8 a índices 0..25 (mayúsculas y minúsculas ASCII) y su máscara."""
+    mayus = buf & 0xDF
+    mascara = (mayus >= ord('A')) & (mayus <= ord('Z'))
+    return mayus.astype(np.int64) - ord('A'), mascara
+
+
+def _ids_de_linea(buf):
+    """Número de línea de cada byte y cantidad de líneas del buffer."""
+    saltos = buf == ord('\n')
+    ids = np.cumsum(saltos) - saltos
+    lineas = int(saltos.sum())
+    if len(buf) and buf[-1] != ord('\n'):
+        lineas += 1
+    return ids, lineas
+
+
+def _histogramas_buffer(buf):
+    ids, lineas = _ids_de_linea(buf)
+    letras, mascara = _buffer_a_letras(buf)
+    hist = np.bincount(ids[mascara] * 26 + letras[mascara], minlength=lineas * 26)
+    return hist.reshape(lineas, 26), ids, letras, mascara
+
+
+def histogramas(mensajes):
+    """Histograma de letras (N x 26) de una lista de mensajes (str o bytes)."""
+    if not mensajes:
+        return np.zeros((0, 26), dtype=np.int64)
+    if any(b'\n' in m if isinstance(m, bytes) else '\n' in m for m in mensajes):
+        raise ValueError("Los mensajes no pueden contener saltos de línea")
+    datos = b'\n'.join(m.encode('latin-1', 'replace') if isinstance(m, str) else m for m in mensajes)
+    hist = _histogramas_buffer(np.frombuffer(datos, dtype=np.uint8))[0]
+    # Un último mensaje vacío no genera línea propia en el buffer
+    if len(hist) < len(mensajes):
+        hist = np.vstack([hist, np.zeros((len(mensajes) - len(hist), 26), dtype=hist.dtype)])
+    return hist
+
+
+def puntuar(hist, metodo='loglik', idioma='en'):
+    """Puntuación (N x 26) de cada clave para cada histograma; mayor es mejor.
+
+    - 'loglik': log-verosimilitud, obs @ M con M[j, k] = log E[(j - k) % 26].
+    - 'chi2':   -chi2 / 2. Como chi2 = sum_j obs_j^2 / (n E) - n, basta con
+      (obs^2 @ W) / n con W[j, k] = 1 / E[(j - k) % 26].
+    """
+    freq = _frecuencias(idioma)
+    obs = np.asarray(hist, dtype=np.float64)
+    if metodo == 'loglik':
+        return obs @ _matriz_desplazamientos(np.log(freq))
+    if metodo == 'chi2':
+        n = obs.sum(axis=1, keepdims=True)
+        chi2 = (obs * obs) @ _matriz_desplazamientos(1.0 / freq) / np.maximum(n, 1) - n
+        return -chi2 / 2
+    raise ValueError(f"Método desconocido: {metodo} (opciones: loglik, chi2)")
+
+
+def mejores_claves(puntuaciones, top_k=3):
+    """Devuelve (claves, confianzas), ambas N x top_k, ordenadas de mejor a peor."""
+    top_k = max(1, min(top_k, 26))
+    if top_k == 1:
+        claves = puntuaciones.argmax(axis=1)[:, None]
+    else:
+        claves = np.argsort(-puntuaciones, axis=1, kind='stable')[:, :top_k]
+    exp = np.exp(puntuaciones - puntuaciones.max(axis=1, keepdims=True))
+    confianzas = exp / exp.sum(axis=1, keepdims=True)
+    return claves, np.take_along_axis(confianzas, claves, axis=1)
+
+
+def romper_caesar(mensajes, top_k=3, metodo='loglik', idioma='en'):
+    """Para cada mensaje devuelve una lista [(clave, confianza), ...] de tamaño top_k.
+
+    La clave es la que se pasaría a descifrar_cesar.
+    """
+    claves, confianzas = mejores_claves(puntuar(histogramas(mensajes), metodo, idioma), top_k)
+    return [list(zip(fila_c.tolist(), fila_p.tolist())) for fila_c, fila_p in zip(claves, confianzas)]
+
+
+def descifrar(mensaje, clave):
+    """Descifra un mensaje con la normalización del criptoanálisis.
+
+    Como en la puntuación, las minúsculas cuentan como mayúsculas; después se
+    aplica descifrar_cesar (se quitan los espacios y el resto de los
+    caracteres se mantiene). El modo archivo produce el mismo texto.
+    """
+    from Cifrado_Caesar import descifrar_cesar
+    return descifrar_cesar(mensaje.upper(), clave)
+
+
+def _descifrar_buffer(buf, letras, mascara, ids, claves):
+    """Descifra cada línea del buffer con su clave, igual que `descifrar`.
+
+    Las letras ASCII (mayúsculas o minúsculas) salen en mayúsculas, se quitan
+    los espacios y el resto de los caracteres se mantiene.
+    """
+    salida = buf.copy()
+    desplazamiento = claves[ids[mascara]]
+    salida[mascara] = (letras[mascara] - desplazamiento) % 26 + ord('A')
+    return salida.tobytes().replace(b' ', b'')
+
+
+def romper_archivo(origen, destino, top_k=1, metodo='loglik', idioma='en', tamaño_lote=TAMAÑO_LOTE):
+    """Rompe un archivo con un mensaje por línea.
+
+    Escribe una línea por mensaje: claves y confianzas (top_k pares separados
+    por tabuladores) seguidas del mensaje descifrado con la mejor clave, con
+    la misma normalización que `descifrar`. Devuelve la cantidad de mensajes
+    procesados.
+    """
+    total = 0
+    resto = b''
+    with open(origen, 'rb') as entrada, open(destino, 'wb') as salida:
+        while True:
+            bloque = entrada.read(tamaño_lote)
+            fin = not bloque
+            datos = resto + bloque
+            if not fin:
+                corte = datos.rfind(b'\n') + 1
+                datos, resto = datos[:corte], datos[corte:]
+            if datos:
+                buf = np.frombuffer(datos, dtype=np.uint8)
+                hist, ids, letras, mascara = _histogramas_buffer(buf)
+                claves, confianzas = mejores_claves(puntuar(hist, metodo, idioma), top_k)
+                texto = _descifrar_buffer(buf, letras, mascara, ids, claves[:, 0])
+                lineas = texto.replace(b'\r', b'').split(b'\n')[:len(hist)]
+                # Claves y confianzas intercaladas: clave1, conf1, clave2, conf2, ...
+                valores = np.empty((len(hist), 2 * claves.shape[1]))
+                valores[:, 0::2] = claves
+                valores[:, 1::2] = confianzas
+                formato = b'\t'.join([b'%d\t%.4f'] * claves.shape[1]) + b'\t%s\n'
+                salida.write(b''.join([formato % (*fila, linea) for fila, linea in zip(valores.tolist(), lineas)]))
+                total += len(hist)
+            if fin:
+                break
+    return total
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Recuperación de la clave de mensajes cifrados con César')
+    parser.add_argument('mensaje', nargs='?', help='Mensaje cifrado (si no se usa --archivo)')
+    parser.add_argument('--archivo', help='Archivo con un mensaje cifrado por línea')
+    parser.add_argument('--salida', help='Archivo de resultados para --archivo (por defecto, <archivo>.claves.tsv)')
+    parser.add_argument('--top', type=int, default=3, help='Cantidad de claves candidatas. Default=3')
+    parser.add_argument('--metodo', choices=['loglik', 'chi2'], default='loglik', help='Puntuación. Default=loglik')
+    parser.add_argument('--idioma', choices=sorted(FRECUENCIAS), default='en', help='Frecuencias de referencia. Default=en')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.archivo:
+        destino = args.salida or args.archivo + '.claves.tsv'
+        inicio = time.perf_counter()
+        total = romper_archivo(args.archivo, destino, args.top, args.metodo, args.idioma)
+        duracion = time.perf_counter() - inicio
+        print(f"{total} mensajes en {duracion:.2f} s ({total / max(duracion, 1e-9):,.0f} mensajes/s)")
+        print(f"Resultados guardados en: {destino}")
+        return
+    if args.mensaje is None:
+        args.mensaje = input("Ingrese el mensaje cifrado: ")
+
+    for clave, confianza in romper_caesar([args.mensaje], args.top, args.metodo, args.idioma)[0]:
+        print(f"Clave {clave:2d} ({confianza:6.1%}): {descifrar(args.mensaje, clave)}")
+
+
+if __name__ == "__main__":
+    main()
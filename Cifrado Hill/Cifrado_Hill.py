@@ -1,88 +1,207 @@
-print("Cifrado de Hill\nEscriba 1 para cifrar o 2 para decifrar: ")
+import functools
+import math
+
+MODULO = 26
+
+
+def matriz_cuadrada(matriz):
+    """Normaliza la clave a una tupla de filas n x n.
+
+    Acepta la lista plana [a, b, c, d, ...] (por filas) que usa el programa o
+    una lista de filas. La tupla resultante sirve como clave de caché.
+    """
+    if matriz and isinstance(matriz[0], (list, tuple)):
+        filas = tuple(tuple(int(x) for x in fila) for fila in matriz)
+    else:
+        n = math.isqrt(len(matriz))
+        if n * n != len(matriz) or n == 0:
+            raise ValueError("La clave debe tener n*n elementos")
+        filas = tuple(tuple(int(x) for x in matriz[i * n:(i + 1) * n]) for i in range(n))
+    if any(len(fila) != len(filas) for fila in filas):
+        raise ValueError("La clave debe ser una matriz cuadrada")
+    return filas
+
+
+def determinante(filas):
+    """Determinante entero exacto (algoritmo de Bareiss, sin fracciones)."""
+    m = [list(fila) for fila in filas]
+    n = len(m)
+    signo = 1
+    anterior = 1
+    for k in range(n - 1):
+        if m[k][k] == 0:
+            for i in range(k + 1, n):
+                if m[i][k] != 0:
+                    m[k], m[i] = m[i], m[k]
+                    signo = -signo
+                    break
+            else:
+                return 0
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                m[i][j] = (m[i][j] * m[k][k] - m[i][k] * m[k][j]) // anterior
+        anterior = m[k][k]
+    return signo * m[n - 1][n - 1] if n else 1
+
+
+def inverso_modular(a, modulo=MODULO):
+    """Inverso de `a` módulo `modulo` con el algoritmo extendido de Euclides (None si no existe)."""
+    r0, r1 = a % modulo, modulo
+    s0, s1 = 1, 0
+    while r1:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    return s0 % modulo if r0 == 1 else None
+
+
+@functools.lru_cache(maxsize=None)
+def inversa_modular(filas, modulo=MODULO):
+    """Inversa de la matriz módulo `modulo` como tupla de filas, o None si no es invertible.
+
+    inversa = det^-1 * adj(K) (mod 26), con la adjunta calculada por cofactores.
+    """
+    n = len(filas)
+    inv_det = inverso_modular(determinante(filas), modulo)
+    if inv_det is None:
+        return None
+    if n == 1:
+        return ((inv_det,),)
+    # adj[j][i] = cofactor C[i][j]
+    adjunta = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            menor = tuple(fila[:j] + fila[j + 1:] for k, fila in enumerate(filas) if k != i)
+            adjunta[j][i] = (-1) ** (i + j) * determinante(menor)
+    return tuple(tuple(x * inv_det % modulo for x in fila) for fila in adjunta)
+
 
 def calculo_inversa(matriz):
-    det = (matriz[0]*matriz[3]) - (matriz[1]*matriz[2])
-    if det == 0:
+    """Inversa modular de la clave en el mismo formato plano [a, b, c, d, ...], o None"""
+    inversa = inversa_modular(matriz_cuadrada(matriz))
+    if inversa is None:
         return None
-    inv_det = 1/(det % 26)
-    return [matriz[3] * inv_det % 26, -matriz[1] * inv_det % 26,
-            -matriz[2] * inv_det % 26, matriz[0] * inv_det % 26]
-
-mode = "0"
-matriz = ["a","b","c","d"]
-boolean = False
-inversa = []
-texto = ""
-texto_cifrado = ""
-
-
-while mode not in ("1","2"):
-    mode = input(">> ")
-    if mode not in ("1","2"):
-        print("Entrada invalida, intente de nuevo")
-
-while boolean == False:
-    boolean = True
-    print("Ejemplo de clave (Matriz 2x2):\n|a b|\n|c d|\n" \
-    "Porfavor ingrese los los elementos de la clave en orden: a,b,c,d")
-    for i in matriz:
-        temp = input(">> ")
-        if temp.isdigit() == False:
-            boolean = False
-            print("Entrada invalida, intente de nuevo")
-            break
-        else:
-            matriz[matriz.index(i)] = int(temp)
-    if boolean == True:
-        inversa = calculo_inversa(matriz)
-        if inversa == None:
-            print("La matriz no es invertible, intente con otra clave")
-            boolean = False
-
-if mode == "1":
-    while not texto.upper():
-        print("Ingrese el texto a cifrar en mayusculas (sin espacios ni caracteres especiales): ")
-        texto = input(">> ")
-        if not texto.upper():
+    return [x for fila in inversa for x in fila]
+
+
+def transformar_hill(texto, matriz):
+    """Multiplica cada bloque de n letras (vector fila) por la matriz, módulo 26.
+
+    Completa con 'X' hasta un múltiplo de n. Con NumPy el texto se convierte a
+    una matriz (bloques, n) y se transforma con un único producto matricial;
+    sin NumPy se usa un bucle equivalente.
+    """
+    filas = matriz_cuadrada(matriz)
+    n = len(filas)
+    if len(texto) % n:
+        texto += "X" * (n - len(texto) % n)
+    if not texto:
+        return texto
+    try:
+        import numpy as np
+    except ImportError:
+        return _transformar_hill_python(texto, filas)
+
+    if texto.isascii():
+        codigos = np.frombuffer(texto.encode('ascii'), dtype=np.uint8)
+    else:
+        codigos = np.frombuffer(texto.encode('utf-32-le'), dtype=np.uint32)
+    bloques = codigos.reshape(-1, n).astype(np.int64) - 65
+    bloques %= MODULO
+    clave = np.array(filas, dtype=np.int64) % MODULO
+    resultado = (bloques @ clave) % MODULO
+    return (resultado.astype(np.uint8) + 65).tobytes().decode('ascii')
+
+
+def _transformar_hill_python(texto, filas):
+    n = len(filas)
+    salida = []
+    for i in range(0, len(texto), n):
+        bloque = [ord(ch) - 65 for ch in texto[i:i + n]]
+        for j in range(n):
+            salida.append(chr(sum(bloque[k] * filas[k][j] for k in range(n)) % MODULO + 65))
+    return ''.join(salida)
+
+
+def cifrar_hill(texto, matriz):
+    """Cifra `texto` (mayusculas A-Z) por bloques de n letras con la clave n x n [a,b,c,d,...]"""
+    return transformar_hill(texto, matriz)
+
+def descifrar_hill(texto, inversa):
+    """Descifra `texto` por bloques de n letras con la matriz inversa [a,b,c,d,...]"""
+    return transformar_hill(texto, inversa)
+
+def main():
+    print("Cifrado de Hill\nEscriba 1 para cifrar o 2 para decifrar: ")
+
+    mode = "0"
+    n = 0
+    boolean = False
+    inversa = []
+    texto = ""
+    texto_cifrado = ""
+
+
+    while mode not in ("1","2"):
+        mode = input(">> ")
+        if mode not in ("1","2"):
             print("Entrada invalida, intente de nuevo")
-            continue
+
+    while n <= 0:
+        print("Ingrese el tamaño n de la clave (Matriz n x n, Enter = 2): ")
+        temp = input(">> ")
+        if temp == "":
+            n = 2
+        elif temp.isdigit() and int(temp) > 0:
+            n = int(temp)
         else:
-            if len(texto) % 2 != 0:
-                texto += "X"
-            for i in range(0, len(texto), 2):
-                a = ord(texto[i]) - 65
-                b = ord(texto[i + 1]) - 65
-                c = (matriz[0] * a + matriz[2] * b) % 26
-                d = (matriz[1] * a + matriz[3] * b) % 26
-                texto_cifrado += chr(c + 65) + chr(d + 65)
-            print("Texto cifrado:", texto_cifrado)
-
-if mode == "2":
-    while not texto.upper():
-        print("Ingrese el texto a decifrar en mayusculas (sin espacios ni caracteres especiales): ")
-        texto = input(">> ")
-        if not texto.upper():
             print("Entrada invalida, intente de nuevo")
-            continue
-        else:
-            if len(texto) % 2 != 0:
-                texto += "X"
-            for i in range(0, len(texto), 2):
-                a = ord(texto[i]) - 65
-                b = ord(texto[i + 1]) - 65
-                c = (inversa[0] * a + inversa[2] * b) % 26
-                d = (inversa[1] * a + inversa[3] * b) % 26
-                texto_cifrado += chr(int(c) + 65) + chr(int(d) + 65)
-            print("Texto decifrado:", texto_cifrado)
-
-end=input("Presione una tecla para salir")
-
-
-
-
-
-
-
-    
-    
 
+    while boolean == False:
+        boolean = True
+        matriz = []
+        if n == 2:
+            print("Ejemplo de clave (Matriz 2x2):\n|a b|\n|c d|\n" \
+            "Porfavor ingrese los los elementos de la clave en orden: a,b,c,d")
+        else:
+            print(f"Porfavor ingrese los {n*n} elementos de la clave fila por fila")
+        for i in range(n * n):
+            temp = input(">> ")
+            if temp.isdigit() == False:
+                boolean = False
+                print("Entrada invalida, intente de nuevo")
+                break
+            else:
+                matriz.append(int(temp))
+        if boolean == True:
+            inversa = calculo_inversa(matriz)
+            if inversa == None:
+                print("La matriz no es invertible, intente con otra clave")
+                boolean = False
+
+    if mode == "1":
+        while not texto.upper():
+            print("Ingrese el texto a cifrar en mayusculas (sin espacios ni caracteres especiales): ")
+            texto = input(">> ")
+            if not texto.upper():
+                print("Entrada invalida, intente de nuevo")
+                continue
+            else:
+                texto_cifrado = cifrar_hill(texto, matriz)
+                print("Texto cifrado:", texto_cifrado)
+
+    if mode == "2":
+        while not texto.upper():
+            print("Ingrese el texto a decifrar en mayusculas (sin espacios ni caracteres especiales): ")
+            texto = input(">> ")
+            if not texto.upper():
+                print("Entrada invalida, intente de nuevo")
+                continue
+            else:
+                texto_cifrado = descifrar_hill(texto, inversa)
+                print("Texto decifrado:", texto_cifrado)
+
+    end=input("Presione una tecla para salir")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Criptoanalisis_Hill.py
+
+Recuperación de la clave del cifrado de Hill (convención de Cifrado_Hill:
+cada bloque es un vector fila y C = P @ K mod 26).
+
+- Texto claro conocido: se toman los primeros n bloques cuya matriz P_n sea
+  invertible módulo 26 y se despeja K = P_n^-1 @ C_n; la clave se verifica
+  con el resto de los bloques. Con textos consistentes ese primer K es la
+  única clave posible, así que si falla no se prueban otros subconjuntos.
+- Sólo texto cifrado, 2x2: se enumeran las 157.248 matrices invertibles
+  módulo 26 como matrices de descifrado D (P = C @ D) y se puntúan por lotes:
+  un producto (lote, bloques, 2) de miles de claves a la vez y la suma de
+  log-probabilidades de bigramas del texto resultante.
+- Sólo texto cifrado, n x n (por ejemplo 3x3): cada columna de D produce por
+  sí sola una letra de cada bloque, así que las 26^n columnas posibles se
+  puntúan por frecuencia de letras y sólo se combinan las mejores.
+
+Las estadísticas de bigramas se calculan sobre Corpus/ingles.txt.
+
+Uso:
+    python Criptoanalisis_Hill.py conocido --claro HELPMEPLEASE --cifrado <texto cifrado> --n 2
+    python Criptoanalisis_Hill.py cifrado <texto cifrado> --n 2 --top 3
+"""
+
+import argparse
+import functools
+import itertools
+import math
+import os
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("Falta la librería 'numpy'. Instálela con: pip install numpy")
+    raise
+
+from Cifrado_Hill import MODULO, calculo_inversa, descifrar_hill, determinante, inversa_modular
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Corpus', 'ingles.txt')
+
+# Claves puntuadas por lote en la búsqueda exhaustiva 2x2
+TAMAÑO_LOTE = 4096
+# Subconjuntos de n bloques probados como máximo al buscar una P_n invertible
+MAX_SUBCONJUNTOS = 100000
+
+
+def letras(texto):
+    """Índices 0..25 de las letras A-Z del texto (se ignora el resto)."""
+    datos = np.frombuffer(texto.upper().encode('ascii', 'ignore'), dtype=np.uint8)
+    return (datos[(datos >= 65) & (datos <= 90)] - 65).astype(np.int64)
+
+
+def a_bloques(texto, n):
+    """Matriz (bloques, n) de índices; se descartan las letras que no completan un bloque."""
+    indices = letras(texto)
+    return indices[:len(indices) - len(indices) % n].reshape(-1, n)
+
+
+@functools.lru_cache(maxsize=None)
+def estadisticas(corpus=CORPUS):
+    """Log-probabilidades de letras (26) y bigramas (26 x 26) del corpus, con suavizado +1."""
+    with open(corpus, encoding='utf-8') as f:
+        indices = letras(f.read())
+    unigramas = np.bincount(indices, minlength=26) + 1.0
+    bigramas = np.bincount(indices[:-1] * 26 + indices[1:], minlength=26 * 26).reshape(26, 26) + 1.0
+    return np.log(unigramas / unigramas.sum()), np.log(bigramas / bigramas.sum())
+
+
+def recuperar_clave_conocida(claro, cifrado, n=2, max_subconjuntos=MAX_SUBCONJUNTOS):
+    """Clave n x n (lista plana) a partir de texto claro y cifrado alineados, o None.
+
+    Despeja la clave con el primer subconjunto de n bloques cuya matriz sea
+    invertible módulo 26 (se prueban a lo sumo `max_subconjuntos`) y la
+    verifica con todos los bloques conocidos. Devuelve None si no hay
+    subconjunto invertible; lanza ValueError si la clave no reproduce el
+    cifrado, porque entonces ninguna otra clave puede hacerlo.
+    """
+    P = a_bloques(claro, n)
+    C = a_bloques(cifrado, n)
+    total = min(len(P), len(C))
+    P, C = P[:total], C[:total]
+    # Sin caché: cada subconjunto probado es distinto
+    inversa = inversa_modular.__wrapped__
+    subconjuntos = itertools.islice(itertools.combinations(range(total), n), max_subconjuntos)
+    for subconjunto in subconjuntos:
+        inv = inversa(tuple(tuple(int(x) for x in P[i]) for i in subconjunto))
+        if inv is None:
+            continue
+        K = (np.array(inv, dtype=np.int64) @ C[list(subconjunto)]) % MODULO
+        if not np.array_equal((P @ K) % MODULO, C):
+            raise ValueError(f"El texto claro y el cifrado no corresponden a una clave de Hill {n}x{n}")
+        return K.ravel().tolist()
+    return None
+
+
+def matrices_invertibles_2x2():
+    """Todas las matrices 2x2 invertibles módulo 26, como array (k, 2, 2)."""
+    a, b, c, d = (x.ravel() for x in np.indices((26, 26, 26, 26)))
+    det = (a * d - b * c) % MODULO
+    validas = (det % 2 == 1) & (det % 13 != 0)
+    return np.stack([a[validas], b[validas], c[validas], d[validas]], axis=1).reshape(-1, 2, 2)
+
+
+def puntuar_claves(C, descifrado, log_bigramas):
+    """Log-probabilidad de bigramas del texto descifrado con cada matriz D del lote.
+
+    C: (bloques, n); descifrado: (lote, n, n). Devuelve un array (lote,).
+    """
+    claro = np.matmul(C[None, :, :], descifrado) % MODULO
+    claro = claro.reshape(len(descifrado), -1)
+    return log_bigramas[claro[:, :-1], claro[:, 1:]].sum(axis=1)
+
+
+def _clave_de(descifrado):
+    """Clave de cifrado (lista plana) correspondiente a la matriz de descifrado D."""
+    inversa = inversa_modular(tuple(tuple(int(x) for x in fila) for fila in descifrado))
+    return [x for fila in inversa for x in fila]
+
+
+def _ranking(C, candidatas, puntuaciones, top):
+    mejores = np.argsort(-puntuaciones, kind='stable')[:top]
+    longitud = C.size
+    return [(_clave_de(candidatas[i]), float(puntuaciones[i]) / max(longitud - 1, 1)) for i in mejores]
+
+
+def romper_2x2(cifrado, top=5, tamaño_lote=TAMAÑO_LOTE, corpus=CORPUS):
+    """Búsqueda exhaustiva sobre todas las claves 2x2 invertibles.
+
+    Devuelve hasta `top` tuplas (clave plana, log-probabilidad media por bigrama).
+    """
+    C = a_bloques(cifrado, 2)
+    if len(C) < 2:
+        raise ValueError("El texto cifrado es demasiado corto")
+    log_bigramas = estadisticas(corpus)[1]
+    candidatas = matrices_invertibles_2x2()
+    puntuaciones = np.empty(len(candidatas))
+    for inicio in range(0, len(candidatas), tamaño_lote):
+        lote = candidatas[inicio:inicio + tamaño_lote]
+        puntuaciones[inicio:inicio + len(lote)] = puntuar_claves(C, lote, log_bigramas)
+    return _ranking(C, candidatas, puntuaciones, top)
+
+
+def romper_por_columnas(cifrado, n=3, top=5, columnas=16, corpus=CORPUS):
+    """Búsqueda para claves n x n separando las columnas de la matriz de descifrado.
+
+    La columna j de D sólo determina la letra j de cada bloque: las 26^n
+    columnas se puntúan por frecuencia de letras y se prueban todas las
+    combinaciones ordenadas de las `columnas` mejores que den una D
+    invertible, puntuadas por bigramas. Devuelve hasta `top` tuplas
+    (clave plana, log-probabilidad media por bigrama).
+    """
+    C = a_bloques(cifrado, n)
+    if len(C) < n:
+        raise ValueError("El texto cifrado es demasiado corto")
+    log_unigramas, log_bigramas = estadisticas(corpus)
+    todas = np.indices((26,) * n).reshape(n, -1)  # (n, 26^n)
+    puntuacion_columna = np.zeros(todas.shape[1])
+    for inicio in range(0, todas.shape[1], TAMAÑO_LOTE):
+        bloque = todas[:, inicio:inicio + TAMAÑO_LOTE]
+        puntuacion_columna[inicio:inicio + bloque.shape[1]] = log_unigramas[(C @ bloque) % MODULO].sum(axis=0)
+    # Una columna con todos sus elementos pares (o múltiplos de 13) nunca forma
+    # parte de una D invertible; además produce pocas letras distintas que
+    # puntúan engañosamente bien
+    degeneradas = ((todas % 2 == 0).all(axis=0)) | ((todas % 13 == 0).all(axis=0))
+    puntuacion_columna[degeneradas] = -np.inf
+    elegidas = todas[:, np.argsort(-puntuacion_columna)[:columnas]].T  # (columnas, n)
+
+    candidatas = np.array([np.stack([elegidas[i] for i in orden], axis=1)
+                           for orden in itertools.permutations(range(len(elegidas)), n)])
+    det_validos = [math.gcd(determinante(m.tolist()), MODULO) == 1 for m in candidatas]
+    candidatas = candidatas[np.array(det_validos, dtype=bool)]
+    if not len(candidatas):
+        return []
+    puntuaciones = np.concatenate([puntuar_claves(C, candidatas[i:i + TAMAÑO_LOTE], log_bigramas)
+                                   for i in range(0, len(candidatas), TAMAÑO_LOTE)])
+    return _ranking(C, candidatas, puntuaciones, top)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Criptoanálisis del cifrado de Hill')
+    modos = parser.add_subparsers(dest='modo', required=True)
+    conocido = modos.add_parser('conocido', help='Recuperar la clave con texto claro conocido')
+    conocido.add_argument('--claro', required=True, help='Texto claro conocido')
+    conocido.add_argument('--cifrado', required=True, help='Texto cifrado correspondiente')
+    conocido.add_argument('--n', type=int, default=2, help='Tamaño de la clave. Default=2')
+    cifrado = modos.add_parser('cifrado', help='Buscar la clave sólo con texto cifrado')
+    cifrado.add_argument('texto', help='Texto cifrado')
+    cifrado.add_argument('--n', type=int, default=2, help='Tamaño de la clave (2: búsqueda exhaustiva). Default=2')
+    cifrado.add_argument('--top', type=int, default=5, help='Cantidad de claves a mostrar. Default=5')
+    cifrado.add_argument('--columnas', type=int, default=16, help='Columnas candidatas para n > 2. Default=16')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.modo == 'conocido':
+        try:
+            clave = recuperar_clave_conocida(args.claro, args.cifrado, args.n)
+        except ValueError as e:
+            print("Error:", e)
+            raise SystemExit(1)
+        if clave is None:
+            print("No se encontraron bloques suficientes para recuperar la clave")
+        else:
+            print("Clave:", clave)
+        return
+
+    inicio = time.perf_counter()
+    if args.n == 2:
+        ranking = romper_2x2(args.texto, args.top)
+    else:
+        ranking = romper_por_columnas(args.texto, args.n, args.top, args.columnas)
+    duracion = time.perf_counter() - inicio
+    texto = ''.join(chr(65 + i) for i in letras(args.texto))
+    for clave, puntuacion in ranking:
+        claro = descifrar_hill(texto, calculo_inversa(clave))
+        print(f"{str(clave):<40} {puntuacion:8.4f}  {claro[:50]}")
+    print(f"Tiempo: {duracion:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,39 @@
+import argparse
 import random
+from collections import Counter
+
+from Layout_Homofonico import ALFABETOS, layout_desde_corpus, normalizar
+
+
+def _cargar_numpy():
+    """Importa NumPy bajo demanda. Devuelve el módulo o None si no está instalado."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _resumen_advertencia(ignorados, descripcion):
+    """Imprime una única advertencia con los elementos ignorados y cuántas veces aparecen."""
+    if not ignorados:
+        return
+    detalle = ', '.join(f"'{x}' (x{n})" if n > 1 else f"'{x}'" for x, n in sorted(ignorados.items(), key=str))
+    print(f"Advertencia: se ignoraron {sum(ignorados.values())} {descripcion}: {detalle}")
+
 
 class CifradoHomofonico:
-    def __init__(self):
+    def __init__(self, semilla=None, layout=None, reverso=None):
+        """`semilla` inicializa el generador aleatorio (NumPy) para obtener cifrados reproducibles.
+
+        `layout` ({letra: [símbolos]}) reemplaza al layout fijo en inglés; ver
+        `desde_corpus` para generarlo a partir de las frecuencias de un corpus.
+        `reverso` (símbolo -> índice de la letra en el orden de `layout`, como
+        lo guarda Layout_Homofonico) evita reconstruir el mapa inverso.
+        """
         # Layout fijo de símbolos (0-99) asignados a cada letra del alfabeto inglés
         # Cada letra tiene diferentes cantidades de símbolos basados en su frecuencia típica
-        self.layout = {
+        self.layout = layout if layout is not None else {
             'A': [0, 1, 2, 3, 4, 5, 6, 7],           # 8 símbolos (frecuencia alta)
             'B': [8, 9],                              # 2 símbolos (frecuencia baja)
             'C': [10, 11, 12],                        # 3 símbolos (frecuencia media-alta)
@@ -34,43 +63,129 @@ class CifradoHomofonico:
         }
         
         # Crear el diccionario inverso para descifrado
-        self.reverse_layout = {}
-        for letra, simbolos in self.layout.items():
-            for simbolo in simbolos:
-                self.reverse_layout[simbolo] = letra
-    
+        self.reverso = reverso
+        if reverso is not None:
+            self.reverse_layout = dict(enumerate(map(list(self.layout).__getitem__, reverso)))
+        else:
+            self.reverse_layout = {}
+            for letra, simbolos in self.layout.items():
+                for simbolo in simbolos:
+                    self.reverse_layout[simbolo] = letra
+        self.m = max(self.reverse_layout) + 1
+
+        self.np = _cargar_numpy()
+        if self.np is not None:
+            self.rng = self.np.random.default_rng(semilla)
+            self._preparar_tablas()
+        else:
+            self.rng = random.Random(semilla)
+
+    @classmethod
+    def desde_corpus(cls, ruta, m=100, alfabeto=ALFABETOS['en'], semilla=None):
+        """Cifrador con `m` símbolos repartidos según las frecuencias de letras del corpus (con caché)"""
+        datos = layout_desde_corpus(ruta, m, alfabeto)
+        return cls(semilla, datos['layout'], datos['reverso'])
+
+    def _preparar_tablas(self):
+        """Aplana el layout en arrays para el cifrado vectorizado.
+
+        - letra_de_codigo[c]: índice de la letra con código c, o -1.
+        - inicio[l], cantidad[l]: tramo de la letra l dentro de `simbolos`.
+        - letra_de_simbolo[s]: código Unicode de la letra del símbolo s, o 0.
+        """
+        np = self.np
+        letras = sorted(self.layout)
+        maximo = self.m - 1
+        for tipo in (np.uint8, np.uint16, np.uint32):
+            if maximo <= np.iinfo(tipo).max:
+                self.tipo_simbolo = tipo
+                break
+        else:
+            raise ValueError(f"El layout usa símbolos hasta {maximo}; el máximo admitido es {np.iinfo(np.uint32).max}")
+        self.simbolos = np.array([s for letra in letras for s in self.layout[letra]], dtype=self.tipo_simbolo)
+        self.cantidad = np.array([len(self.layout[letra]) for letra in letras], dtype=np.int64)
+        self.inicio = np.concatenate(([0], np.cumsum(self.cantidad)[:-1]))
+        self.letra_de_codigo = np.full(max(128, max(map(ord, letras)) + 1), -1, dtype=np.int64)
+        for i, letra in enumerate(letras):
+            self.letra_de_codigo[ord(letra)] = i
+        if self.reverso is not None:
+            codigos = np.array([ord(letra) for letra in self.layout], dtype=np.uint32)
+            self.letra_de_simbolo = codigos[np.asarray(self.reverso, dtype=np.int64)]
+        else:
+            self.letra_de_simbolo = np.zeros(maximo + 1, dtype=np.uint32)
+            for simbolo, letra in self.reverse_layout.items():
+                self.letra_de_simbolo[simbolo] = ord(letra)
+
+    def cifrar_array(self, mensaje):
+        """
+        Cifra un mensaje y devuelve los símbolos como array NumPy compacto
+        (uint8, uint16 o uint32 según el símbolo más alto del layout).
+
+        Todas las letras se traducen de una vez y los homófonos se eligen con
+        una sola llamada al generador. Los caracteres fuera del alfabeto se
+        ignoran con una única advertencia resumida.
+        """
+        np = self.np
+        if np is None:
+            raise RuntimeError("Falta la librería 'numpy'. Instálela con: pip install numpy")
+        mensaje = normalizar(mensaje).replace(' ', '').replace('\n', '')
+        codigos = np.frombuffer(mensaje.encode('utf-32-le'), dtype=np.uint32)
+        limite = len(self.letra_de_codigo)
+        indices = np.where(codigos < limite, self.letra_de_codigo[np.minimum(codigos, limite - 1)], -1)
+        validos = indices >= 0
+        if not validos.all():
+            _resumen_advertencia(Counter(chr(c) for c in codigos[~validos].tolist()),
+                                 "caracteres fuera del alfabeto")
+            indices = indices[validos]
+        elegidos = self.inicio[indices] + self.rng.integers(0, self.cantidad[indices])
+        return self.simbolos[elegidos]
+
     def cifrar(self, mensaje):
         """
         Cifra un mensaje usando el algoritmo homofónico
         """
-        mensaje = mensaje.upper().replace(' ', '').replace('\n', '')
+        if self.np is not None:
+            return self.cifrar_array(mensaje).tolist()
+
+        mensaje = normalizar(mensaje).replace(' ', '').replace('\n', '')
         mensaje_cifrado = []
+        ignorados = Counter()
         
         for letra in mensaje:
             if letra in self.layout:
                 # Seleccionar aleatoriamente uno de los símbolos asignados a la letra
-                simbolos_disponibles = self.layout[letra]
-                simbolo_elegido = random.choice(simbolos_disponibles)
-                mensaje_cifrado.append(simbolo_elegido)
+                mensaje_cifrado.append(self.rng.choice(self.layout[letra]))
             else:
-                # Si no es una letra del alfabeto inglés, mantener el carácter
-                print(f"Advertencia: El carácter '{letra}' no está en el alfabeto inglés y será ignorado.")
+                ignorados[letra] += 1
         
+        _resumen_advertencia(ignorados, "caracteres fuera del alfabeto")
         return mensaje_cifrado
     
     def descifrar(self, mensaje_cifrado):
         """
-        Descifra un mensaje cifrado con el algoritmo homofónico
+        Descifra un mensaje cifrado con el algoritmo homofónico (lista o array de símbolos)
         """
+        if self.np is not None:
+            np = self.np
+            simbolos = np.asarray(mensaje_cifrado, dtype=np.int64).ravel()
+            en_rango = (simbolos >= 0) & (simbolos < len(self.letra_de_simbolo))
+            letras = np.zeros(len(simbolos), dtype=np.uint32)
+            letras[en_rango] = self.letra_de_simbolo[simbolos[en_rango]]
+            validos = letras != 0
+            if not validos.all():
+                _resumen_advertencia(Counter(simbolos[~validos].tolist()), "símbolos que no están en el layout")
+            return letras[validos].astype('<u4').tobytes().decode('utf-32-le')
+
         mensaje_descifrado = []
+        ignorados = Counter()
         
         for simbolo in mensaje_cifrado:
             if simbolo in self.reverse_layout:
-                letra = self.reverse_layout[simbolo]
-                mensaje_descifrado.append(letra)
+                mensaje_descifrado.append(self.reverse_layout[simbolo])
             else:
-                print(f"Advertencia: El símbolo '{simbolo}' no está en el layout de cifrado.")
+                ignorados[simbolo] += 1
         
+        _resumen_advertencia(ignorados, "símbolos que no están en el layout")
         return ''.join(mensaje_descifrado)
     
     def mostrar_layout(self):
@@ -98,12 +213,12 @@ class CifradoHomofonico:
         except ValueError:
             return None
 
-def mostrar_menu():
+def mostrar_menu(cipher):
     """
     Muestra el menú principal
     """
     print("\n" + "="*50)
-    print("    CIFRADO HOMOFÓNICO (m=100, n=26)")
+    print(f"    CIFRADO HOMOFÓNICO (m={cipher.m}, n={len(cipher.layout)})")
     print("="*50)
     print("1. Cifrar mensaje")
     print("2. Descifrar mensaje")
@@ -111,11 +226,22 @@ def mostrar_menu():
     print("4. Salir")
     print("-" * 50)
 
-def main():
-    cipher = CifradoHomofonico()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Cifrado homofónico')
+    parser.add_argument('--corpus', help='Generar el layout a partir de las frecuencias de este corpus')
+    parser.add_argument('--m', type=int, default=100, help='Cantidad de símbolos con --corpus. Default=100')
+    parser.add_argument('--alfabeto', choices=sorted(ALFABETOS), default='en', help='Alfabeto con --corpus. Default=en')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.corpus:
+        cipher = CifradoHomofonico.desde_corpus(args.corpus, args.m, ALFABETOS[args.alfabeto])
+    else:
+        cipher = CifradoHomofonico()
     
     while True:
-        mostrar_menu()
+        mostrar_menu(cipher)
         opcion = input("Selecciona una opción (1-4): ").strip()
         
         if opcion == '1':
@@ -147,10 +273,10 @@ def main():
                 print("Error: Formato inválido. Usa números separados por espacios o comas.")
                 continue
             
-            # Validar que todos los números estén en el rango válido (0-99)
-            numeros_invalidos = [num for num in mensaje_cifrado if num < 0 or num > 99]
+            # Validar que todos los números estén en el rango válido (0 a m-1)
+            numeros_invalidos = [num for num in mensaje_cifrado if num < 0 or num >= cipher.m]
             if numeros_invalidos:
-                print(f"Error: Los siguientes números están fuera del rango válido (0-99): {numeros_invalidos}")
+                print(f"Error: Los siguientes números están fuera del rango válido (0-{cipher.m - 1}): {numeros_invalidos}")
                 continue
             
             mensaje_descifrado = cipher.descifrar(mensaje_cifrado)
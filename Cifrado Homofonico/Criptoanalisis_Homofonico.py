@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Criptoanalisis_Homofonico.py
+
+Ataque sólo con texto cifrado al cifrado homofónico: busca la asignación de
+los símbolos (0..m-1) a las 26 letras que maximiza la log-probabilidad de
+trigramas del texto descifrado.
+
+- Búsqueda: recocido simulado por "baño térmico". En cada paso se toma un
+  símbolo y se puntúan a la vez las 26 letras posibles para él; la nueva
+  letra se sortea con probabilidad proporcional a exp(puntuación / T) y la
+  temperatura T baja linealmente hasta 0 (al final es un hill climbing).
+- Puntuación incremental: al reasignar un símbolo sólo cambian los trigramas
+  que lo contienen. Para cada símbolo se precalculan los inicios de esos
+  trigramas, así que un paso cuesta O(apariciones del símbolo), no O(texto).
+- Penalización por entropía: con 100 símbolos libres la búsqueda tiende a
+  asignar casi todo a E, T, H, A... porque esos trigramas puntúan bien. Se
+  suma `peso * N * H(letras)` (H: entropía de la distribución de letras del
+  texto descifrado, N: longitud), que también se actualiza en O(1) por letra.
+- Reinicios aleatorios en paralelo con un pool de procesos; se devuelve el
+  mejor resultado.
+
+Las estadísticas de trigramas se calculan sobre Corpus/ingles.txt. Con un
+corpus tan chico hacen falta unas 1000 letras de texto cifrado para
+recuperar el texto de forma confiable; con 500 el resultado es parcial.
+
+Uso:
+    python Criptoanalisis_Homofonico.py "17 34 52 8 21 ..." --reinicios 8
+"""
+
+import argparse
+import functools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    print("Falta la librería 'numpy'. Instálela con: pip install numpy")
+    raise
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Corpus', 'ingles.txt')
+
+# Peso del término de entropía de letras en la puntuación
+PESO_ENTROPIA = 1.0
+
+
+@functools.lru_cache(maxsize=None)
+def log_trigramas(corpus=CORPUS):
+    """Tabla (aplanada, 26^3) de log P(c | a, b) para cada trigrama abc.
+
+    El corpus es chico para estimar 17.576 trigramas, así que la probabilidad
+    condicional se interpola con la de bigramas y la de letras sueltas.
+    """
+    with open(corpus, encoding='utf-8') as f:
+        datos = np.frombuffer(f.read().upper().encode('ascii', 'ignore'), dtype=np.uint8)
+    letras = (datos[(datos >= 65) & (datos <= 90)] - 65).astype(np.int64)
+    uni = np.bincount(letras, minlength=26) + 1.0
+    bi = np.bincount(letras[:-1] * 26 + letras[1:], minlength=26 ** 2).reshape(26, 26)
+    tri = np.bincount(letras[:-2] * 676 + letras[1:-1] * 26 + letras[2:], minlength=26 ** 3).reshape(26, 26, 26)
+    p1 = uni / uni.sum()
+    p2 = (bi + p1[None]) / (bi.sum(axis=1, keepdims=True) + 1)
+    p3 = (tri + p2[None]) / (tri.sum(axis=2, keepdims=True) + 1)
+    return np.log(p3).ravel()
+
+
+def frecuencias_letras(corpus=CORPUS):
+    """Frecuencia relativa de cada letra en el corpus."""
+    with open(corpus, encoding='utf-8') as f:
+        datos = np.frombuffer(f.read().upper().encode('ascii', 'ignore'), dtype=np.uint8)
+    cuentas = np.bincount(datos[(datos >= 65) & (datos <= 90)] - 65, minlength=26) + 1.0
+    return cuentas / cuentas.sum()
+
+
+def _x_log_x(x):
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(x > 0, x * np.log(np.maximum(x, 1)), 0.0)
+
+
+class _Problema:
+    """Datos precalculados de un texto cifrado para la puntuación incremental."""
+
+    def __init__(self, cifrado, tabla, peso=PESO_ENTROPIA):
+        self.cifrado = np.asarray(cifrado, dtype=np.int64)
+        self.tabla = tabla
+        self.peso = peso
+        self.simbolos = np.unique(self.cifrado)
+        n = len(self.cifrado)
+        self.posiciones = {}
+        self.apariciones = {}
+        self.inicios = {}
+        self.mascaras = {}
+        desplazamientos = np.arange(3)
+        for s in self.simbolos.tolist():
+            posiciones = np.flatnonzero(self.cifrado == s)
+            self.posiciones[s] = posiciones
+            self.apariciones[s] = len(posiciones)
+            # Trigramas [i, i+1, i+2] que contienen alguna aparición del símbolo
+            inicios = np.unique((posiciones[:, None] - desplazamientos).ravel())
+            inicios = inicios[(inicios >= 0) & (inicios <= n - 3)]
+            ventanas = inicios[:, None] + desplazamientos
+            self.inicios[s] = ventanas
+            self.mascaras[s] = self.cifrado[ventanas] == s
+
+    def puntuacion(self, clave):
+        """Log-probabilidad de trigramas más el término de entropía."""
+        p = clave[self.cifrado]
+        trigramas = float(self.tabla[p[:-2] * 676 + p[1:-1] * 26 + p[2:]].sum())
+        cuentas = np.bincount(p, minlength=26)
+        # peso * N * H(letras) = peso * (N log N - sum(c log c))
+        return trigramas + self.peso * float(_x_log_x(len(p)) - _x_log_x(cuentas).sum())
+
+    def puntuar_letras(self, claro, cuentas, s):
+        """Puntuación de reasignar `s` a cada una de las 26 letras.
+
+        Incluye los trigramas que contienen `s` y la variación de
+        -peso * sum(c log c) sobre las cuentas de letras (N log N es constante).
+        """
+        ventanas = self.inicios[s]
+        trigramas = np.where(self.mascaras[s][None], np.arange(26)[:, None, None], claro[ventanas][None])
+        indices = trigramas[..., 0] * 676 + trigramas[..., 1] * 26 + trigramas[..., 2]
+        puntos = self.tabla[indices].sum(axis=1)
+        # Cuentas sin el símbolo: sólo cambia la letra que tiene ahora
+        k = self.apariciones[s]
+        base = cuentas.copy()
+        base[claro[self.posiciones[s][0]]] -= k
+        return puntos - self.peso * (_x_log_x(base + k) - _x_log_x(base))
+
+
+def resolver(cifrado, iteraciones=300, temperatura=10.0, semilla=None, objetivo=None, corpus=CORPUS,
+             peso=PESO_ENTROPIA):
+    """Un reinicio de recocido simulado.
+
+    `iteraciones` es la cantidad de barridos (cada barrido reasigna todos los
+    símbolos una vez). Si `objetivo` se indica, se detiene al alcanzar esa
+    puntuación media por trigrama. Devuelve un dict con la clave (array de
+    letras 0..25 indexado por símbolo), la puntuación (trigramas + entropía)
+    media por trigrama, los
+    pasos, los segundos y el momento (s) en que se alcanzó la mejor solución.
+    """
+    inicio = time.perf_counter()
+    problema = _Problema(cifrado, log_trigramas(corpus), peso)
+    rng = np.random.default_rng(semilla)
+    tamaño = int(problema.cifrado.max()) + 1
+    trigramas = max(len(problema.cifrado) - 2, 1)
+
+    clave = rng.choice(26, size=tamaño, p=frecuencias_letras(corpus))
+    claro = clave[problema.cifrado]
+    cuentas = np.bincount(claro, minlength=26)
+    actual = problema.puntuacion(clave)
+    mejor, mejor_clave, momento = actual, clave.copy(), 0.0
+    pasos = 0
+    for barrido in range(iteraciones):
+        t = temperatura * (1 - barrido / iteraciones)
+        for s in rng.permutation(problema.simbolos).tolist():
+            puntos = problema.puntuar_letras(claro, cuentas, s)
+            if t > 0:
+                pesos = np.exp((puntos - puntos.max()) / t)
+                letra = int(rng.choice(26, p=pesos / pesos.sum()))
+            else:
+                letra = int(puntos.argmax())
+            actual += puntos[letra] - puntos[clave[s]]
+            cuentas[clave[s]] -= problema.apariciones[s]
+            cuentas[letra] += problema.apariciones[s]
+            clave[s] = letra
+            claro[problema.posiciones[s]] = letra
+            pasos += 1
+        if actual > mejor:
+            mejor, mejor_clave, momento = actual, clave.copy(), time.perf_counter() - inicio
+        if objetivo is not None and mejor / trigramas >= objetivo:
+            break
+    return {
+        'clave': mejor_clave,
+        'puntuacion': problema.puntuacion(mejor_clave) / trigramas,
+        'pasos': pasos,
+        'segundos': time.perf_counter() - inicio,
+        'tiempo_solucion': momento,
+    }
+
+
+def _resolver_trabajo(args):
+    return resolver(*args)
+
+
+def romper_homofonico(cifrado, reinicios=8, iteraciones=300, temperatura=10.0, workers=None, semilla=0,
+                      objetivo=None, corpus=CORPUS):
+    """Ejecuta `reinicios` búsquedas independientes en paralelo y devuelve (mejor, todas).
+
+    `mejor` es el resultado de mayor puntuación (ver `resolver`).
+    """
+    trabajos = [(cifrado, iteraciones, temperatura, semilla + i, objetivo, corpus) for i in range(reinicios)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and reinicios > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, reinicios)) as executor:
+            resultados = list(executor.map(_resolver_trabajo, trabajos))
+    else:
+        resultados = [_resolver_trabajo(t) for t in trabajos]
+    return max(resultados, key=lambda r: r['puntuacion']), resultados
+
+
+def descifrar_con_clave(cifrado, clave):
+    """Texto claro (A-Z) del texto cifrado con una clave símbolo -> letra."""
+    return (np.asarray(clave)[np.asarray(cifrado, dtype=np.int64)] + 65).astype(np.uint8).tobytes().decode('ascii')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Criptoanálisis del cifrado homofónico (sólo texto cifrado)')
+    parser.add_argument('cifrado', help='Símbolos separados por espacios o comas')
+    parser.add_argument('--reinicios', type=int, default=8, help='Búsquedas independientes. Default=8')
+    parser.add_argument('--iteraciones', type=int, default=300, help='Barridos por búsqueda. Default=300')
+    parser.add_argument('--temperatura', type=float, default=10.0, help='Temperatura inicial. Default=10')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos. Default=núcleos')
+    parser.add_argument('--semilla', type=int, default=0, help='Semilla del primer reinicio. Default=0')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cifrado = [int(x) for x in args.cifrado.replace(',', ' ').replace('[', '').replace(']', '').split()]
+    inicio = time.perf_counter()
+    mejor, resultados = romper_homofonico(cifrado, args.reinicios, args.iteraciones, args.temperatura,
+                                          args.workers, args.semilla)
+    duracion = time.perf_counter() - inicio
+    pasos = sum(r['pasos'] for r in resultados)
+    print(f"Texto descifrado: {descifrar_con_clave(cifrado, mejor['clave'])}")
+    print(f"Puntuación media por trigrama: {mejor['puntuacion']:.4f}")
+    print(f"Pasos: {pasos} ({pasos / sum(r['segundos'] for r in resultados):,.0f} pasos/s por proceso) | "
+          f"tiempo total: {duracion:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Layout_Homofonico.py
+
+Generador de layouts para CifradoHomofonico a partir de un corpus.
+
+- Las letras se cuentan en una sola pasada por bloques de `TAMAÑO_BLOQUE`
+  bytes (sin decodificar, con un histograma de bytes), así que el corpus
+  puede ser mucho más grande que la memoria. En la misma pasada se calcula su SHA-256.
+- Los `m` símbolos se reparten en proporción a la frecuencia de cada letra
+  con el método del mayor resto; cada letra recibe al menos un símbolo.
+- El layout y su arreglo inverso (símbolo -> índice de letra) se guardan en
+  `CACHE` con el hash del corpus, el alfabeto y m en el nombre. Un índice
+  (ruta, tamaño, mtime) -> hash evita volver a leer un corpus que no cambió.
+
+Uso:
+    python Layout_Homofonico.py corpus.txt --m 200 --alfabeto es
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+
+ALFABETOS = {
+    'en': 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'es': 'ABCDEFGHIJKLMNÑOPQRSTUVWXYZ',
+}
+# Vocales acentuadas que se cuentan (y cifran) como la vocal sin acento
+PLEGADO = str.maketrans('ÁÉÍÓÚÜÀÈÌÒÙ', 'AEIOUUAEIOU')
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_layouts')
+# Bytes leídos del corpus por iteración
+TAMAÑO_BLOQUE = 1 << 20
+
+
+def _cargar_numpy():
+    """Importa NumPy bajo demanda. Devuelve el módulo o None si no está instalado."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def normalizar(texto):
+    """Mayúsculas y vocales sin acento, como se cuentan en el corpus."""
+    return texto.upper().translate(PLEGADO)
+
+
+def _patrones(alfabeto):
+    """Para cada letra, las secuencias UTF-8 que cuentan como ella (mayúscula,
+    minúscula y, para las vocales, sus variantes acentuadas)."""
+    patrones = {letra: {letra.encode('utf-8'), letra.lower().encode('utf-8')} for letra in alfabeto}
+    for origen, destino in zip('ÁÉÍÓÚÜÀÈÌÒÙ', 'AEIOUUAEIOU'):
+        if destino in patrones:
+            patrones[destino].update({origen.encode('utf-8'), origen.lower().encode('utf-8')})
+    return {letra: sorted(ps) for letra, ps in patrones.items()}
+
+
+def _contar_bloque(datos, patrones, cuentas, np):
+    """Suma a `cuentas` las apariciones de los patrones en `datos` (bytes completos).
+
+    Con NumPy, un bincount de los bytes resuelve todos los patrones de un byte
+    y otro de los bytes que siguen a cada byte inicial, los de dos bytes
+    (todas las letras acentuadas latinas empiezan con 0xC3). Sin NumPy, o
+    para secuencias más largas, se usa bytes.count.
+    """
+    if np is None:
+        for letra, secuencias in patrones.items():
+            cuentas[letra] += sum(datos.count(p) for p in secuencias)
+        return
+    arr = np.frombuffer(datos, dtype=np.uint8)
+    uno = np.bincount(arr, minlength=256)
+    dos = {}
+    for letra, secuencias in patrones.items():
+        for p in secuencias:
+            if len(p) == 1:
+                cuentas[letra] += int(uno[p[0]])
+            elif len(p) == 2:
+                if p[0] not in dos:
+                    dos[p[0]] = np.bincount(arr[1:][arr[:-1] == p[0]], minlength=256)
+                cuentas[letra] += int(dos[p[0]][p[1]])
+            else:
+                cuentas[letra] += datos.count(p)
+
+
+def contar_letras(ruta, alfabeto=ALFABETOS['en'], tamaño_bloque=TAMAÑO_BLOQUE):
+    """Cuenta las letras de `alfabeto` en el archivo leyéndolo por bloques.
+
+    Se trabaja sobre los bytes UTF-8 sin decodificar (ver `_contar_bloque`).
+    Los bloques se cortan en un límite de carácter para no partir secuencias
+    multibyte.
+
+    Devuelve (cuentas, sha256) donde cuentas es una lista alineada con el
+    alfabeto y sha256 el hash hexadecimal del archivo.
+    """
+    np = _cargar_numpy()
+    patrones = _patrones(alfabeto)
+    cuentas = dict.fromkeys(alfabeto, 0)
+    digest = hashlib.sha256()
+    pendiente = b''
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(tamaño_bloque), b''):
+            digest.update(bloque)
+            datos = pendiente + bloque
+            # Retroceder hasta el inicio de un carácter (bytes de continuación: 10xxxxxx)
+            corte = len(datos)
+            while corte > 0 and len(datos) - corte < 4 and datos[corte - 1] & 0xC0 == 0x80:
+                corte -= 1
+            if corte > 0 and datos[corte - 1] >= 0xC0:
+                corte -= 1
+            datos, pendiente = datos[:corte], datos[corte:]
+            _contar_bloque(datos, patrones, cuentas, np)
+    _contar_bloque(pendiente, patrones, cuentas, np)
+    return [cuentas[letra] for letra in alfabeto], digest.hexdigest()
+
+
+def asignar_simbolos(cuentas, m):
+    """Cantidad de símbolos por letra: uno fijo por letra y el resto (m - n)
+    repartido en proporción a `cuentas` con el método del mayor resto."""
+    n = len(cuentas)
+    if m < n:
+        raise ValueError(f"Se necesitan al menos {n} símbolos para {n} letras (m={m})")
+    total = sum(cuentas)
+    libres = m - n
+    if total == 0:
+        cuotas = [libres / n] * n
+    else:
+        cuotas = [libres * c / total for c in cuentas]
+    cantidad = [1 + int(q) for q in cuotas]
+    faltan = m - sum(cantidad)
+    # Desempate estable: a igual resto, la letra más frecuente y luego la primera
+    orden = sorted(range(n), key=lambda i: (-(cuotas[i] - int(cuotas[i])), -cuentas[i], i))
+    for i in orden[:faltan]:
+        cantidad[i] += 1
+    return cantidad
+
+
+def construir_layout(alfabeto, cantidad):
+    """Layout {letra: [símbolos]} con símbolos consecutivos en orden alfabético
+    y su inverso como lista símbolo -> índice de letra."""
+    layout = {}
+    reverso = []
+    for i, (letra, k) in enumerate(zip(alfabeto, cantidad)):
+        layout[letra] = list(range(len(reverso), len(reverso) + k))
+        reverso.extend([i] * k)
+    return layout, reverso
+
+
+def _escribir_json(ruta, datos):
+    """Escritura atómica: archivo temporal en la misma carpeta y os.replace."""
+    fd, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), prefix='.tmp-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, ensure_ascii=False)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+
+def _leer_json(ruta):
+    try:
+        with open(ruta, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def layout_desde_corpus(ruta, m=100, alfabeto=ALFABETOS['en'], cache=CACHE):
+    """Layout proporcional a las frecuencias del corpus, con caché en disco.
+
+    Devuelve un dict con 'alfabeto', 'm', 'sha256', 'cuentas', 'layout'
+    ({letra: [símbolos]}) y 'reverso' (símbolo -> índice de letra). Con
+    `cache=None` no se lee ni se escribe la caché.
+    """
+    estado = os.stat(ruta)
+    huella = {'tamaño': estado.st_size, 'mtime_ns': estado.st_mtime_ns}
+    clave_alfabeto = hashlib.sha256(alfabeto.encode('utf-8')).hexdigest()[:8]
+    indice = {}
+
+    if cache is not None:
+        os.makedirs(cache, exist_ok=True)
+        ruta_indice = os.path.join(cache, 'indice.json')
+        indice = _leer_json(ruta_indice) or {}
+        conocido = indice.get(os.path.abspath(ruta))
+        if conocido and all(conocido.get(k) == v for k, v in huella.items()):
+            guardado = _leer_json(os.path.join(cache, f"layout-{conocido['sha256'][:16]}-{clave_alfabeto}-{m}.json"))
+            if guardado is not None:
+                return guardado
+
+    cuentas, sha256 = contar_letras(ruta, alfabeto)
+    layout, reverso = construir_layout(alfabeto, asignar_simbolos(cuentas, m))
+    resultado = {'alfabeto': alfabeto, 'm': m, 'sha256': sha256, 'cuentas': cuentas,
+                 'layout': layout, 'reverso': reverso}
+
+    if cache is not None:
+        _escribir_json(os.path.join(cache, f"layout-{sha256[:16]}-{clave_alfabeto}-{m}.json"), resultado)
+        indice[os.path.abspath(ruta)] = dict(huella, sha256=sha256)
+        _escribir_json(ruta_indice, indice)
+    return resultado
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Genera un layout homofónico a partir de un corpus')
+    parser.add_argument('corpus', help='Archivo de texto (UTF-8)')
+    parser.add_argument('--m', type=int, default=100, help='Cantidad de símbolos. Default=100')
+    parser.add_argument('--alfabeto', choices=sorted(ALFABETOS), default='en', help='Alfabeto. Default=en')
+    parser.add_argument('--sin-cache', action='store_true', help='No leer ni escribir la caché')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    resultado = layout_desde_corpus(args.corpus, args.m, ALFABETOS[args.alfabeto],
+                                    cache=None if args.sin_cache else CACHE)
+    total = sum(resultado['cuentas']) or 1
+    for letra, cuenta in zip(resultado['alfabeto'], resultado['cuentas']):
+        simbolos = resultado['layout'][letra]
+        print(f"{letra:2} {cuenta / total:7.2%} -> {len(simbolos):3} símbolos [{simbolos[0]}..{simbolos[-1]}]")
+    print(f"Total de símbolos: {resultado['m']} | corpus sha256: {resultado['sha256'][:16]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,100 @@
+def _xor_arrays(datos, clave, salida=None):
+    """XOR de dos buffers del mismo tamaño con NumPy; None si NumPy no está instalado."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    a = np.frombuffer(datos, dtype=np.uint8)
+    b = np.frombuffer(clave, dtype=np.uint8, count=len(a))
+    if salida is None:
+        return np.bitwise_xor(a, b).tobytes()
+    np.bitwise_xor(a, b, out=np.frombuffer(salida, dtype=np.uint8))
+    return salida
+
+
+def _validar_longitud(datos, clave):
+    if len(clave) < len(datos):
+        raise ValueError("La clave debe ser al menos tan larga como el mensaje")
+
+
+def encriptar_otp_bytes(mensaje, clave):
+    """XOR de `mensaje` con `clave` (bytes, bytearray o memoryview); devuelve bytes.
+
+    La clave debe tener al menos la longitud del mensaje (se usan sus primeros
+    len(mensaje) bytes). Cifrar y descifrar son la misma operación.
+    """
+    mensaje = memoryview(mensaje).cast('B')
+    clave = memoryview(clave).cast('B')[:len(mensaje)]
+    _validar_longitud(mensaje, clave)
+    resultado = _xor_arrays(mensaje, clave)
+    if resultado is None:
+        n = len(mensaje)
+        resultado = (int.from_bytes(mensaje, 'big') ^ int.from_bytes(clave, 'big')).to_bytes(n, 'big')
+    return resultado
+
+
+def encriptar_otp_en_sitio(buffer, clave):
+    """Como encriptar_otp_bytes pero escribe el resultado sobre `buffer` (bytearray, mmap, ...)."""
+    buffer = memoryview(buffer).cast('B')
+    clave = memoryview(clave).cast('B')[:len(buffer)]
+    _validar_longitud(buffer, clave)
+    if _xor_arrays(buffer, clave, salida=buffer) is None:
+        n = len(buffer)
+        buffer[:] = (int.from_bytes(buffer, 'big') ^ int.from_bytes(clave, 'big')).to_bytes(n, 'big')
+    return buffer.obj
+
+
+def bits_a_bytes(bits):
+    """'0'/'1' (longitud múltiplo de 8) -> bytes"""
+    if len(bits) % 8:
+        raise ValueError("La longitud debe ser múltiplo de 8")
+    return int(bits, 2).to_bytes(len(bits) // 8, 'big') if bits else b""
+
+
+def bytes_a_bits(datos):
+    """bytes -> '0'/'1'"""
+    return format(int.from_bytes(datos, 'big'), f'0{len(datos) * 8}b') if datos else ""
+
+
+# Byte XOR de dos caracteres ASCII -> '0' si eran iguales, '1' si no
+_DIFERENCIA_A_BIT = b'0' + b'1' * 255
+
+
 def encriptar_otp(mensaje, clave):
-    mensaje_encriptado = ""
-    for i in range(len(mensaje)):
-        if mensaje[i] == clave[i]:
-            mensaje_encriptado += '0'
-        else:
-            mensaje_encriptado += '1'
-    return mensaje_encriptado
-
-print("Programa de encriptación/desencriptación OTP (One-Time Pad)")
-x=""
-y="x"
-while len(x)!=len(y) or len(x)<8 or len(x)%8!=0 or not all(c in '01' for c in x) or not all(c in '01' for c in y):
-    x=input("Ingrese el mensaje a encriptar/desencriptar en binario: ")
-    y=input("Ingrese la clave (de igual longitud) en binario: ")
-    if len(x)!=len(y):
-        print("Error: La clave debe tener la misma longitud que el mensaje.")
-    elif len(x)<8:
-        print("Error: La longitud debe ser mínimo 8 caracteres.")
-    elif len(x)%8!=0:
-        print("Error: La longitud debe ser múltiplo de 8.")
-    elif not all(c in '01' for c in x):
-        print("Error: El mensaje debe contener solo ceros y unos.")
-    elif not all(c in '01' for c in y):
-        print("Error: La clave debe contener solo ceros y unos.")
-
-print("Mensaje encriptado/desencriptado:", encriptar_otp(x,y))
-input("Presiona Enter para salir...")
+    """Adaptador para mensaje y clave como texto de '0'/'1'.
+
+    Regla original: '0' donde los caracteres coinciden y '1' donde difieren.
+    Para texto ASCII se calcula con el XOR por bytes (dos caracteres son
+    iguales si y sólo si su XOR es 0) y una traducción a '0'/'1'.
+    """
+    if len(clave) < len(mensaje):
+        raise IndexError("string index out of range")
+    clave = clave[:len(mensaje)]
+    if mensaje.isascii() and clave.isascii():
+        diferencia = encriptar_otp_bytes(mensaje.encode('ascii'), clave.encode('ascii'))
+        return diferencia.translate(_DIFERENCIA_A_BIT).decode('ascii')
+    return ''.join('0' if m == k else '1' for m, k in zip(mensaje, clave))
+
+def main():
+    print("Programa de encriptación/desencriptación OTP (One-Time Pad)")
+    x=""
+    y="x"
+    while len(x)!=len(y) or len(x)<8 or len(x)%8!=0 or not all(c in '01' for c in x) or not all(c in '01' for c in y):
+        x=input("Ingrese el mensaje a encriptar/desencriptar en binario: ")
+        y=input("Ingrese la clave (de igual longitud) en binario: ")
+        if len(x)!=len(y):
+            print("Error: La clave debe tener la misma longitud que el mensaje.")
+        elif len(x)<8:
+            print("Error: La longitud debe ser mínimo 8 caracteres.")
+        elif len(x)%8!=0:
+            print("Error: La longitud debe ser múltiplo de 8.")
+        elif not all(c in '01' for c in x):
+            print("Error: El mensaje debe contener solo ceros y unos.")
+        elif not all(c in '01' for c in y):
+            print("Error: La clave debe contener solo ceros y unos.")
+
+    print("Mensaje encriptado/desencriptado:", encriptar_otp(x,y))
+    input("Presiona Enter para salir...")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Libreta_OTP.py
+
+Libretas (pads) OTP en archivo para Cifrado_OTP.
+
+- La libreta es un archivo de bytes aleatorios generado de antemano; se abre
+  con mmap, así que tomar un tramo no carga el resto del archivo.
+- Junto a la libreta se guarda un índice JSON (`<libreta>.indice.json`) con el
+  cursor y la lista de intervalos ya consumidos [inicio, fin), fusionados para
+  que el índice sea compacto. Se reescribe de forma atómica (archivo temporal
+  + os.replace) antes de devolver el texto cifrado, de modo que un corte no
+  permita reutilizar un tramo.
+- Reservar o registrar un tramo se hace con un bloqueo exclusivo sobre
+  `<libreta>.lock`: bajo el bloqueo se vuelve a leer el índice, se asigna el
+  tramo y se guarda. Así dos procesos (o dos LibretaOTP del mismo proceso)
+  sobre la misma libreta nunca reciben el mismo tramo.
+- Cifrar consume el siguiente tramo libre (o uno indicado) y rechaza cualquier
+  solapamiento con lo ya consumido. Descifrar sólo necesita el offset y
+  registra el tramo como consumido en el índice local.
+- El coste de cifrar/descifrar es O(tamaño del mensaje): búsqueda binaria en
+  el índice y XOR sobre la vista del mmap.
+
+El archivo cifrado lleva una cabecera con el offset en la libreta:
+    magic "OTP1" (4 bytes) | offset (8 bytes, big endian) | datos
+
+Uso:
+    python Libreta_OTP.py generar libreta.bin 100M
+    python Libreta_OTP.py cifrar libreta.bin mensaje.txt mensaje.otp
+    python Libreta_OTP.py descifrar libreta.bin mensaje.otp mensaje.txt
+    python Libreta_OTP.py estado libreta.bin
+"""
+
+import argparse
+import bisect
+import contextlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from Cifrado_OTP import encriptar_otp_bytes
+
+CABECERA = struct.Struct(">4sQ")
+MAGIC = b"OTP1"
+# Bytes procesados por iteración al cifrar archivos
+TAMAÑO_BLOQUE = 1 << 20
+
+
+def parse_size(texto):
+    unidades = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    texto = texto.strip().upper()
+    if texto[-1] in unidades:
+        return int(float(texto[:-1]) * unidades[texto[-1]])
+    return int(texto)
+
+
+def generar_libreta(ruta, tamaño):
+    """Crea una libreta de `tamaño` bytes aleatorios (os.urandom) y su índice vacío."""
+    with open(ruta, 'wb') as f:
+        restante = tamaño
+        while restante > 0:
+            n = min(restante, TAMAÑO_BLOQUE)
+            f.write(os.urandom(n))
+            restante -= n
+    indice = ruta + '.indice.json'
+    if os.path.exists(indice):
+        os.remove(indice)
+
+
+class LibretaOTP:
+    """Libreta OTP en archivo con índice de tramos consumidos.
+
+    Se usa como context manager:
+        with LibretaOTP("libreta.bin") as libreta:
+            offset, cifrado = libreta.cifrar(b"mensaje")
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.ruta_indice = ruta + '.indice.json'
+        self.ruta_bloqueo = ruta + '.lock'
+        self._archivo = open(ruta, 'rb')
+        self.tamaño = os.fstat(self._archivo.fileno()).st_size
+        if self.tamaño == 0:
+            self._archivo.close()
+            raise ValueError("La libreta está vacía")
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        # Cursor e intervalos consumidos [inicio, fin), ordenados y sin solaparse
+        self._cargar_indice()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._mapa.close()
+        self._archivo.close()
+
+    # --- índice ---------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _bloqueo(self):
+        """Bloqueo exclusivo entre procesos (y entre instancias) sobre `<libreta>.lock`."""
+        with open(self.ruta_bloqueo, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _cargar_indice(self):
+        """(Re)lee el índice del disco; descarta el estado en memoria."""
+        self.cursor = 0
+        self._inicios = []
+        self._fines = []
+        if not os.path.exists(self.ruta_indice):
+            return
+        with open(self.ruta_indice, encoding='utf-8') as f:
+            datos = json.load(f)
+        if datos.get('tamaño') != self.tamaño:
+            raise ValueError("El índice no corresponde a esta libreta (tamaño distinto)")
+        self.cursor = datos['cursor']
+        for inicio, fin in datos['consumidos']:
+            self._inicios.append(inicio)
+            self._fines.append(fin)
+
+    def _guardar_indice(self):
+        datos = {
+            'tamaño': self.tamaño,
+            'cursor': self.cursor,
+            'consumidos': [[i, f] for i, f in zip(self._inicios, self._fines)],
+        }
+        carpeta = os.path.dirname(os.path.abspath(self.ruta_indice))
+        fd, temporal = tempfile.mkstemp(dir=carpeta, prefix='.indice-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(datos, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, self.ruta_indice)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+
+    def consumidos(self):
+        """Lista de intervalos [inicio, fin) consumidos."""
+        return list(zip(self._inicios, self._fines))
+
+    def disponible(self):
+        """Bytes libres desde el cursor hasta el final de la libreta."""
+        return self.tamaño - self.cursor
+
+    def esta_libre(self, inicio, fin):
+        """True si [inicio, fin) no se solapa con ningún tramo consumido."""
+        i = bisect.bisect_right(self._inicios, inicio)
+        if i > 0 and self._fines[i - 1] > inicio:
+            return False
+        return i == len(self._inicios) or self._inicios[i] >= fin
+
+    def _marcar(self, inicio, fin):
+        """Agrega [inicio, fin) al índice fusionando con los intervalos vecinos."""
+        i = bisect.bisect_left(self._fines, inicio)
+        j = bisect.bisect_right(self._inicios, fin)
+        if i < j:
+            inicio = min(inicio, self._inicios[i])
+            fin = max(fin, self._fines[j - 1])
+        self._inicios[i:j] = [inicio]
+        self._fines[i:j] = [fin]
+
+    def reservar(self, longitud, offset=None):
+        """Marca como consumido un tramo de `longitud` bytes y devuelve su offset.
+
+        Sin `offset` se usa el primer tramo libre desde el cursor (saltando lo
+        que se haya registrado al descifrar). Lanza ValueError si la longitud
+        no es positiva, si el tramo excede la libreta o si se solapa con uno ya
+        consumido. Todo ocurre bajo el bloqueo de la libreta, con el índice
+        releído del disco, y el índice se guarda antes de devolver.
+        """
+        if longitud <= 0:
+            raise ValueError(f"La longitud a reservar debe ser positiva (se pidieron {longitud} bytes)")
+        with self._bloqueo():
+            self._cargar_indice()
+            return self._reservar(longitud, offset)
+
+    def _reservar(self, longitud, offset):
+        if offset is None:
+            offset = self.cursor
+            while not self.esta_libre(offset, offset + longitud):
+                # Saltar al final del primer intervalo que bloquea el tramo
+                i = bisect.bisect_right(self._fines, offset)
+                offset = self._fines[i]
+        fin = offset + longitud
+        if offset < 0 or fin > self.tamaño:
+            raise ValueError(f"Libreta agotada: se piden {longitud} bytes desde {offset} y quedan {self.tamaño - offset}")
+        if not self.esta_libre(offset, fin):
+            raise ValueError(f"El tramo [{offset}, {fin}) de la libreta ya fue usado")
+        self._marcar(offset, fin)
+        self.cursor = max(self.cursor, fin)
+        self._guardar_indice()
+        return offset
+
+    # --- cifrado --------------------------------------------------------
+
+    def tramo(self, offset, longitud):
+        """Vista (memoryview) de la libreta sin copiar; el llamador debe liberarla."""
+        if offset < 0 or offset + longitud > self.tamaño:
+            raise ValueError("El tramo está fuera de la libreta")
+        return memoryview(self._mapa)[offset:offset + longitud]
+
+    def _xor(self, datos, offset):
+        with self.tramo(offset, len(datos)) as clave:
+            return encriptar_otp_bytes(datos, clave)
+
+    def cifrar(self, mensaje, offset=None):
+        """Cifra `mensaje` con un tramo nuevo de la libreta; devuelve (offset, cifrado)."""
+        offset = self.reservar(len(mensaje), offset)
+        return offset, self._xor(mensaje, offset)
+
+    def descifrar(self, offset, cifrado):
+        """Descifra con el tramo que empieza en `offset` y lo registra como consumido."""
+        resultado = self._xor(cifrado, offset)
+        self._registrar(offset, offset + len(cifrado))
+        return resultado
+
+    def _registrar(self, inicio, fin):
+        """Marca [inicio, fin) como consumido (bajo el bloqueo, con el índice releído)."""
+        if fin <= inicio:
+            return
+        with self._bloqueo():
+            self._cargar_indice()
+            if not self._cubierto(inicio, fin):
+                self._marcar(inicio, fin)
+                self._guardar_indice()
+
+    def _cubierto(self, inicio, fin):
+        """True si [inicio, fin) está completamente dentro de un tramo consumido."""
+        i = bisect.bisect_right(self._inicios, inicio) - 1
+        return i >= 0 and self._fines[i] >= fin
+
+    def cifrar_archivo(self, origen, destino):
+        """Cifra un archivo por bloques; escribe cabecera + datos y devuelve el offset usado.
+
+        Un archivo vacío no consume la libreta: se escribe sólo la cabecera
+        con offset 0 y se devuelve 0.
+        """
+        longitud = os.path.getsize(origen)
+        if longitud == 0:
+            with open(destino, 'wb') as salida:
+                salida.write(CABECERA.pack(MAGIC, 0))
+            return 0
+        offset = self.reservar(longitud)
+        with open(origen, 'rb') as entrada, open(destino, 'wb') as salida:
+            salida.write(CABECERA.pack(MAGIC, offset))
+            self._xor_archivo(entrada, salida, offset, longitud)
+        return offset
+
+    def descifrar_archivo(self, origen, destino):
+        """Descifra un archivo generado por cifrar_archivo; devuelve el offset usado."""
+        with open(origen, 'rb') as entrada:
+            magic, offset = CABECERA.unpack(entrada.read(CABECERA.size))
+            if magic != MAGIC:
+                raise ValueError("El archivo no es un mensaje cifrado con Libreta_OTP")
+            longitud = os.path.getsize(origen) - CABECERA.size
+            with open(destino, 'wb') as salida:
+                self._xor_archivo(entrada, salida, offset, longitud)
+        self._registrar(offset, offset + longitud)
+        return offset
+
+    def _xor_archivo(self, entrada, salida, offset, longitud):
+        hecho = 0
+        while hecho < longitud:
+            bloque = entrada.read(min(TAMAÑO_BLOQUE, longitud - hecho))
+            if not bloque:
+                raise ValueError("El archivo terminó antes de lo esperado")
+            salida.write(self._xor(bloque, offset + hecho))
+            hecho += len(bloque)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Libretas OTP en archivo')
+    modos = parser.add_subparsers(dest='modo', required=True)
+    generar = modos.add_parser('generar', help='Crear una libreta de bytes aleatorios')
+    generar.add_argument('libreta')
+    generar.add_argument('tamaño', help='Tamaño (1K, 100M, 1G, ...)')
+    for modo in ('cifrar', 'descifrar'):
+        sub = modos.add_parser(modo)
+        sub.add_argument('libreta')
+        sub.add_argument('entrada')
+        sub.add_argument('salida')
+    estado = modos.add_parser('estado', help='Mostrar el cursor y los tramos consumidos')
+    estado.add_argument('libreta')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.modo == 'generar':
+        generar_libreta(args.libreta, parse_size(args.tamaño))
+        print(f"Libreta creada: {args.libreta}")
+        return
+
+    try:
+        with LibretaOTP(args.libreta) as libreta:
+            if args.modo == 'cifrar':
+                offset = libreta.cifrar_archivo(args.entrada, args.salida)
+                print(f"Cifrado con el tramo que empieza en {offset}. Quedan {libreta.disponible()} bytes")
+            elif args.modo == 'descifrar':
+                offset = libreta.descifrar_archivo(args.entrada, args.salida)
+                print(f"Descifrado con el tramo que empieza en {offset}")
+            else:
+                print(f"Tamaño: {libreta.tamaño} | cursor: {libreta.cursor} | libres: {libreta.disponible()}")
+                for inicio, fin in libreta.consumidos():
+                    print(f"  consumido [{inicio}, {fin})")
+    except ValueError as e:
+        print("Error:", e)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
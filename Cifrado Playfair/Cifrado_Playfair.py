@@ -1,11 +1,20 @@
+import argparse
+import functools
+import io
+import itertools
 import re
-print("Programa de cifrado y decifrado Playfair")
+import sys
 
-x=0
-men=""
-ver=0
-llave=[]
-fila=""
+# Alfabeto Playfair (I/J comparten casilla)
+ALPHABET = 'ABCDEFGHIKLMNOPQRSTUVWXYZ'
+# Textos desde este largo se procesan con el motor NumPy (si está instalado)
+NUMPY_MIN_LENGTH = 1024
+# Bytes que no son letras mayúsculas ASCII (se descartan en el preprocesado rápido)
+_NOT_UPPER = bytes(c for c in range(256) if not 65 <= c <= 90)
+# Igual, pero conservando los saltos de línea que separan mensajes en el modo masivo
+_NOT_UPPER_OR_NEWLINE = bytes(c for c in range(256) if not (65 <= c <= 90 or c == 10))
+# Mensajes (líneas) procesados por lote en el modo masivo
+BATCH_LINES = 1 << 14
 
 #funciones
 # 1) Construir la cuadrícula (5x5) y los mapeos letra -> (fila,col) y (fila,col) -> letra
@@ -27,6 +36,33 @@ def build_grid_from_input(llave_rows):
         letter_to_pos['J'] = letter_to_pos['I']
     return grid, letter_to_pos, pos_to_letter
 
+# 1b) Cuadrícula a partir de una palabra clave o de 25 letras explícitas
+def keyword_rows(keyword):
+    """
+    Filas de la cuadrícula para `keyword`: sus letras sin repetir (J->I) y
+    luego el resto del alfabeto en orden.
+    """
+    letters = []
+    for ch in preprocess_text(keyword) + ALPHABET:
+        if ch in ALPHABET and ch not in letters:
+            letters.append(ch)
+    order = ''.join(letters)
+    return [order[i:i+5] for i in range(0, 25, 5)]
+
+def grid_rows(text):
+    """
+    Filas de una cuadrícula explícita: 25 letras distintas (J->I) con o sin
+    separadores ('PLAYF IREXM ...'). Lanza ValueError si no es válida.
+    """
+    letters = preprocess_text(text)
+    if len(letters) != 25 or len(set(letters)) != 25:
+        raise ValueError("La cuadrícula debe tener 25 letras distintas (I/J cuentan como una)")
+    return [letters[i:i+5] for i in range(0, 25, 5)]
+
+def build_grid_from_keyword(keyword):
+    """Como build_grid_from_input, con la cuadrícula construida a partir de una palabra clave."""
+    return build_grid_from_input(keyword_rows(keyword))
+
 # 2) reemplazar J->I
 def preprocess_text(text):
     s = ''.join(ch for ch in text.upper() if ch.isalpha())
@@ -86,11 +122,102 @@ def process_pair(pair, letter_to_pos, pos_to_letter, encrypt=True):
         # rectángulo: intercambiar columnas
         return pos_to_letter[(ra, cb)] + pos_to_letter[(rb, ca)]
 
+# 4b) Tablas de digramas: los 625 pares de letras cifrados y descifrados de una vez por cuadrícula
+def grid_key(pos_to_letter):
+    """Las 25 letras de la cuadrícula fila por fila; identifica la cuadrícula en las cachés."""
+    return ''.join(pos_to_letter[(r, c)] for r in range(5) for c in range(5))
+
+@functools.lru_cache(maxsize=128)
+def digram_tables(key):
+    """
+    Dicts {par: par cifrado} y {par: par descifrado} para todos los pares de
+    letras de la cuadrícula `key` (ver grid_key), calculados con process_pair.
+    """
+    _, letter_to_pos, pos_to_letter = build_grid_from_input([key[i:i+5] for i in range(0, 25, 5)])
+    encrypt, decrypt = {}, {}
+    for a in ALPHABET:
+        for b in ALPHABET:
+            if a in letter_to_pos and b in letter_to_pos:
+                encrypt[a + b] = process_pair(a + b, letter_to_pos, pos_to_letter, encrypt=True)
+                decrypt[a + b] = process_pair(a + b, letter_to_pos, pos_to_letter, encrypt=False)
+    return encrypt, decrypt
+
+@functools.lru_cache(maxsize=128)
+def _digram_arrays(key):
+    """
+    Las tablas de digram_tables como arrays NumPy (625, 2) de códigos ASCII
+    indexados por ALPHABET.index(a) * 25 + ALPHABET.index(b); 0 marca un par
+    con letras que no están en la cuadrícula. None si la cuadrícula no es ASCII.
+    """
+    import numpy as np
+    if not key.isascii():
+        return None
+    arrays = []
+    for table in digram_tables(key):
+        array = np.zeros((625, 2), dtype=np.uint8)
+        for pair, out in table.items():
+            array[ALPHABET.index(pair[0]) * 25 + ALPHABET.index(pair[1])] = bytearray(out.encode('ascii'))
+        arrays.append(array)
+    return tuple(arrays)
+
+def playfair_numpy(text, key, encrypt=True):
+    """
+    Motor vectorizado equivalente a playfair_encrypt / playfair_decrypt.
+
+    El texto se preprocesa sobre bytes (mayúsculas, sólo letras, J->I), se
+    forman los bigramas (con la X de relleno entre letras iguales y al final,
+    como make_bigrams) y cada par se traduce con un único gather sobre la
+    tabla de 625 digramas de la cuadrícula. Devuelve el texto resultante sin
+    limpiar, o None si NumPy no está instalado o el texto o la cuadrícula no
+    son ASCII, para que el llamador use la versión original.
+    """
+    if not text.isascii():
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    tables = _digram_arrays(key)
+    if tables is None:
+        return None
+
+    data = text.encode('ascii').upper().translate(None, _NOT_UPPER).replace(b'J', b'I')
+    letters = np.frombuffer(data, dtype=np.uint8)
+    if encrypt and len(letters) > 1:
+        # Una X va entre s[j] y s[j+1] iguales sólo si s[j] abre un par, es
+        # decir si j + (X insertadas antes) es par. Tras cada candidata j esa
+        # cantidad queda con paridad opuesta a j (se inserte o no), así que la
+        # paridad para la candidata i sale de la candidata i-1 sin recorrerlas
+        doubles = np.flatnonzero(letters[:-1] == letters[1:])
+        if len(doubles):
+            parity = np.empty(len(doubles), dtype=doubles.dtype)
+            parity[0] = 0
+            parity[1:] = 1 - doubles[:-1] % 2
+            inserts = doubles[doubles % 2 == parity] + 1
+            letters = np.insert(letters, inserts, ord('X'))
+    if len(letters) % 2:
+        letters = np.append(letters, np.uint8(ord('X')))
+
+    index = np.full(256, 0, dtype=np.intp)
+    index[np.frombuffer(ALPHABET.encode('ascii'), dtype=np.uint8)] = np.arange(25)
+    pairs = index[letters[0::2]] * 25 + index[letters[1::2]]
+    out = tables[0 if encrypt else 1][pairs]
+    if len(out) and not out.all():
+        # Mismo error que process_pair: la primera letra que no está en la cuadrícula
+        pair = int(pairs[np.flatnonzero(~out.all(axis=1))[0]])
+        a, b = ALPHABET[pair // 25], ALPHABET[pair % 25]
+        raise KeyError(a if a not in key else b)
+    return out.tobytes().decode('ascii')
+
 # 5) Eliminar rellenos 'X' añadidos durante el proceso de pairing al descifrar
 def remove_fillers_from_decrypted(s):
     if len(s) % 2 != 0:
         # si por alguna razón no es par, lo devolvemos tal cual
         return s
+    if len(s) >= NUMPY_MIN_LENGTH and s.isascii():
+        cleaned = _remove_fillers_numpy(s)
+        if cleaned is not None:
+            return cleaned
 
     pairs = [s[i:i+2] for i in range(0, len(s), 2)]
     out = []
@@ -107,79 +234,303 @@ def remove_fillers_from_decrypted(s):
         out_s = out_s[:-1]
     return out_s
 
+def _remove_fillers_numpy(s):
+    """Versión vectorizada de remove_fillers_from_decrypted (texto ASCII de largo par)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    letters = np.frombuffer(s.encode('ascii'), dtype=np.uint8)
+    first, second = letters[0::2], letters[1::2]
+    keep = np.ones(len(letters), dtype=bool)
+    # segunda letra X y el par siguiente empieza con la misma letra que este
+    keep[1:-2:2] = ~((second[:-1] == ord('X')) & (first[1:] == first[:-1]))
+    out = letters[keep].tobytes().decode('ascii')
+    if out.endswith('X'):
+        out = out[:-1]
+    return out
+
+def _split_pairs(s):
+    """Lista de pares de un texto ASCII de largo par (vía NumPy, más rápido que cortar en Python)."""
+    import numpy as np
+    return np.frombuffer(s.encode('utf-32-le'), dtype='<U2').tolist()
+
 # 6) Funciones principales que cifran o descifran un texto (string)
 def playfair_encrypt(plaintext, letter_to_pos, pos_to_letter):
+    key = grid_key(pos_to_letter)
+    if len(plaintext) >= NUMPY_MIN_LENGTH:
+        cipher_text = playfair_numpy(plaintext, key, encrypt=True)
+        if cipher_text is not None:
+            return cipher_text, _split_pairs(cipher_text)
+
     s = preprocess_text(plaintext)
     pairs = make_bigrams(s)
-    cipher_pairs = [process_pair(p, letter_to_pos, pos_to_letter, encrypt=True) for p in pairs]
+    table = digram_tables(key)[0]
+    # process_pair sólo para pares fuera de la tabla (lanza el mismo KeyError)
+    cipher_pairs = [table.get(p) or process_pair(p, letter_to_pos, pos_to_letter, encrypt=True) for p in pairs]
     cipher_text = ''.join(cipher_pairs)
     return cipher_text, cipher_pairs
 
 def playfair_decrypt(ciphertext, letter_to_pos, pos_to_letter):
+    key = grid_key(pos_to_letter)
+    if len(ciphertext) >= NUMPY_MIN_LENGTH:
+        plain_text = playfair_numpy(ciphertext, key, encrypt=False)
+        if plain_text is not None:
+            return plain_text, remove_fillers_from_decrypted(plain_text), _split_pairs(plain_text)
+
     s = preprocess_text(ciphertext)  # eliminar espacios y J->I si viniera
     # asumimos que el ciphertext viene ya en pares correctos;
     # si la longitud es impar, lo rellenamos con 'X' para evitar errores
     if len(s) % 2 != 0:
         s = s + 'X'
     pairs = [s[i:i+2] for i in range(0, len(s), 2)]
-    plain_pairs = [process_pair(p, letter_to_pos, pos_to_letter, encrypt=False) for p in pairs]
+    table = digram_tables(key)[1]
+    plain_pairs = [table.get(p) or process_pair(p, letter_to_pos, pos_to_letter, encrypt=False) for p in pairs]
     plain_text = ''.join(plain_pairs)
     # intentar limpiar rellenos
     cleaned = remove_fillers_from_decrypted(plain_text)
     return plain_text, cleaned, plain_pairs
 
-#ingreso de la opción Encriptación(1) o desencriptación(2)
-while x != 1 and x != 2:
-    x = int(input("Seleccione la opción que desea:\n1) Cifrar un mensaje\n2)Decifrar un mensaje\n"))
-    if x != 1 and x != 2:
-        print("Opcion invalida")
-
-#ingreso del mensaje en men, solo se aceptan letras mayusculas
-men = input("Ingrese el mensaje a cifrar en mayusculas: ")
-while ver == 0:
-    if any(not c.isupper() for c in men):
-        men = input("Mensaje invalido, solo puede ingresar letras mayusculas. Intente de nuevo: ")
-    else:
-        ver=1
-
-#Ingreso de la llave (matriz 5x5), se almacena cada fila como un elemento de la lista llave
-print("Ingrese la llave (matriz 5x5) fila por fila (Solo letras mayusculas sin espacios)")
-for i in range(5):
-    while len(fila) != 5 or ver==1:
-        fila=input(f"Ingrese la fila {i+1}: ")
-        if len(fila) != 5:
-            print("Cada fila debe tener 5 letras únicamente")
-        if any(not c.isupper() for c in fila):
+# 7) Modo masivo: un mensaje por línea, todos con la misma cuadrícula
+def _message_layout(lengths):
+    """Inicio de cada mensaje en el arreglo de letras concatenadas."""
+    import numpy as np
+    starts = np.zeros(len(lengths), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return starts
+
+def playfair_batch(block, key, encrypt=True):
+    """
+    Cifra o descifra un bloque de mensajes (bytes, uno por línea) de una vez.
+
+    Es equivalente a aplicar playfair_encrypt (texto cifrado continuo) o
+    playfair_decrypt (texto limpio) a cada línea: las letras de todos los
+    mensajes se concatenan, las X de relleno se calculan con la regla de
+    paridad de playfair_numpy reiniciada en cada mensaje, y todos los pares
+    se traducen con un solo gather. Devuelve los resultados separados por
+    saltos de línea (uno por mensaje), o None si NumPy no está instalado o
+    el bloque o la cuadrícula no son ASCII.
+    """
+    if not block.isascii():
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    tables = _digram_arrays(key)
+    if tables is None:
+        return None
+
+    if not block.endswith(b'\n'):
+        block += b'\n'
+    data = np.frombuffer(block.upper().translate(None, _NOT_UPPER_OR_NEWLINE).replace(b'J', b'I'), dtype=np.uint8)
+    newlines = np.flatnonzero(data == 10)
+    lengths = np.diff(newlines, prepend=-1) - 1
+    letters = data[data != 10]
+    starts = _message_layout(lengths)
+    message = np.repeat(np.arange(len(lengths)), lengths)
+
+    inserts = np.empty(0, dtype=np.intp)
+    added = np.zeros(len(lengths), dtype=np.intp)
+    if encrypt and len(letters) > 1:
+        doubles = np.flatnonzero((letters[:-1] == letters[1:]) & (message[:-1] == message[1:]))
+        if len(doubles):
+            owner = message[doubles]
+            relative = doubles - starts[owner]
+            parity = np.empty(len(doubles), dtype=np.intp)
+            parity[0] = 0
+            parity[1:] = 1 - relative[:-1] % 2
+            parity[1:][owner[1:] != owner[:-1]] = 0
+            chosen = relative % 2 == parity
+            inserts = doubles[chosen] + 1
+            added = np.bincount(owner[chosen], minlength=len(lengths))
+    odd = (lengths + added) % 2 == 1
+    inserts = np.concatenate([inserts, (starts + lengths)[odd]])
+    if len(inserts):
+        letters = np.insert(letters, inserts, ord('X'))
+    lengths = lengths + added + odd
+
+    index = np.zeros(256, dtype=np.intp)
+    index[np.frombuffer(ALPHABET.encode('ascii'), dtype=np.uint8)] = np.arange(25)
+    pairs = index[letters[0::2]] * 25 + index[letters[1::2]]
+    out = tables[0 if encrypt else 1][pairs]
+    if len(out) and not out.all():
+        pair = int(pairs[np.flatnonzero(~out.all(axis=1))[0]])
+        a, b = ALPHABET[pair // 25], ALPHABET[pair % 25]
+        raise KeyError(a if a not in key else b)
+    out = out.ravel()
+
+    if not encrypt:
+        # remove_fillers_from_decrypted por mensaje: la X de un par se quita si
+        # el par siguiente del mismo mensaje empieza con la misma letra, y
+        # luego una X final
+        ends = _message_layout(lengths) + lengths
+        keep = np.ones(len(out), dtype=bool)
+        first, second = out[0::2], out[1::2]
+        same_message = np.ones(len(first), dtype=bool)
+        same_message[ends[lengths > 0] // 2 - 1] = False
+        keep[1:-2:2] = ~((second[:-1] == ord('X')) & (first[1:] == first[:-1]) & same_message[:-1])
+        last = ends[lengths > 0] - 1
+        keep[last[out[last] == ord('X')]] = False
+        lengths = np.bincount(np.repeat(np.arange(len(lengths)), lengths), weights=keep,
+                              minlength=len(lengths)).astype(np.intp)
+        out = out[keep]
+
+    return np.insert(out, _message_layout(lengths) + lengths, 10).tobytes()
+
+def playfair_stream(src, dst, letter_to_pos, pos_to_letter, decrypt=False, batch_lines=BATCH_LINES):
+    """
+    Cifra/descifra un archivo de mensajes (uno por línea) hacia otro, por lotes
+    de `batch_lines` líneas y con memoria acotada. `src` y `dst` son archivos
+    binarios. La cuadrícula y sus tablas se calculan una sola vez. Devuelve
+    la cantidad de mensajes procesados.
+    """
+    key = grid_key(pos_to_letter)
+    total = 0
+    while True:
+        lines = list(itertools.islice(src, batch_lines))
+        if not lines:
+            break
+        result = playfair_batch(b''.join(lines), key, encrypt=not decrypt)
+        if result is None:
+            # Sin NumPy o con texto no ASCII: mensaje por mensaje
+            out = []
+            for line in lines:
+                text = line.decode('utf-8', errors='replace')
+                if decrypt:
+                    out.append(playfair_decrypt(text, letter_to_pos, pos_to_letter)[1])
+                else:
+                    out.append(playfair_encrypt(text, letter_to_pos, pos_to_letter)[0])
+            result = ('\n'.join(out) + '\n').encode('utf-8')
+        dst.write(result)
+        total += len(lines)
+    return total
+
+def interactive():
+    """Modo interactivo (sin argumentos): pide la opción, el mensaje y la cuadrícula fila por fila."""
+    print("Programa de cifrado y decifrado Playfair")
+
+    x=0
+    men=""
+    ver=0
+    llave=[]
+    fila=""
+
+    #ingreso de la opción Encriptación(1) o desencriptación(2)
+    while x != 1 and x != 2:
+        x = int(input("Seleccione la opción que desea:\n1) Cifrar un mensaje\n2)Decifrar un mensaje\n"))
+        if x != 1 and x != 2:
+            print("Opcion invalida")
+
+    #ingreso del mensaje en men, solo se aceptan letras mayusculas
+    men = input("Ingrese el mensaje a cifrar en mayusculas: ")
+    while ver == 0:
+        if any(not c.isupper() for c in men):
+            men = input("Mensaje invalido, solo puede ingresar letras mayusculas. Intente de nuevo: ")
+        else:
             ver=1
-            print("Solo puedes ingresar letras mayusculas sin espacios")
+
+    #Ingreso de la llave (matriz 5x5), se almacena cada fila como un elemento de la lista llave
+    print("Ingrese la llave (matriz 5x5) fila por fila (Solo letras mayusculas sin espacios)")
+    for i in range(5):
+        while len(fila) != 5 or ver==1:
+            fila=input(f"Ingrese la fila {i+1}: ")
+            if len(fila) != 5:
+                print("Cada fila debe tener 5 letras únicamente")
+            if any(not c.isupper() for c in fila):
+                ver=1
+                print("Solo puedes ingresar letras mayusculas sin espacios")
+            else:
+                ver=0
+
+        llave.append(fila)
+        fila=""
+
+    grid, letter_to_pos, pos_to_letter = build_grid_from_input(llave)
+    print("\nCuadrícula Playfair (I/J combinadas como I):")
+    for r in range(5):
+        print(' '.join(grid[r]))
+    print()
+
+    #Encriptación
+    if x == 1:
+        cipher_text, cipher_pairs = playfair_encrypt(men, letter_to_pos, pos_to_letter)
+        # imprimimos agrupado por pares para mayor claridad
+        grouped = ' '.join(cipher_pairs)
+        print("Texto plano (preprocesado):", preprocess_text(men))
+        print("Bigramas (usados para cifrar):", ' '.join(make_bigrams(preprocess_text(men))))
+        print("Texto cifrado (por pares):", grouped)
+        print("Texto cifrado (continuo):", cipher_text)
+
+    #Desencriptación
+    elif x == 2:
+        plain_raw, plain_cleaned, plain_pairs = playfair_decrypt(men, letter_to_pos, pos_to_letter)
+        print("Texto cifrado (preprocesado):", preprocess_text(men))
+        print("Bigramas (cifradas):", ' '.join([men[i:i+2] for i in range(0, len(preprocess_text(men)), 2)]))
+        print("Descifrado (raw, sin limpiar):", plain_raw)
+        print("Descifrado (limpio, sin rellenos):", plain_cleaned)
+
+    x=input("Presione cualquier tecla para finalizar")
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description='Cifrado/Descifrado Playfair. Sin argumentos se ejecuta en modo interactivo.')
+    modes = parser.add_subparsers(dest='mode', required=True, help="'enc' para cifrar, 'dec' para descifrar")
+    for mode in ('enc', 'dec'):
+        sub = modes.add_parser(mode)
+        key = sub.add_mutually_exclusive_group(required=True)
+        key.add_argument('--keyword', help='Palabra clave (letras sin repetir y luego el resto del alfabeto)')
+        key.add_argument('--grid', help="Cuadrícula explícita: 25 letras por filas ('PLAYF IREXM BCDGH KNOQS TUVWZ')")
+        sub.add_argument('text', nargs='?',
+                         help='Mensaje (proteger con comillas si contiene espacios). Si se omite, se procesa '
+                              '--in o la entrada estándar en modo masivo: un mensaje por línea')
+        sub.add_argument('--in', dest='input', help="Archivo de mensajes ('-' o sin indicar: entrada estándar)")
+        sub.add_argument('--out', dest='output', help="Archivo de salida ('-' o sin indicar: salida estándar)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        interactive()
+        return
+    args = parse_args(argv)
+
+    try:
+        rows = keyword_rows(args.keyword) if args.keyword is not None else grid_rows(args.grid)
+    except ValueError as e:
+        print('Error:', e)
+        sys.exit(1)
+    _, letter_to_pos, pos_to_letter = build_grid_from_input(rows)
+
+    try:
+        if args.text is not None and args.input is None and args.output is None:
+            if args.mode == 'enc':
+                print(playfair_encrypt(args.text, letter_to_pos, pos_to_letter)[0])
+            else:
+                print(playfair_decrypt(args.text, letter_to_pos, pos_to_letter)[1])
+            return
+
+        # Modo masivo: cada línea es un mensaje; la cuadrícula se arma una sola vez
+        if args.text is not None:
+            src = io.BytesIO(args.text.encode('utf-8'))
+        elif args.input is None or args.input == '-':
+            src = sys.stdin.buffer
         else:
-            ver=0
-            
-    llave.append(fila)
-    fila=""
+            src = open(args.input, 'rb')
+        dst = sys.stdout.buffer if args.output is None or args.output == '-' else open(args.output, 'wb')
+        try:
+            playfair_stream(src, dst, letter_to_pos, pos_to_letter, decrypt=(args.mode == 'dec'))
+        finally:
+            if src is not sys.stdin.buffer:
+                src.close()
+            if dst is not sys.stdout.buffer:
+                dst.close()
+            else:
+                dst.flush()
+    except KeyError as e:
+        print(f'Error: la letra {e} no está en la cuadrícula', file=sys.stderr)
+        sys.exit(1)
 
-grid, letter_to_pos, pos_to_letter = build_grid_from_input(llave)
-print("\nCuadrícula Playfair (I/J combinadas como I):")
-for r in range(5):
-    print(' '.join(grid[r]))
-print()
-
-#Encriptación
-if x == 1:
-    cipher_text, cipher_pairs = playfair_encrypt(men, letter_to_pos, pos_to_letter)
-    # imprimimos agrupado por pares para mayor claridad
-    grouped = ' '.join(cipher_pairs)
-    print("Texto plano (preprocesado):", preprocess_text(men))
-    print("Bigramas (usados para cifrar):", ' '.join(make_bigrams(preprocess_text(men))))
-    print("Texto cifrado (por pares):", grouped)
-    print("Texto cifrado (continuo):", cipher_text)
-
-#Desencriptación
-elif x == 2:
-    plain_raw, plain_cleaned, plain_pairs = playfair_decrypt(men, letter_to_pos, pos_to_letter)
-    print("Texto cifrado (preprocesado):", preprocess_text(men))
-    print("Bigramas (cifradas):", ' '.join([men[i:i+2] for i in range(0, len(preprocess_text(men)), 2)]))
-    print("Descifrado (raw, sin limpiar):", plain_raw)
-    print("Descifrado (limpio, sin rellenos):", plain_cleaned)
-
-x=input("Presione cualquier tecla para finalizar")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Criptoanalisis_Playfair.py
+
+Ataque sólo con texto cifrado al cifrado Playfair por recocido simulado.
+
+- La cuadrícula candidata es un array de 25 letras (índices de ALPHABET) y su
+  inverso `pos` (letra -> casilla). No se arman los dicts letter_to_pos /
+  pos_to_letter: el descifrado de un par depende sólo de las casillas de sus
+  letras, así que la tabla casilla-par -> casilla-par se calcula una vez con
+  process_pair y descifrar es grid[DEC_POS[pos[a] * 25 + pos[b]]].
+- Puntuación: suma de log-probabilidades de cuadrigramas del texto descifrado
+  (sin quitar los rellenos), estimadas sobre Corpus/ingles.txt con
+  interpolación hacia trigramas, bigramas y letras sueltas.
+- Mutaciones: intercambio de dos letras (la mayoría), de dos filas o dos
+  columnas, e inversión del orden de las filas, de las columnas o de toda la
+  cuadrícula.
+- Cadenas de recocido independientes en paralelo (una por núcleo). Si una
+  cadena alcanza `umbral` (puntuación media por cuadrigrama) avisa a las
+  demás con un Event compartido y todas terminan.
+
+Uso:
+    python Criptoanalisis_Playfair.py "BMODZBXDNABEKUDMUIXMMOUVIF..." --cadenas 4 --umbral -3.2
+
+Con Corpus/ingles.txt un texto en inglés bien descifrado puntúa entre -2.5 y
+-3 por cuadrigrama y los óptimos locales alrededor de -5; hacen falta unas
+500 letras de texto cifrado.
+"""
+
+import argparse
+import functools
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    print("Falta la librería 'numpy'. Instálela con: pip install numpy")
+    raise
+
+from Cifrado_Playfair import ALPHABET, digram_tables, preprocess_text, remove_fillers_from_decrypted
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Corpus', 'ingles.txt')
+
+# Cada cuántas iteraciones una cadena consulta si otra ya alcanzó el umbral
+INTERVALO_AVISO = 1000
+
+_stop = None
+
+
+def letter_indices(text):
+    """Índices 0..24 (ALPHABET) de las letras del texto, con J->I."""
+    s = preprocess_text(text)
+    return np.array([ALPHABET.index(ch) for ch in s if ch in ALPHABET], dtype=np.intp)
+
+
+@functools.lru_cache(maxsize=None)
+def quadgram_table(corpus=CORPUS):
+    """Tabla (aplanada, 25^4) de log P(d | a, b, c) para cada cuadrigrama abcd.
+
+    El corpus es chico para 390.625 cuadrigramas, así que cada orden se
+    interpola con el anterior (trigramas, bigramas y letras sueltas).
+    """
+    with open(corpus, encoding='utf-8') as f:
+        letters = letter_indices(f.read())
+    p = np.bincount(letters, minlength=25) + 1.0
+    p /= p.sum()
+    for n in range(2, 5):
+        grams = np.zeros(len(letters) - n + 1, dtype=np.intp)
+        for k in range(n):
+            grams = grams * 25 + letters[k:len(letters) - n + 1 + k]
+        counts = np.bincount(grams, minlength=25 ** n).reshape(-1, 25)
+        # P(última | contexto) = (cuenta + P del orden anterior) / (total del contexto + 1)
+        p = (counts + np.tile(p.reshape(-1, 25), (25, 1))) / (counts.sum(axis=1, keepdims=True) + 1)
+    return np.log(p).astype(np.float32).ravel()
+
+
+@functools.lru_cache(maxsize=None)
+def decrypt_positions():
+    """DEC_POS[i * 25 + j]: casillas (i', j') del par descifrado de las casillas (i, j).
+
+    Se obtiene de process_pair sobre la cuadrícula ALPHABET, donde la letra
+    de índice k ocupa la casilla k. Los pares de una misma casilla (que no
+    aparecen en un cifrado válido) siguen la regla de misma fila.
+    """
+    table = digram_tables(ALPHABET)[1]
+    out = np.empty((625, 2), dtype=np.intp)
+    for i, a in enumerate(ALPHABET):
+        for j, b in enumerate(ALPHABET):
+            pair = table[a + b]
+            out[i * 25 + j] = ALPHABET.index(pair[0]), ALPHABET.index(pair[1])
+    return out
+
+
+class _Decryptor:
+    """Descifra y puntúa un texto cifrado fijo para cuadrículas candidatas."""
+
+    def __init__(self, ciphertext, table):
+        c = np.asarray(ciphertext, dtype=np.intp)
+        if len(c) % 2:
+            c = np.append(c, ALPHABET.index('X'))
+        self.first, self.second = c[0::2], c[1::2]
+        self.table = table
+        self.dec_pos = decrypt_positions()
+        self.pos = np.empty(25, dtype=np.intp)
+        self.arange = np.arange(25)
+        self.quadgrams = max(len(c) - 3, 1)
+
+    def decrypt(self, grid):
+        pos = self.pos
+        pos[grid] = self.arange
+        return grid[self.dec_pos[pos[self.first] * 25 + pos[self.second]]].ravel()
+
+    def score(self, grid):
+        p = self.decrypt(grid)
+        return float(self.table[((p[:-3] * 25 + p[1:-2]) * 25 + p[2:-1]) * 25 + p[3:]].sum())
+
+
+def mutate(grid, rng):
+    """Copia de la cuadrícula con una mutación al azar (`rng`: random.Random, más rápido por llamada)."""
+    g = grid.copy()
+    r = rng.random()
+    if r < 0.90:
+        i = rng.randrange(25)
+        j = rng.randrange(24)
+        j += j >= i
+        g[i], g[j] = g[j], g[i]
+        return g
+    square = g.reshape(5, 5)
+    i = rng.randrange(5)
+    j = rng.randrange(4)
+    j += j >= i
+    if r < 0.94:
+        square[[i, j]] = square[[j, i]]
+    elif r < 0.98:
+        square[:, [i, j]] = square[:, [j, i]]
+    elif r < 0.99:
+        square[:] = square[::-1].copy()
+    elif r < 0.995:
+        square[:] = square[:, ::-1].copy()
+    else:
+        g = g[::-1].copy()
+    return g
+
+
+def anneal(ciphertext, iterations=400000, temperature=None, seed=None, threshold=None, corpus=CORPUS):
+    """Una cadena de recocido simulado desde una cuadrícula aleatoria.
+
+    La temperatura baja linealmente desde `temperature` hasta la mitad en
+    `iterations` pasos. Por defecto es 0.035 por cuadrigrama: con menos la
+    cadena se congela en un óptimo local y con más no se acerca a la
+    solución; en ese rango la clave suele aparecer de golpe. Si `threshold` se
+    indica, la cadena se detiene al alcanzar esa puntuación media por
+    cuadrigrama (y avisa a las demás cadenas del pool). Devuelve un dict con
+    la cuadrícula (25 índices), la puntuación media por cuadrigrama, los
+    descifrados realizados y los segundos.
+    """
+    start = time.perf_counter()
+    decryptor = _Decryptor(ciphertext, quadgram_table(corpus))
+    rng = np.random.default_rng(seed)
+    moves = random.Random(seed)
+    if temperature is None:
+        temperature = 0.035 * decryptor.quadgrams
+    limit = None if threshold is None else threshold * decryptor.quadgrams
+
+    grid = rng.permutation(25)
+    current = decryptor.score(grid)
+    best, best_grid = current, grid.copy()
+    # Umbrales de aceptación precalculados: se acepta si delta > T * log(u)
+    logs = np.log(rng.random(iterations))
+    done = 0
+    for step in range(iterations):
+        if step % INTERVALO_AVISO == 0 and _stop is not None and _stop.is_set():
+            break
+        candidate = mutate(grid, moves)
+        value = decryptor.score(candidate)
+        done += 1
+        t = temperature * (1 - 0.5 * step / iterations)
+        if value >= current or value - current > t * logs[step]:
+            grid, current = candidate, value
+            if current > best:
+                best, best_grid = current, grid.copy()
+                if limit is not None and best >= limit:
+                    if _stop is not None:
+                        _stop.set()
+                    break
+    return {
+        'grid': best_grid,
+        'score': best / decryptor.quadgrams,
+        'decrypts': done + 1,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _init_worker(stop):
+    global _stop
+    _stop = stop
+
+
+def _anneal_job(args):
+    return anneal(*args)
+
+
+def crack_playfair(ciphertext, chains=None, iterations=400000, temperature=None, seed=0, threshold=None,
+                   workers=None, corpus=CORPUS):
+    """Ejecuta `chains` cadenas de recocido en paralelo y devuelve (mejor, todas).
+
+    `ciphertext` es texto (se ignoran las no letras). Por defecto hay una
+    cadena por núcleo. `mejor` es el resultado de mayor puntuación (ver
+    `anneal`) con, además, 'rows' (la cuadrícula como 5 filas de texto).
+    """
+    letters = letter_indices(ciphertext)
+    if len(letters) < 8:
+        raise ValueError("El texto cifrado es demasiado corto")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chains is None:
+        chains = workers
+    jobs = [(letters, iterations, temperature, seed + i, threshold, corpus) for i in range(chains)]
+    stop = multiprocessing.Event()
+    if workers > 1 and chains > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, chains), initializer=_init_worker,
+                                 initargs=(stop,)) as executor:
+            results = list(executor.map(_anneal_job, jobs))
+    else:
+        _init_worker(stop)
+        try:
+            results = [_anneal_job(job) for job in jobs]
+        finally:
+            _init_worker(None)
+    best = max(results, key=lambda r: r['score'])
+    key = ''.join(ALPHABET[i] for i in best['grid'])
+    best['rows'] = [key[i:i+5] for i in range(0, 25, 5)]
+    return best, results
+
+
+def decrypt_with_grid(ciphertext, grid):
+    """(texto descifrado sin limpiar, texto sin rellenos) con una cuadrícula de 25 índices."""
+    plain = _Decryptor(letter_indices(ciphertext), None).decrypt(np.asarray(grid, dtype=np.intp))
+    raw = ''.join(ALPHABET[i] for i in plain)
+    return raw, remove_fillers_from_decrypted(raw)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Criptoanálisis del cifrado Playfair (sólo texto cifrado)')
+    parser.add_argument('text', help='Texto cifrado')
+    parser.add_argument('--cadenas', type=int, default=None, help='Cadenas de recocido. Default=núcleos')
+    parser.add_argument('--iteraciones', type=int, default=400000, help='Iteraciones por cadena. Default=400000')
+    parser.add_argument('--temperatura', type=float, default=None, help='Temperatura inicial. Default=0.035 por cuadrigrama')
+    parser.add_argument('--umbral', type=float, default=None, help='Puntuación media por cuadrigrama para detenerse')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos. Default=núcleos')
+    parser.add_argument('--semilla', type=int, default=0, help='Semilla de la primera cadena. Default=0')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    try:
+        best, results = crack_playfair(args.text, args.cadenas, args.iteraciones, args.temperatura, args.semilla,
+                                       args.umbral, args.workers)
+    except ValueError as e:
+        print('Error:', e)
+        raise SystemExit(1)
+    elapsed = time.perf_counter() - start
+    decrypts = sum(r['decrypts'] for r in results)
+    raw, cleaned = decrypt_with_grid(args.text, best['grid'])
+    print("Cuadrícula:", ' '.join(best['rows']))
+    print(f"Puntuación media por cuadrigrama: {best['score']:.4f}")
+    print("Descifrado (raw, sin limpiar):", raw)
+    print("Descifrado (limpio, sin rellenos):", cleaned)
+    print(f"Descifrados: {decrypts:,} ({decrypts / sum(r['seconds'] for r in results):,.0f}/s por proceso) | "
+          f"tiempo total: {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,33 @@
 Ejemplos:
     python Cifrado_Vigenere.py enc miClave 26 "Hola, mundo!"
     python Cifrado_Vigenere.py dec miClave 26 "Twnl, mprpw!"
+    python Cifrado_Vigenere.py crack 26 "<texto cifrado largo>" --top 3
 
 """
 import sys
 import argparse
+import io
+import math
+import os
 import string
+from concurrent.futures import ProcessPoolExecutor
 
 ALPHABET = string.ascii_uppercase
 
+# Longitud mínima del texto para usar el motor NumPy (por debajo, el bucle
+# de Python es más rápido que preparar los arrays)
+NUMPY_MIN_LENGTH = 1024
+# Caracteres leídos por bloque en el modo --in/--out/stdin
+STREAM_CHUNK = 1 << 20
+
+# Frecuencias relativas (%) de la A a la Z usadas por el modo crack
+LETTER_FREQUENCIES = {
+    'en': [8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+           6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074],
+    'es': [11.525, 2.215, 4.019, 5.010, 12.181, 0.692, 1.768, 0.703, 6.247, 0.493, 0.011, 4.967, 3.157,
+           6.712, 8.683, 2.510, 0.877, 6.871, 7.977, 4.632, 2.927, 1.138, 0.017, 0.215, 1.008, 0.467],
+}
+
 
 def sanitize_key(key: str) -> str:
     """Devuelve sólo las letras de la clave, en mayúsculas."""
@@ -30,13 +49,93 @@ def index_to_char(idx: int, is_upper: bool) -> str:
     return chr(base + idx)
 
 
-def encrypt_vigenere(key: str, t: int, plaintext: str) -> str:
+def count_letters(text: str) -> int:
+    """Cantidad de caracteres alfabéticos (lo que avanza la posición `j` de la clave)."""
+    if text.isascii():
+        data = text.encode('ascii')
+        return len(data) - len(data.translate(None, string.ascii_letters.encode()))
+    return sum(map(str.isalpha, text))
+
+
+def vigenere_numpy(key: str, t: int, text: str, decrypt: bool = False, offset: int = 0):
+    """Motor vectorizado equivalente a encrypt_vigenere / decrypt_vigenere.
+
+    Sólo admite texto ASCII: convierte el texto a un array uint8 una vez. La
+    fase de cada byte es `offset` más la cantidad de letras anteriores, módulo
+    len(key) (`j` sólo avanza con letras, igual que en la versión original);
+    se calcula una sola vez para todo el texto y con ella se indexa el array
+    de desplazamientos de la clave. Las letras conservan mayúscula/minúscula y
+    el resto de los bytes no cambia. Devuelve None si NumPy no está instalado
+    o el texto no es ASCII, para que el llamador use la versión original.
+    """
+    if not text.isascii():
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    shifts = np.array([(-char_index(k, t) if decrypt else char_index(k, t)) % t for k in key], dtype=np.uint8)
+    data = text.encode('ascii')
+    n = len(data)
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # Índice 0..25 de cada letra ((byte | 0x20) - 'a'); el resto queda >= 26
+    index = np.bitwise_or(buf, 0x20)
+    index -= ord('a')
+    # 1 en cada letra y 0 en el resto, rellenado con ceros hasta un múltiplo de 8
+    mask = np.zeros(-(-n // 8) * 8, dtype=np.uint8)
+    np.less(index, 26, out=mask[:n])
+
+    if len(key) <= 248:
+        # Suma de prefijo por palabras de 8 bytes: el byte i (little-endian) de
+        # w * 0x0101010101010101 es la suma de los bytes 0..i de w, sin
+        # acarreos porque nunca pasa de 8. Así el cumsum recorre n / 8 palabras.
+        ones = np.uint64(0x0101010101010101)
+        words = mask.view('<u8')
+        phases = bytearray(len(mask))
+        lanes = np.frombuffer(phases, dtype='<u8')
+        np.multiply(words, ones, out=lanes)
+        base = np.zeros(len(words), dtype=np.uint32 if n < 1 << 32 else np.uint64)
+        np.cumsum(lanes[:-1] >> np.uint64(56), dtype=base.dtype, out=base[1:])
+        base += offset % len(key)
+        base %= len(key)
+        lanes -= words
+        lanes += base * ones
+        # Cada byte queda con su fase más un resto < 8: en lugar de un módulo
+        # por byte, la tabla de desplazamientos repite las primeras fases.
+        table = np.zeros(256, dtype=np.uint8)
+        table[:len(key) + 7] = shifts[np.arange(len(key) + 7) % len(key)]
+        shift = np.frombuffer(phases.translate(table.tobytes()), dtype=np.uint8)[:n]
+    else:
+        phases = np.cumsum(mask[:n], dtype=np.intp)
+        phases -= mask[:n]
+        phases += offset % len(key)
+        phases %= len(key)
+        shift = shifts.take(phases)
+
+    # (índice + desplazamiento) % t: ambos son < t, basta restar t una vez
+    shift += index % np.uint8(t) if t < 26 else index
+    np.minimum(shift, shift - np.uint8(t), out=shift)
+    # byte - índice + resultado: 'A'/'a' + resultado en las letras; el resto no cambia
+    shift -= index
+    shift *= mask[:n]
+    shift += buf
+    return str(memoryview(shift), 'ascii')
+
+
+def encrypt_vigenere(key: str, t: int, plaintext: str, offset: int = 0) -> str:
+    """Cifra `plaintext`; `offset` es la posición inicial en la clave (para cifrar por bloques)."""
     if not key:
         raise ValueError('La clave no puede estar vacía (después de quitar caracteres no alfabéticos).')
 
+    if len(plaintext) >= NUMPY_MIN_LENGTH:
+        result = vigenere_numpy(key, t, plaintext, offset=offset)
+        if result is not None:
+            return result
+
     key_idx = [char_index(k, t) for k in key]
     out = []
-    j = 0  # posición en la clave (sólo avanza sobre letras del texto)
+    j = offset  # posición en la clave (sólo avanza sobre letras del texto)
 
     for ch in plaintext:
         if ch.isalpha():
@@ -55,13 +154,19 @@ def encrypt_vigenere(key: str, t: int, plaintext: str) -> str:
     return ''.join(out)
 
 
-def decrypt_vigenere(key: str, t: int, ciphertext: str) -> str:
+def decrypt_vigenere(key: str, t: int, ciphertext: str, offset: int = 0) -> str:
+    """Descifra `ciphertext`; `offset` es la posición inicial en la clave (para descifrar por bloques)."""
     if not key:
         raise ValueError('La clave no puede estar vacía (después de quitar caracteres no alfabéticos).')
 
+    if len(ciphertext) >= NUMPY_MIN_LENGTH:
+        result = vigenere_numpy(key, t, ciphertext, decrypt=True, offset=offset)
+        if result is not None:
+            return result
+
     key_idx = [char_index(k, t) for k in key]
     out = []
-    j = 0
+    j = offset
 
     for ch in ciphertext:
         if ch.isalpha():
@@ -77,19 +182,194 @@ def decrypt_vigenere(key: str, t: int, ciphertext: str) -> str:
     return ''.join(out)
 
 
+def vigenere_stream(key: str, t: int, src, dst, decrypt: bool = False, chunk_size: int = STREAM_CHUNK) -> int:
+    """Cifra/descifra de un archivo de texto a otro por bloques, con memoria constante.
+
+    La posición `j` de la clave se arrastra entre bloques, así que el
+    resultado es idéntico a procesar todo el texto de una vez. Devuelve la
+    cantidad de caracteres procesados.
+    """
+    func = decrypt_vigenere if decrypt else encrypt_vigenere
+    j = 0
+    total = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        dst.write(func(key, t, chunk, offset=j))
+        j += count_letters(chunk)
+        total += len(chunk)
+    return total
+
+
+def open_text(path, mode):
+    """Abre `path` (o stdin/stdout si es None o '-') como texto UTF-8 sin traducir saltos de línea.
+
+    Los bytes que no son UTF-8 válido se conservan tal cual (surrogateescape).
+    """
+    if path is None or path == '-':
+        stream = sys.stdin.buffer if mode == 'r' else sys.stdout.buffer
+        return io.TextIOWrapper(stream, encoding='utf-8', errors='surrogateescape', newline='')
+    return open(path, mode, encoding='utf-8', errors='surrogateescape', newline='')
+
+
+def folded_frequencies(t: int, language: str = 'en') -> list:
+    """Frecuencias del idioma plegadas a los t índices de `char_index` ((letra - 'A') % t)."""
+    folded = [0.0] * t
+    for i, freq in enumerate(LETTER_FREQUENCIES[language]):
+        folded[i % t] += freq
+    total = sum(folded)
+    return [freq / total for freq in folded]
+
+
+def letter_indices(text: str, t: int) -> bytes:
+    """Índices 0..t-1 de las letras del texto, en orden (la clave sólo avanza con letras)."""
+    return bytes(char_index(ch, t) for ch in text if ch.isalpha())
+
+
+def kasiski_votes(indices: bytes, max_len: int, ngram: int = 3) -> list:
+    """Test de Kasiski: votes[L] = cantidad de distancias entre n-gramas repetidos divisibles por L."""
+    votes = [0] * (max_len + 1)
+    last_seen = {}
+    for pos in range(len(indices) - ngram + 1):
+        gram = indices[pos:pos + ngram]
+        if gram in last_seen:
+            distance = pos - last_seen[gram]
+            for length in range(2, max_len + 1):
+                if distance % length == 0:
+                    votes[length] += 1
+        last_seen[gram] = pos
+    return votes
+
+
+def index_of_coincidence(indices: bytes, length: int, t: int) -> float:
+    """Índice de coincidencia medio de las `length` columnas del texto."""
+    total = 0.0
+    for col in range(length):
+        column = indices[col::length]
+        n = len(column)
+        if n < 2:
+            continue
+        total += sum(c * (c - 1) for c in (column.count(i) for i in range(t))) / (n * (n - 1))
+    return total / length
+
+
+def candidate_lengths(indices: bytes, t: int, max_len: int, count: int, language: str = 'en') -> list:
+    """Longitudes de clave más probables combinando el índice de coincidencia y Kasiski.
+
+    El IC de cada longitud se normaliza entre el de un texto aleatorio (1/t) y
+    el del idioma plegado a t; los votos de Kasiski se normalizan por el máximo.
+    """
+    max_len = max(1, min(max_len, len(indices) // 2))
+    expected_ic = sum(f * f for f in folded_frequencies(t, language))
+    random_ic = 1 / t
+    votes = kasiski_votes(indices, max_len)
+    top_votes = max(votes) or 1
+    scores = []
+    for length in range(1, max_len + 1):
+        ic = index_of_coincidence(indices, length, t)
+        ic_score = (ic - random_ic) / (expected_ic - random_ic) if expected_ic > random_ic else 0.0
+        scores.append((ic_score + 0.5 * votes[length] / top_votes, length))
+    scores.sort(key=lambda item: (-item[0], item[1]))
+    return [length for _, length in scores[:count]]
+
+
+def _solve_length(job):
+    """Resuelve cada columna de una longitud de clave por separado (trabajo del pool).
+
+    Para cada columna prueba los t desplazamientos y se queda con el de mayor
+    log-verosimilitud según las frecuencias plegadas. Cada letra de la clave
+    se penaliza con log(t) (lo que cuesta describirla) para que las longitudes
+    múltiplo de la real no ganen sólo por ajustarse mejor a textos cortos.
+    Devuelve (longitud, índices de la clave, puntuación media por letra).
+    """
+    indices, length, t, log_freqs = job
+    key_idx = []
+    total = 0.0
+    for col in range(length):
+        column = indices[col::length]
+        counts = [column.count(i) for i in range(t)]
+        best_score, best_shift = max(
+            (sum(counts[c] * log_freqs[(c - shift) % t] for c in range(t)), shift) for shift in range(t)
+        )
+        key_idx.append(best_shift)
+        total += best_score - math.log(t)
+    return length, key_idx, total / max(len(indices), 1)
+
+
+def _shortest_period(key: str) -> str:
+    """Reduce una clave que es repetición de otra más corta ('ABAB' -> 'AB')."""
+    for length in range(1, len(key)):
+        if len(key) % length == 0 and key[:length] * (len(key) // length) == key:
+            return key[:length]
+    return key
+
+
+def crack_vigenere(ciphertext: str, t: int, max_len: int = 20, top: int = 5, candidates: int = 8,
+                   workers: int = None, language: str = 'en') -> list:
+    """Recupera la clave de un texto cifrado con encrypt_vigenere sin conocerla.
+
+    Estima las longitudes de clave con Kasiski y el índice de coincidencia,
+    resuelve cada longitud candidata (columna a columna) en un pool de procesos
+    y devuelve hasta `top` tuplas (clave, puntuación media por letra)
+    ordenadas de mejor a peor. Las claves usan 'A'.. para los índices 0..t-1.
+    """
+    if t <= 0 or t > 26:
+        raise ValueError('t debe ser un entero entre 1 y 26 (inclusive).')
+    indices = letter_indices(ciphertext, t)
+    if not indices:
+        raise ValueError('El texto cifrado no contiene letras.')
+
+    log_freqs = [math.log(max(f, 1e-6)) for f in folded_frequencies(t, language)]
+    lengths = candidate_lengths(indices, t, max_len, candidates, language)
+    jobs = [(indices, length, t, log_freqs) for length in lengths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            solved = list(executor.map(_solve_length, jobs))
+    else:
+        solved = [_solve_length(job) for job in jobs]
+
+    best = {}
+    for length, key_idx, score in solved:
+        key = _shortest_period(''.join(ALPHABET[k] for k in key_idx))
+        if key not in best or score > best[key]:
+            best[key] = score
+    ranking = sorted(best.items(), key=lambda item: (-item[1], len(item[0])))
+    return ranking[:top]
+
+
 def parse_args(argv):
     parser = argparse.ArgumentParser(description='Cifrado/Descifrado Vigenère (línea de comandos)')
-    parser.add_argument('mode', choices=['enc', 'dec'], help="'enc' para cifrar, 'dec' para descifrar")
-    parser.add_argument('key', help='Clave alfabética (se ignorarán caracteres no alfabéticos)')
-    parser.add_argument('t', type=int, help='Parámetro entero t (típicamente 26)')
-    parser.add_argument('text', help='Texto a cifrar/descifrar (proteger con comillas si contiene espacios)')
+    modes = parser.add_subparsers(dest='mode', required=True,
+                                  help="'enc' para cifrar, 'dec' para descifrar, 'crack' para recuperar la clave")
+    for mode in ('enc', 'dec'):
+        sub = modes.add_parser(mode)
+        sub.add_argument('key', help='Clave alfabética (se ignorarán caracteres no alfabéticos)')
+        sub.add_argument('t', type=int, help='Parámetro entero t (típicamente 26)')
+        sub.add_argument('text', nargs='?',
+                         help='Texto a cifrar/descifrar (proteger con comillas si contiene espacios). '
+                              'Si se omite, se lee de --in o de la entrada estándar')
+        sub.add_argument('--in', dest='input', help="Archivo de entrada ('-' o sin indicar: entrada estándar)")
+        sub.add_argument('--out', dest='output', help="Archivo de salida ('-' o sin indicar: salida estándar)")
+    crack = modes.add_parser('crack')
+    crack.add_argument('t', type=int, help='Parámetro entero t usado al cifrar (típicamente 26)')
+    crack.add_argument('text', nargs='?',
+                       help='Texto cifrado (proteger con comillas si contiene espacios). '
+                            'Si se omite, se lee de --in o de la entrada estándar')
+    crack.add_argument('--in', dest='input', help="Archivo con el texto cifrado ('-': entrada estándar)")
+    crack.add_argument('--top', type=int, default=5, help='Cantidad de claves a mostrar. Default=5')
+    crack.add_argument('--max-len', type=int, default=20, help='Longitud máxima de clave a considerar. Default=20')
+    crack.add_argument('--candidates', type=int, default=8, help='Longitudes candidatas a resolver. Default=8')
+    crack.add_argument('--workers', type=int, default=None, help='Procesos para resolver las longitudes. Default=núcleos')
+    crack.add_argument('--lang', choices=sorted(LETTER_FREQUENCIES), default='en', help='Idioma del texto plano. Default=en')
     return parser.parse_args(argv)
 
 
 def main(argv=None):
     args = parse_args(argv)
 
-    key = sanitize_key(args.key)
     t = args.t
     text = args.text
 
@@ -97,10 +377,43 @@ def main(argv=None):
         print('Error: t debe ser un entero entre 1 y 26 (inclusive).')
         sys.exit(1)
 
+    if args.mode == 'crack':
+        if text is None:
+            with open_text(args.input, 'r') as src:
+                text = src.read()
+        try:
+            ranking = crack_vigenere(text, t, args.max_len, args.top, args.candidates, args.workers, args.lang)
+        except ValueError as e:
+            print('Error:', e)
+            sys.exit(1)
+        for key, score in ranking:
+            preview = ' '.join(decrypt_vigenere(key, t, text[:200]).split())[:60]
+            print(f'{key:<20} {score:8.4f}  {preview}')
+        return
+
+    key = sanitize_key(args.key)
+
     if not key:
         print('Error: la clave debe contener al menos una letra (A-Z).')
         sys.exit(1)
 
+    if text is None or args.input or args.output:
+        # Modo streaming: --in/--out o entrada/salida estándar, por bloques
+        if text is not None:
+            src = io.StringIO(text)
+        else:
+            src = open_text(args.input, 'r')
+        dst = open_text(args.output, 'w')
+        try:
+            vigenere_stream(key, t, src, dst, decrypt=(args.mode == 'dec'))
+        except Exception as e:
+            print('Error durante el proceso:', e, file=sys.stderr)
+            sys.exit(1)
+        finally:
+            src.close()
+            dst.close()
+        return
+
     try:
         if args.mode == 'enc':
             result = encrypt_vigenere(key, t, text)
@@ -9,19 +9,24 @@ la representación en Base64 del mensaje cifrado.
 Características:
 - Acepta cualquier archivo de imagen (lee bytes del archivo)
 - Cifra con AES en modo CBC usando una clave de 128/192/256 bits
-- Codifica el ciphertext en Base64 y lo muestra en consola
+- Codifica el ciphertext en Base64 por bloques y muestra un extracto en consola
 - Decodifica desde Base64, descifra y reconstruye la imagen original
 - Si se ejecuta sin argumentos, genera una imagen de prueba y la procesa
 
-Dependencias: pycryptodome, pillow
+Dependencias: pycryptodome, pillow, numpy (Pillow y NumPy sólo se importan al
+generar o mostrar imágenes; `import Taller_AES` y el cifrado de bytes no los
+necesitan)
+
+Las funciones que no dependen de AES se comparten con Taller_DES en
+`Taller Comun/Taller_Comun.py`.
 """
 
-import argparse
-import base64
+import functools
+import math
 import os
+import struct
 import sys
-from io import BytesIO
-import math
+import time
 
 try:
 	from Crypto.Cipher import AES
@@ -30,33 +35,46 @@ except Exception as e:
 	print("Falta la librería 'pycryptodome'. Instálela con: pip install pycryptodome")
 	raise
 
-try:
-	from PIL import Image
-except Exception:
-	print("Falta la librería 'Pillow'. Instálela con: pip install pillow")
-	raise
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Taller Comun"))
+
+import Taller_Comun
+from Taller_Comun import (B64_PREVIEW_CHARS, CHUNK_SIZE, MANIFEST_NAME, batch_out_dir, expand_inputs, is_batch_spec,
+						  load_numpy, load_pil, pkcs7_pad, pkcs7_unpad, save_b64)
 
 
 BLOCK_SIZE = 16
 
+# Contenedor para los modos paralelos (CTR/GCM):
+#   magic (4) | modo (1) | nonce (8) | tamaño de segmento (4) | datos
+# En GCM cada segmento va seguido de su tag de autenticación. El modo CBC
+# conserva el formato original IV + ciphertext.
+CONTAINER_MAGIC = b"TAES"
+CONTAINER_HEADER = struct.Struct(">4sB8sI")
+MODE_IDS = {"ctr": 1, "gcm": 2}
+MODE_NAMES = {v: k for k, v in MODE_IDS.items()}
+NONCE_SIZE = 8
+TAG_SIZE = 16
+# Tamaño de segmento que procesa cada worker (múltiplo de BLOCK_SIZE)
+SEGMENT_SIZE = 16 << 20
+
 
 def pad(data: bytes) -> bytes:
 	"""PKCS7 padding"""
-	pad_len = BLOCK_SIZE - (len(data) % BLOCK_SIZE)
-	return data + bytes([pad_len]) * pad_len
+	return pkcs7_pad(data, BLOCK_SIZE)
 
 
 def unpad(data: bytes) -> bytes:
-	if not data:
-		return data
-	pad_len = data[-1]
-	if pad_len < 1 or pad_len > BLOCK_SIZE:
-		raise ValueError("Padding inválido")
-	return data[:-pad_len]
+	return pkcs7_unpad(data, BLOCK_SIZE)
+
 
+def _cbc(key: bytes):
+	"""Fábrica de ciphers AES-CBC para las funciones de Taller_Comun: iv -> cipher."""
+	return functools.partial(AES.new, key, AES.MODE_CBC)
 
-def encrypt_bytes(plaintext: bytes, key: bytes) -> bytes:
-	iv = get_random_bytes(BLOCK_SIZE)
+
+def encrypt_bytes(plaintext: bytes, key: bytes, iv: bytes = None) -> bytes:
+	if iv is None:
+		iv = get_random_bytes(BLOCK_SIZE)
 	cipher = AES.new(key, AES.MODE_CBC, iv)
 	ciphertext = cipher.encrypt(pad(plaintext))
 	return iv + ciphertext
@@ -70,64 +88,301 @@ def decrypt_bytes(iv_and_ciphertext: bytes, key: bytes) -> bytes:
 	return unpad(plaintext_padded)
 
 
-def process_image_file(path: str, key_bytes: bytes, do_show: bool = True) -> str:
+def encrypt_stream(fin, fout, key: bytes, iv: bytes = None, chunk_size: int = CHUNK_SIZE) -> int:
+	"""Cifra `fin` en `fout` por bloques de `chunk_size` bytes (AES-CBC).
+
+	La salida (IV + ciphertext) es idéntica a la de `encrypt_bytes` con el
+	mismo IV y la memoria usada no depende del tamaño de la entrada (ver
+	`Taller_Comun.encrypt_stream`). Devuelve el número de bytes escritos.
+	"""
+	if iv is None:
+		iv = get_random_bytes(BLOCK_SIZE)
+	return Taller_Comun.encrypt_stream(fin, fout, _cbc(key), BLOCK_SIZE, iv, chunk_size)
+
+
+def decrypt_stream(fin, fout, key: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+	"""Descifra por bloques un flujo IV + ciphertext generado con AES-CBC.
+
+	Devuelve el número de bytes escritos.
+	"""
+	return Taller_Comun.decrypt_stream(fin, fout, _cbc(key), BLOCK_SIZE, chunk_size)
+
+
+def encrypt_file(src: str, dst: str, key: bytes, iv: bytes = None, chunk_size: int = CHUNK_SIZE) -> int:
+	"""Cifra el archivo `src` en `dst` usando `encrypt_stream`."""
+	with open(src, "rb") as fin, open(dst, "wb") as fout:
+		return encrypt_stream(fin, fout, key, iv=iv, chunk_size=chunk_size)
+
+
+def decrypt_file(src: str, dst: str, key: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+	"""Descifra el archivo `src` (IV + ciphertext) en `dst` usando `decrypt_stream`."""
+	with open(src, "rb") as fin, open(dst, "wb") as fout:
+		return decrypt_stream(fin, fout, key, chunk_size=chunk_size)
+
+
+def encrypt_file_mmap(src: str, dst: str, key: bytes, iv: bytes = None, chunk_size: int = CHUNK_SIZE) -> int:
+	"""Cifra `src` en `dst` (AES-CBC) usando memoria mapeada en entrada y salida.
+
+	El formato es el mismo que `encrypt_bytes`. Devuelve el tamaño del
+	archivo escrito.
+	"""
+	if iv is None:
+		iv = get_random_bytes(BLOCK_SIZE)
+	return Taller_Comun.encrypt_file_mmap(src, dst, _cbc(key), BLOCK_SIZE, iv, chunk_size)
+
+
+def decrypt_file_mmap(src: str, dst: str, key: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+	"""Descifra con memoria mapeada un archivo IV + ciphertext (AES-CBC).
+
+	Devuelve el número de bytes escritos.
+	"""
+	return Taller_Comun.decrypt_file_mmap(src, dst, _cbc(key), BLOCK_SIZE, chunk_size)
+
+
+def _gcm_nonce(nonce: bytes, index: int) -> bytes:
+	"""Nonce de 12 bytes del segmento `index`: nonce del contenedor + contador."""
+	return nonce + struct.pack(">I", index)
+
+
+def _crypt_segment(job: tuple) -> int:
+	"""Cifra o descifra un segmento leyendo y escribiendo directamente en disco.
+
+	Se ejecuta en los procesos del pool, por lo que sólo recibe rutas y
+	offsets (el payload no viaja entre procesos).
+	"""
+	(mode, encrypt, key, nonce, header, index, final, counter,
+	 src, src_offset, length, dst, dst_offset) = job
+	with open(src, "rb") as fin:
+		fin.seek(src_offset)
+		data = fin.read(length)
+
+	if mode == "ctr":
+		cipher = AES.new(key, AES.MODE_CTR, nonce=nonce, initial_value=counter)
+		out = cipher.encrypt(data) if encrypt else cipher.decrypt(data)
+	else:
+		cipher = AES.new(key, AES.MODE_GCM, nonce=_gcm_nonce(nonce, index))
+		# El header y la marca de último segmento se autentican para detectar
+		# segmentos truncados, reordenados o un contenedor alterado.
+		cipher.update(header + (b"\x01" if final else b"\x00"))
+		if encrypt:
+			out, tag = cipher.encrypt_and_digest(data)
+			out += tag
+		else:
+			try:
+				out = cipher.decrypt_and_verify(data[:-TAG_SIZE], data[-TAG_SIZE:])
+			except ValueError:
+				raise ValueError(f"Tag GCM inválido en el segmento {index}")
+
+	with open(dst, "r+b") as fout:
+		fout.seek(dst_offset)
+		fout.write(out)
+	return len(data)
+
+
+def _run_jobs(jobs: list, workers: int = None) -> None:
+	if workers is None:
+		workers = os.cpu_count() or 1
+	workers = min(workers, len(jobs))
+	if workers <= 1:
+		for job in jobs:
+			_crypt_segment(job)
+		return
+	from concurrent.futures import ProcessPoolExecutor
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		for _ in pool.map(_crypt_segment, jobs):
+			pass
+
+
+def encrypt_file_parallel(src: str, dst: str, key: bytes, mode: str = "ctr",
+						  workers: int = None, segment_size: int = SEGMENT_SIZE) -> int:
+	"""Cifra `src` en `dst` con AES-CTR o AES-GCM repartiendo segmentos en un pool de procesos.
+
+	En CTR cada segmento arranca en su posición del contador, así que el
+	resultado es el mismo que cifrar el archivo completo de una vez. En GCM
+	cada segmento lleva su propio nonce (nonce + índice) y tag.
+
+	Devuelve el tamaño del contenedor escrito.
+	"""
+	if mode not in MODE_IDS:
+		raise ValueError(f"Modo no soportado: {mode}")
+	if segment_size <= 0 or segment_size % BLOCK_SIZE:
+		raise ValueError(f"segment_size debe ser múltiplo de {BLOCK_SIZE}")
+	size = os.path.getsize(src)
+	nonce = get_random_bytes(NONCE_SIZE)
+	header = CONTAINER_HEADER.pack(CONTAINER_MAGIC, MODE_IDS[mode], nonce, segment_size)
+	n_segments = max(1, (size + segment_size - 1) // segment_size)
+	tag_len = TAG_SIZE if mode == "gcm" else 0
+	total = len(header) + size + n_segments * tag_len
+
+	with open(dst, "wb") as f:
+		f.write(header)
+		f.truncate(total)
+
+	jobs = []
+	for i in range(n_segments):
+		offset = i * segment_size
+		length = min(segment_size, size - offset)
+		jobs.append((mode, True, key, nonce, header, i, i == n_segments - 1, offset // BLOCK_SIZE,
+					 src, offset, length, dst, len(header) + offset + i * tag_len))
+	_run_jobs(jobs, workers)
+	return total
+
+
+def read_container_header(path: str):
+	"""Devuelve (modo, nonce, segment_size) de un contenedor CTR/GCM, o None si es CBC."""
+	with open(path, "rb") as f:
+		raw = f.read(CONTAINER_HEADER.size)
+	if len(raw) < CONTAINER_HEADER.size:
+		return None
+	magic, mode_id, nonce, segment_size = CONTAINER_HEADER.unpack(raw)
+	if magic != CONTAINER_MAGIC or mode_id not in MODE_NAMES:
+		return None
+	return MODE_NAMES[mode_id], nonce, segment_size
+
+
+def decrypt_file_parallel(src: str, dst: str, key: bytes, workers: int = None) -> int:
+	"""Descifra un contenedor CTR/GCM creado por `encrypt_file_parallel`.
+
+	Si algún tag GCM no es válido se borra `dst` y se lanza ValueError.
+	Devuelve el número de bytes de texto plano escritos.
+	"""
+	info = read_container_header(src)
+	if info is None:
+		raise ValueError("El archivo no es un contenedor AES-CTR/GCM")
+	mode, nonce, segment_size = info
+	if segment_size <= 0 or segment_size % BLOCK_SIZE:
+		raise ValueError("contenedor TAES corrupto")
+	with open(src, "rb") as f:
+		header = f.read(CONTAINER_HEADER.size)
+	body = os.path.getsize(src) - len(header)
+	tag_len = TAG_SIZE if mode == "gcm" else 0
+	stride = segment_size + tag_len
+	n_segments = max(1, (body + stride - 1) // stride)
+	size = body - n_segments * tag_len
+	if size < 0 or (n_segments > 1 and size <= (n_segments - 1) * segment_size):
+		raise ValueError("Contenedor truncado o corrupto")
+
+	with open(dst, "wb") as f:
+		f.truncate(size)
+
+	jobs = []
+	for i in range(n_segments):
+		offset = i * segment_size
+		length = min(segment_size, size - offset) + tag_len
+		jobs.append((mode, False, key, nonce, header, i, i == n_segments - 1, offset // BLOCK_SIZE,
+					 src, len(header) + offset + i * tag_len, length, dst, offset))
+	try:
+		_run_jobs(jobs, workers)
+	except ValueError:
+		os.remove(dst)
+		raise
+	return size
+
+
+def ciphertext_visual(enc_path: str, max_pixels: int = 0):
+	"""Devuelve una matriz uint8 (alto, ancho) casi cuadrada con todos los bytes del ciphertext.
+
+	Los bytes se leen con `numpy.memmap`. Si el tamaño es múltiplo del ancho la
+	matriz es una vista del archivo sin copias; si no, la última fila se
+	completa con ceros (y la matriz es una copia). Si `max_pixels` > 0 y la
+	imagen lo supera, se reduce por la media de bloques f x f para que quepa en
+	ese presupuesto de píxeles; los bloques del borde derecho e inferior pueden
+	ser parciales y promedian sólo los bytes que contienen, así que todo el
+	ciphertext queda representado.
+	"""
+	np = load_numpy()
+	if np is None:
+		return None
+	size = os.path.getsize(enc_path)
+	if size == 0:
+		return None
+	data = np.memmap(enc_path, dtype=np.uint8, mode="r")
+	width = math.isqrt(size - 1) + 1
+	height = -(-size // width)
+	if not max_pixels or width * height <= max_pixels:
+		if size == width * height:
+			return data.reshape(height, width)
+		view = np.zeros((height, width), dtype=np.uint8)
+		view.ravel()[:size] = data
+		return view
+
+	factor = math.isqrt((width * height - 1) // max_pixels) + 1
+	while -(-width // factor) * -(-height // factor) > max_pixels:
+		factor += 1
+	out_w, out_h = -(-width // factor), -(-height // factor)
+	starts = np.arange(0, width, factor)
+	thumb = np.zeros((out_h, out_w), dtype=np.uint8)
+	# Una fila de bloques cada vez: la memoria temporal es O(ancho * factor)
+	for row in range(out_h):
+		chunk = data[row * factor * width:min((row + 1) * factor * width, size)]
+		full, rest = divmod(len(chunk), width)
+		sums = chunk[:full * width].reshape(full, width).sum(axis=0, dtype=np.uint64)
+		counts = np.full(width, full, dtype=np.uint64)
+		if rest:
+			sums[:rest] += chunk[full * width:]
+			counts[:rest] += 1
+		cell_sums = np.add.reduceat(sums, starts)
+		cell_counts = np.add.reduceat(counts, starts)
+		filled = cell_counts > 0
+		thumb[row, filled] = cell_sums[filled] // cell_counts[filled]
+	return thumb
+
+
+def process_image_file(path: str, key_bytes: bytes, do_show: bool = True, do_visual: bool = True,
+					   mode: str = "cbc", workers: int = None, preview: int = B64_PREVIEW_CHARS,
+					   visual_max_pixels: int = 0, use_mmap: bool = False) -> str:
 	"""Cifra, codifica en base64, decodifica, descifra y guarda la imagen recuperada.
 
+	El cifrado se hace por streaming: el ciphertext se escribe en
+	`<imagen>.enc` sin cargar la imagen completa en memoria. Con `mode`
+	"ctr" o "gcm" los segmentos se cifran en paralelo (`workers` procesos).
+	El Base64 se escribe por bloques en `<imagen>.b64.txt` y en consola sólo
+	se muestran los primeros `preview` caracteres. La imagen visual del
+	ciphertext se limita a `visual_max_pixels` píxeles (0 = sin límite).
+	Con `use_mmap` (sólo CBC) el cifrado y descifrado trabajan sobre archivos
+	mapeados en memoria.
+
 	Devuelve la ruta del archivo recuperado.
 	"""
 	basename = os.path.basename(path)
-	with open(path, "rb") as f:
-		img_bytes = f.read()
 
 	# Cifrar
-	iv_cipher = encrypt_bytes(img_bytes, key_bytes)
+	enc_path = path + ".enc"
+	if mode == "cbc":
+		(encrypt_file_mmap if use_mmap else encrypt_file)(path, enc_path, key_bytes)
+	else:
+		encrypt_file_parallel(path, enc_path, key_bytes, mode=mode, workers=workers)
+	print(f"Ciphertext ({mode.upper()}) guardado en: {enc_path}")
 
 	# Generar una representación visual del ciphertext y guardarla como JPEG
-	try:
-		enc_bytes = iv_cipher
-		enc_len = len(enc_bytes)
-		# Elegimos un ancho fijo para la imagen visual (256) para evitar imágenes excesivamente estrechas
-		enc_width = 256
-		enc_height = (enc_len + enc_width - 1) // enc_width
-		pad_len = enc_width * enc_height - enc_len
-		enc_padded = enc_bytes + (b"\x00" * pad_len)
-		enc_img = Image.frombytes('L', (enc_width, enc_height), enc_padded)
-		encrypted_path = os.path.join(os.path.dirname(path), f"encrypted_{basename}.jpg")
-		# Guardar como JPEG
-		enc_img.save(encrypted_path, format='JPEG')
-		print(f"Encrypted image (visual) guardada en: {encrypted_path}")
-	except Exception as e:
-		print(f"No se pudo generar la imagen cifrada visual: {e}")
-
-	# Base64
-	b64 = base64.b64encode(iv_cipher)
-	b64_text = b64.decode('ascii')
-
-	print("--- Texto Base64 (puede ser muy largo) ---")
-	print(b64_text)
-	print("--- Fin Base64 ---")
-
-	# También guardamos el base64 en un archivo por si es necesario
-	b64_out = path + ".b64.txt"
-	with open(b64_out, "w", encoding="utf-8") as f:
-		f.write(b64_text)
-
-	# Decodificar Base64 a bytes
-	decoded = base64.b64decode(b64_text)
-
-	# Descifrar
-	recovered = decrypt_bytes(decoded, key_bytes)
-
-	# Guardar imagen recuperada
+	Image = load_pil() if (do_visual or do_show) else None
+	if Image is not None and do_visual:
+		try:
+			pixels = ciphertext_visual(enc_path, max_pixels=visual_max_pixels)
+			if pixels is not None:
+				enc_img = Image.fromarray(pixels)
+				encrypted_path = os.path.join(os.path.dirname(path), f"encrypted_{basename}.jpg")
+				# Guardar como JPEG
+				enc_img.save(encrypted_path, format='JPEG')
+				print(f"Encrypted image (visual, {enc_img.width}x{enc_img.height}) guardada en: {encrypted_path}")
+		except Exception as e:
+			print(f"No se pudo generar la imagen cifrada visual: {e}")
+
+	# Base64: se escribe por bloques directamente en el archivo y se verifica
+	save_b64(enc_path, path + ".b64.txt", preview)
+
+	# Descifrar y guardar imagen recuperada
 	recovered_path = os.path.join(os.path.dirname(path), f"recovered_{basename}")
-	with open(recovered_path, "wb") as f:
-		f.write(recovered)
+	if mode == "cbc":
+		(decrypt_file_mmap if use_mmap else decrypt_file)(enc_path, recovered_path, key_bytes)
+	else:
+		decrypt_file_parallel(enc_path, recovered_path, key_bytes, workers=workers)
 
 	print(f"Imagen recuperada guardada en: {recovered_path}")
 
-	if do_show:
+	if do_show and Image is not None:
 		try:
-			img = Image.open(BytesIO(recovered))
+			img = Image.open(recovered_path)
 			img.show()
 		except Exception as e:
 			print(f"No se pudo mostrar la imagen automáticamente: {e}")
@@ -135,12 +390,67 @@ def process_image_file(path: str, key_bytes: bytes, do_show: bool = True) -> str
 	return recovered_path
 
 
-def parse_args() -> argparse.Namespace:
+# Estado de cada proceso del pool batch: la clave se envía una sola vez por
+# worker (initializer) en lugar de viajar con cada archivo. La fábrica de
+# ciphers CBC también se prepara una vez; pycryptodome expande la clave en
+# cada AES.new y no permite reutilizar esa expansión con otro IV.
+_batch_key = None
+_batch_mode = "cbc"
+_batch_cbc = None
+
+
+def _init_batch_worker(key: bytes, mode: str) -> None:
+	global _batch_key, _batch_mode, _batch_cbc
+	_batch_key = key
+	_batch_mode = mode
+	_batch_cbc = _cbc(key)
+
+
+def _encrypt_batch_file(job: tuple) -> dict:
+	src, dst = job
+	start = time.perf_counter()
+	if _batch_mode == "cbc":
+		iv = get_random_bytes(BLOCK_SIZE)
+		with open(src, "rb") as fin, open(dst, "wb") as fout:
+			written = Taller_Comun.encrypt_stream(fin, fout, _batch_cbc, BLOCK_SIZE, iv)
+	else:
+		written = encrypt_file_parallel(src, dst, _batch_key, mode=_batch_mode, workers=1)
+		iv = read_container_header(dst)[1]
+	return {
+		"file": src,
+		"output": dst,
+		"mode": _batch_mode,
+		"iv": iv.hex(),
+		"size": os.path.getsize(src),
+		"encrypted_size": written,
+		"seconds": round(time.perf_counter() - start, 6),
+	}
+
+
+def process_batch(paths: list, key_bytes: bytes, out_dir: str, mode: str = "cbc", workers: int = None) -> list:
+	"""Cifra cada archivo de `paths` en `out_dir` usando un pool de procesos.
+
+	Cada archivo se guarda como `<out_dir>/<nombre>.enc` y por cada uno se
+	añade una línea a `<out_dir>/manifest.jsonl` con el IV (o nonce), tamaños
+	y tiempo. Devuelve la lista de entradas del manifiesto.
+	"""
+	return Taller_Comun.run_batch(paths, out_dir, _encrypt_batch_file, _init_batch_worker, (key_bytes, mode), workers)
+
+
+def parse_args():
+	import argparse
 	parser = argparse.ArgumentParser(description="Cifrar y descifrar imágenes usando AES y Base64")
-	parser.add_argument("image", nargs="?", help="Ruta al archivo de imagen. Si se omite, se usa una imagen de prueba generada.")
+	parser.add_argument("image", nargs="?", help="Ruta al archivo de imagen, o un directorio / patrón glob para el modo batch. Si se omite, se usa una imagen de prueba generada.")
 	parser.add_argument("--keysize", choices=["128", "192", "256"], default="128", help="Tamaño de clave AES en bits (128/192/256). Default=128")
 	parser.add_argument("--key", help="Clave en hexadecimal (opcional). Si no se pasa, el script genera una aleatoria y la muestra.")
 	parser.add_argument("--no-show", action="store_true", help="No abrir la imagen recuperada automáticamente")
+	parser.add_argument("--no-visual", action="store_true", help="No generar la imagen visual del ciphertext (no requiere Pillow)")
+	parser.add_argument("--visual-max-pixels", type=int, default=0, help="Reduce la imagen visual (media por bloques) a este número máximo de píxeles. Default=0 (tamaño completo)")
+	parser.add_argument("--mode", choices=["cbc", "ctr", "gcm"], default="cbc", help="Modo AES. CTR y GCM cifran por segmentos en paralelo. Default=cbc")
+	parser.add_argument("--mmap", action="store_true", help="Cifrar/descifrar (modo cbc) sobre archivos mapeados en memoria")
+	parser.add_argument("--b64-preview", type=int, default=B64_PREVIEW_CHARS, help=f"Caracteres de Base64 a mostrar en consola (0 = ninguno). Default={B64_PREVIEW_CHARS}")
+	parser.add_argument("--workers", type=int, help="Número de procesos para los modos ctr/gcm y el modo batch (por defecto, todos los núcleos)")
+	parser.add_argument("--out-dir", help="Directorio de salida del modo batch. Default=<entrada>/encrypted")
 	return parser.parse_args()
 
 
@@ -159,9 +469,31 @@ def main():
 		key_bytes = get_random_bytes(key_len)
 		print(f"Clave generada (hex) para AES-{keysize_bits}: {key_bytes.hex()}" )
 
+	if args.mmap and args.mode != "cbc":
+		print("--mmap sólo se puede usar con --mode cbc.")
+		sys.exit(1)
+
+	if args.image and is_batch_spec(args.image):
+		paths = expand_inputs(args.image)
+		if not paths:
+			print(f"No se encontraron archivos en: {args.image}")
+			sys.exit(1)
+		out_dir = batch_out_dir(args.image, args.out_dir)
+		start = time.perf_counter()
+		entries = process_batch(paths, key_bytes, out_dir, mode=args.mode, workers=args.workers)
+		elapsed = time.perf_counter() - start
+		total_mb = sum(e["size"] for e in entries) / (1 << 20)
+		print(f"{len(entries)} archivos ({total_mb:.1f} MB) cifrados en {elapsed:.2f} s "
+			  f"({len(entries) / max(elapsed, 1e-9) * 60:.0f} archivos/min)")
+		print(f"Manifiesto guardado en: {os.path.join(out_dir, MANIFEST_NAME)}")
+		return
+
 	# Si no se proporcionó imagen, crear una pequeña imagen de prueba
 	if not args.image:
 		print("No se proporcionó imagen. Generando una imagen de prueba (100x100).")
+		Image = load_pil()
+		if Image is None:
+			sys.exit(1)
 		img = Image.new("RGB", (100, 100), color=(73, 109, 137))
 		for x in range(100):
 			for y in range(100):
@@ -173,7 +505,9 @@ def main():
 	else:
 		image_path = args.image
 
-	process_image_file(image_path, key_bytes, do_show=(not args.no_show))
+	process_image_file(image_path, key_bytes, do_show=(not args.no_show), do_visual=(not args.no_visual), mode=args.mode, workers=args.workers,
+					   preview=max(0, args.b64_preview), visual_max_pixels=max(0, args.visual_max_pixels),
+					   use_mmap=args.mmap)
 
 
 if __name__ == "__main__":
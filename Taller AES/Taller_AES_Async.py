@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Taller_AES_Async.py
+
+Fachada asyncio para las funciones de Taller_AES. El cifrado se ejecuta en un
+pool de threads (pycryptodome libera el GIL mientras cifra buffers grandes),
+así que las llamadas no bloquean el event loop.
+
+- Un semáforo limita los trabajos en curso: si se alcanza `max_in_flight`,
+  las nuevas llamadas esperan (backpressure) en lugar de acumularse en la
+  cola del executor.
+- `encrypt_chunks` / `decrypt_chunks` procesan flujos por bloques con
+  `async for`, manteniendo el estado CBC entre bloques. El resultado es el
+  mismo formato IV + ciphertext de `encrypt_bytes`.
+
+Ejemplo:
+	async with AsyncImageCipher(key, max_in_flight=8) as cipher:
+		blob = await cipher.encrypt(data)
+		async for chunk in cipher.encrypt_chunks(stream):
+			...
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from Taller_AES import AES, BLOCK_SIZE, CHUNK_SIZE, decrypt_bytes, encrypt_bytes, get_random_bytes, pad, unpad
+
+
+async def _aiter(chunks):
+	"""Acepta tanto iterables síncronos como asíncronos de bloques de bytes."""
+	if hasattr(chunks, "__aiter__"):
+		async for chunk in chunks:
+			yield chunk
+	else:
+		for chunk in chunks:
+			yield chunk
+
+
+class AsyncImageCipher:
+	"""Cifrado/descifrado AES-CBC no bloqueante con concurrencia acotada."""
+
+	def __init__(self, key: bytes, max_in_flight: int = None, executor: ThreadPoolExecutor = None,
+				 chunk_size: int = CHUNK_SIZE):
+		if len(key) not in (16, 24, 32):
+			raise ValueError("La clave AES debe tener 16, 24 o 32 bytes")
+		if chunk_size <= 0 or chunk_size % BLOCK_SIZE:
+			raise ValueError(f"chunk_size debe ser múltiplo de {BLOCK_SIZE}")
+		if max_in_flight is None:
+			max_in_flight = os.cpu_count() or 1
+		self._key = key
+		self._chunk_size = chunk_size
+		self._own_executor = executor is None
+		self._executor = executor or ThreadPoolExecutor(max_workers=max_in_flight)
+		self._slots = asyncio.Semaphore(max_in_flight)
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *exc):
+		self.close()
+
+	def close(self) -> None:
+		if self._own_executor:
+			self._executor.shutdown(wait=False)
+
+	async def _run(self, func, *args):
+		async with self._slots:
+			loop = asyncio.get_running_loop()
+			return await loop.run_in_executor(self._executor, func, *args)
+
+	async def encrypt(self, plaintext: bytes, iv: bytes = None) -> bytes:
+		"""Equivalente asíncrono de `encrypt_bytes` (devuelve IV + ciphertext)."""
+		return await self._run(encrypt_bytes, plaintext, self._key, iv)
+
+	async def decrypt(self, iv_and_ciphertext: bytes) -> bytes:
+		"""Equivalente asíncrono de `decrypt_bytes`."""
+		return await self._run(decrypt_bytes, iv_and_ciphertext, self._key)
+
+	async def encrypt_chunks(self, chunks, iv: bytes = None):
+		"""Cifra un flujo de bloques de bytes; genera IV + ciphertext por partes.
+
+		Los bloques se reagrupan a múltiplos de `BLOCK_SIZE` y cada uno se cifra
+		en el executor; el padding PKCS7 sólo se aplica al final.
+		"""
+		if iv is None:
+			iv = get_random_bytes(BLOCK_SIZE)
+		cipher = AES.new(self._key, AES.MODE_CBC, iv)
+		yield iv
+		pending = b""
+		async for chunk in _aiter(chunks):
+			if pending:
+				chunk = pending + chunk
+			usable = len(chunk) - (len(chunk) % BLOCK_SIZE)
+			pending = chunk[usable:]
+			for off in range(0, usable, self._chunk_size):
+				part = chunk[off:min(off + self._chunk_size, usable)]
+				yield await self._run(cipher.encrypt, part)
+		yield await self._run(cipher.encrypt, pad(pending))
+
+	async def decrypt_chunks(self, chunks):
+		"""Descifra un flujo IV + ciphertext por partes; genera el texto plano.
+
+		El último bloque se retiene hasta el final del flujo para quitar el padding.
+		"""
+		cipher = None
+		pending = b""
+		last_block = b""
+		async for chunk in _aiter(chunks):
+			if pending:
+				chunk = pending + chunk
+			if cipher is None:
+				if len(chunk) < BLOCK_SIZE:
+					pending = chunk
+					continue
+				cipher = AES.new(self._key, AES.MODE_CBC, chunk[:BLOCK_SIZE])
+				chunk = chunk[BLOCK_SIZE:]
+			usable = len(chunk) - (len(chunk) % BLOCK_SIZE)
+			pending = chunk[usable:]
+			for off in range(0, usable, self._chunk_size):
+				plain = await self._run(cipher.decrypt, chunk[off:min(off + self._chunk_size, usable)])
+				out = last_block + plain[:-BLOCK_SIZE]
+				last_block = plain[-BLOCK_SIZE:]
+				if out:
+					yield out
+		if cipher is None:
+			raise ValueError("Ciphertext demasiado corto (falta el IV)")
+		if pending:
+			raise ValueError("La longitud del ciphertext no es múltiplo del tamaño de bloque")
+		tail = unpad(last_block)
+		if tail:
+			yield tail
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Taller_Comun.py
+
+Funciones compartidas por Taller_AES y Taller_DES que no dependen del cifrado
+de bloque:
+
+- Carga perezosa de Pillow y NumPy.
+- Padding PKCS7 y cifrado/descifrado CBC por streaming y con memoria mapeada,
+  parametrizados por una fábrica de ciphers (`new_cipher(iv)`) y el tamaño de
+  bloque. El formato es siempre IV + ciphertext.
+- Base64 por streaming (codificar, decodificar, verificar y extracto).
+- Modo batch: expansión de directorios / patrones glob y pool de procesos que
+  escribe el manifiesto `manifest.jsonl`.
+
+Cada taller envuelve estas funciones con su cipher (por ejemplo
+`functools.partial(AES.new, key, AES.MODE_CBC)`) y su BLOCK_SIZE.
+"""
+
+import base64
+import glob
+import json
+import mmap
+import os
+
+# Tamaño de lectura para el cifrado por streaming (múltiplo del tamaño de bloque)
+CHUNK_SIZE = 1 << 20
+# Base64 por streaming: se codifican bloques de tamaño múltiplo de 3 para que
+# no aparezca padding '=' en medio del texto.
+B64_CHUNK_SIZE = 3 << 18
+B64_PREVIEW_CHARS = 256
+# Modo batch: nombre del manifiesto (una línea JSON por archivo)
+MANIFEST_NAME = 'manifest.jsonl'
+
+
+def load_pil():
+    """Importa Pillow bajo demanda. Devuelve `PIL.Image` o None si no está instalado."""
+    try:
+        from PIL import Image
+    except ImportError:
+        print("Falta la librería 'Pillow'. Instálela con: pip install pillow")
+        return None
+    return Image
+
+
+def load_numpy():
+    """Importa NumPy bajo demanda. Devuelve el módulo o None si no está instalado."""
+    try:
+        import numpy
+    except ImportError:
+        print("Falta la librería 'numpy'. Instálela con: pip install numpy")
+        return None
+    return numpy
+
+
+# --- padding y CBC ----------------------------------------------------------
+
+def pkcs7_pad(data: bytes, block_size: int) -> bytes:
+    pad_len = block_size - (len(data) % block_size)
+    return data + bytes([pad_len]) * pad_len
+
+
+def pkcs7_unpad(data: bytes, block_size: int) -> bytes:
+    if not data:
+        return data
+    pad_len = data[-1]
+    if pad_len < 1 or pad_len > block_size:
+        raise ValueError('Padding inválido')
+    return data[:-pad_len]
+
+
+def _check_chunk_size(chunk_size: int, block_size: int) -> None:
+    if chunk_size <= 0 or chunk_size % block_size:
+        raise ValueError(f'chunk_size debe ser múltiplo de {block_size}')
+
+
+def encrypt_stream(fin, fout, new_cipher, block_size: int, iv: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+    """Cifra `fin` en `fout` (CBC) por bloques de `chunk_size` bytes.
+
+    El estado de encadenamiento se mantiene en el objeto cipher entre bloques
+    y el padding PKCS7 sólo se aplica al final, así que la salida (IV +
+    ciphertext) es idéntica a cifrar todo de una vez con el mismo IV. La
+    memoria usada no depende del tamaño de la entrada.
+
+    Devuelve el número de bytes escritos.
+    """
+    _check_chunk_size(chunk_size, block_size)
+    cipher = new_cipher(iv)
+    fout.write(iv)
+    written = len(iv)
+    pending = b''
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            break
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - (len(chunk) % block_size)
+        pending = chunk[usable:]
+        if usable:
+            written += fout.write(cipher.encrypt(chunk[:usable]))
+    written += fout.write(cipher.encrypt(pkcs7_pad(pending, block_size)))
+    return written
+
+
+def decrypt_stream(fin, fout, new_cipher, block_size: int, chunk_size: int = CHUNK_SIZE) -> int:
+    """Descifra por bloques un flujo IV + ciphertext (CBC).
+
+    El último bloque descifrado se retiene hasta llegar al final del flujo
+    para poder quitar el padding. Devuelve el número de bytes escritos.
+    """
+    _check_chunk_size(chunk_size, block_size)
+    iv = fin.read(block_size)
+    if len(iv) != block_size:
+        raise ValueError('Ciphertext demasiado corto (falta el IV)')
+    cipher = new_cipher(iv)
+    written = 0
+    pending = b''
+    last_block = b''
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            break
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - (len(chunk) % block_size)
+        pending = chunk[usable:]
+        if not usable:
+            continue
+        plain = cipher.decrypt(chunk[:usable])
+        if last_block:
+            written += fout.write(last_block)
+        written += fout.write(plain[:-block_size])
+        last_block = plain[-block_size:]
+    if pending:
+        raise ValueError('La longitud del ciphertext no es múltiplo del tamaño de bloque')
+    written += fout.write(pkcs7_unpad(last_block, block_size))
+    return written
+
+
+def encrypt_file_mmap(src: str, dst: str, new_cipher, block_size: int, iv: bytes,
+                      chunk_size: int = CHUNK_SIZE) -> int:
+    """Cifra `src` en `dst` (CBC) usando memoria mapeada en entrada y salida.
+
+    pycryptodome cifra directamente desde el mapa de `src` al mapa de `dst`
+    (parámetro `output`), sin crear objetos `bytes` para el payload. El
+    formato es el mismo que `encrypt_stream`. Devuelve el tamaño del archivo
+    escrito.
+    """
+    _check_chunk_size(chunk_size, block_size)
+    cipher = new_cipher(iv)
+    size = os.path.getsize(src)
+    full = size - (size % block_size)
+    total = block_size + full + block_size
+
+    with open(src, 'rb') as fin, open(dst, 'w+b') as fout:
+        fout.truncate(total)
+        fout.write(iv)
+        fout.flush()
+        if full:
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as min_, \
+                    mmap.mmap(fout.fileno(), total) as mout, \
+                    memoryview(min_) as data, memoryview(mout) as out:
+                for off in range(0, full, chunk_size):
+                    end = min(off + chunk_size, full)
+                    cipher.encrypt(data[off:end], output=out[block_size + off:block_size + end])
+        fin.seek(full)
+        fout.seek(block_size + full)
+        fout.write(cipher.encrypt(pkcs7_pad(fin.read(), block_size)))
+    return total
+
+
+def decrypt_file_mmap(src: str, dst: str, new_cipher, block_size: int, chunk_size: int = CHUNK_SIZE) -> int:
+    """Descifra con memoria mapeada un archivo IV + ciphertext (CBC).
+
+    El último bloque se descifra primero para conocer el padding y así el
+    tamaño final de `dst`; el resto se descifra del mapa de entrada al de
+    salida. Devuelve el número de bytes escritos.
+    """
+    _check_chunk_size(chunk_size, block_size)
+    size = os.path.getsize(src)
+    ct_len = size - block_size
+    if ct_len < 0 or ct_len % block_size:
+        raise ValueError('La longitud del ciphertext no es múltiplo del tamaño de bloque')
+    if ct_len == 0:
+        open(dst, 'wb').close()
+        return 0
+
+    with open(src, 'rb') as fin:
+        iv = fin.read(block_size)
+        bulk = ct_len - block_size
+        # CBC: el último bloque se descifra con el bloque anterior como IV
+        if bulk:
+            fin.seek(bulk)
+            prev = fin.read(block_size)
+        else:
+            prev = iv
+        tail = pkcs7_unpad(new_cipher(prev).decrypt(fin.read(block_size)), block_size)
+        total = bulk + len(tail)
+
+        with open(dst, 'w+b') as fout:
+            fout.truncate(total)
+            if bulk:
+                cipher = new_cipher(iv)
+                with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as min_, \
+                        mmap.mmap(fout.fileno(), total) as mout, \
+                        memoryview(min_) as data, memoryview(mout) as out:
+                    for off in range(0, bulk, chunk_size):
+                        end = min(off + chunk_size, bulk)
+                        cipher.decrypt(data[block_size + off:block_size + end], output=out[off:end])
+            fout.seek(bulk)
+            fout.write(tail)
+    return total
+
+
+# --- Base64 -----------------------------------------------------------------
+
+def b64_encode_stream(fin, fout, chunk_size: int = B64_CHUNK_SIZE) -> int:
+    """Codifica en Base64 el flujo binario `fin` y lo escribe en `fout` (binario).
+
+    Devuelve el número de caracteres Base64 escritos.
+    """
+    if chunk_size <= 0 or chunk_size % 3:
+        raise ValueError('chunk_size debe ser múltiplo de 3')
+    written = 0
+    pending = b''
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            break
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - (len(chunk) % 3)
+        pending = chunk[usable:]
+        written += fout.write(base64.b64encode(chunk[:usable]))
+    if pending:
+        written += fout.write(base64.b64encode(pending))
+    return written
+
+
+def iter_b64_decode(fin, chunk_size: int = 4 * (B64_CHUNK_SIZE // 3)):
+    """Genera los bytes decodificados de un flujo Base64, bloque a bloque.
+
+    Se ignoran los saltos de línea y espacios. La memoria usada depende sólo de
+    `chunk_size`.
+    """
+    pending = b''
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            break
+        chunk = pending + chunk.translate(None, b' \t\r\n')
+        usable = len(chunk) - (len(chunk) % 4)
+        pending = chunk[usable:]
+        if usable:
+            yield base64.b64decode(chunk[:usable], validate=True)
+    if pending:
+        raise ValueError('Longitud de Base64 inválida')
+
+
+def b64_decode_stream(fin, fout) -> int:
+    """Decodifica el flujo Base64 `fin` en `fout`. Devuelve los bytes escritos."""
+    written = 0
+    for chunk in iter_b64_decode(fin):
+        written += fout.write(chunk)
+    return written
+
+
+def b64_matches_file(b64_path: str, data_path: str) -> bool:
+    """Comprueba, decodificando por bloques, que `b64_path` es el Base64 de `data_path`."""
+    with open(b64_path, 'rb') as fb, open(data_path, 'rb') as fd:
+        for chunk in iter_b64_decode(fb):
+            if fd.read(len(chunk)) != chunk:
+                return False
+        return not fd.read(1)
+
+
+def b64_preview(b64_path: str, limit: int = B64_PREVIEW_CHARS) -> str:
+    """Devuelve los primeros `limit` caracteres del archivo Base64."""
+    with open(b64_path, 'r', encoding='ascii') as f:
+        return f.read(limit)
+
+
+def save_b64(enc_path: str, b64_path: str, preview: int = B64_PREVIEW_CHARS) -> int:
+    """Escribe por bloques el Base64 de `enc_path`, muestra un extracto y lo verifica.
+
+    Lanza ValueError si el Base64 decodificado no coincide con el archivo.
+    Devuelve el número de caracteres Base64 escritos.
+    """
+    with open(enc_path, 'rb') as fin, open(b64_path, 'wb') as fout:
+        b64_len = b64_encode_stream(fin, fout)
+
+    print(f'--- Texto Base64 (primeros {min(preview, b64_len)} de {b64_len} caracteres) ---')
+    if preview:
+        print(b64_preview(b64_path, preview) + ('...' if b64_len > preview else ''))
+    print('--- Fin Base64 ---')
+    print(f'Base64 completo guardado en: {b64_path}')
+
+    # Decodificar Base64 por bloques y comprobar que coincide con el ciphertext
+    if not b64_matches_file(b64_path, enc_path):
+        raise ValueError('El Base64 decodificado no coincide con el ciphertext')
+    return b64_len
+
+
+# --- modo batch -------------------------------------------------------------
+
+def expand_inputs(spec: str) -> list:
+    """Devuelve la lista ordenada de archivos de un directorio o de un patrón glob."""
+    if os.path.isdir(spec):
+        paths = [os.path.join(spec, name) for name in os.listdir(spec)]
+    else:
+        paths = glob.glob(spec)
+    return sorted(p for p in paths if os.path.isfile(p))
+
+
+def is_batch_spec(spec: str) -> bool:
+    """True si `spec` es un directorio o un patrón glob (modo batch)."""
+    return os.path.isdir(spec) or glob.has_magic(spec)
+
+
+def batch_out_dir(spec: str, out_dir: str = None) -> str:
+    """Directorio de salida del modo batch: `out_dir` o `<entrada>/encrypted`."""
+    if out_dir:
+        return out_dir
+    base_dir = spec if os.path.isdir(spec) else os.path.dirname(spec) or '.'
+    return os.path.join(base_dir, 'encrypted')
+
+
+def run_batch(paths: list, out_dir: str, worker, initializer, initargs: tuple, workers: int = None) -> list:
+    """Ejecuta `worker((src, dst))` para cada archivo de `paths` con un pool de procesos.
+
+    Cada archivo se guarda como `<out_dir>/<nombre>.enc` (con un prefijo
+    numérico si dos entradas tienen el mismo nombre). `initializer(*initargs)`
+    prepara cada proceso (por ejemplo, la clave se envía una sola vez por
+    worker en lugar de viajar con cada archivo). `worker` devuelve un dict que
+    se escribe como una línea de `<out_dir>/manifest.jsonl`. Devuelve la lista
+    de entradas del manifiesto.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = []
+    used = set()
+    for src in paths:
+        name = os.path.basename(src) + '.enc'
+        stem, n = name, 1
+        while name in used:
+            name = f'{n}_{stem}'
+            n += 1
+        used.add(name)
+        jobs.append((src, os.path.join(out_dir, name)))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    entries = []
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as manifest:
+        if workers == 1:
+            initializer(*initargs)
+            results = map(worker, jobs)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+            # Agrupar archivos por tarea reduce el coste de IPC con miles de archivos pequeños
+            results = pool.map(worker, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+        try:
+            for entry in results:
+                manifest.write(json.dumps(entry) + '\n')
+                entries.append(entry)
+        finally:
+            if workers > 1:
+                pool.shutdown()
+    return entries
@@ -9,19 +9,25 @@ la imagen original.
 
 Características:
 - Lee cualquier archivo de imagen (bytes)
-- Convierte los bytes del archivo a una representación de bits (string o lista)
-- Cifra con DES (CBC) usando una clave de 8 bytes (64 bits, 56 bits efectivos)
-- Codifica el ciphertext (IV + ciphertext) en Base64 y lo imprime
+- Muestra la representación de bits del archivo (vista perezosa, sin construir
+  un string de '0'/'1')
+- Cifra con DES (CBC) usando una clave de 8 bytes (64 bits, 56 bits efectivos),
+  por streaming o sobre archivos mapeados en memoria (`--mmap`); la imagen
+  nunca se carga completa en memoria
+- Codifica el ciphertext (IV + ciphertext) en Base64 por bloques e imprime un extracto
 - Decodifica desde Base64, descifra y guarda la imagen recuperada
 
-Dependencias: pycryptodome, pillow
+Dependencias: pycryptodome, pillow (Pillow sólo se importa al generar o mostrar
+imágenes; `import Taller_DES` y el cifrado de bytes no lo necesitan)
+
+Las funciones que no dependen de DES se comparten con Taller_AES en
+`Taller Comun/Taller_Comun.py`.
 """
 
-import argparse
-import base64
+import functools
 import os
 import sys
-from io import BytesIO
+import time
 
 try:
     from Crypto.Cipher import DES
@@ -30,28 +36,27 @@ except Exception:
     print("Falta la librería 'pycryptodome'. Instálela con: pip install pycryptodome")
     raise
 
-try:
-    from PIL import Image
-except Exception:
-    print("Falta la librería 'Pillow'. Instálela con: pip install pillow")
-    raise
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Taller Comun'))
+
+import Taller_Comun
+from Taller_Comun import (B64_PREVIEW_CHARS, CHUNK_SIZE, MANIFEST_NAME, batch_out_dir, expand_inputs, is_batch_spec,
+                          load_pil, pkcs7_pad, pkcs7_unpad, save_b64)
 
 
 BLOCK_SIZE = 8  # DES block size
 
 
 def pad(data: bytes) -> bytes:
-    pad_len = BLOCK_SIZE - (len(data) % BLOCK_SIZE)
-    return data + bytes([pad_len]) * pad_len
+    return pkcs7_pad(data, BLOCK_SIZE)
 
 
 def unpad(data: bytes) -> bytes:
-    if not data:
-        return data
-    pad_len = data[-1]
-    if pad_len < 1 or pad_len > BLOCK_SIZE:
-        raise ValueError("Padding inválido")
-    return data[:-pad_len]
+    return pkcs7_unpad(data, BLOCK_SIZE)
+
+
+def _cbc(key: bytes):
+    """Fábrica de ciphers DES-CBC para las funciones de Taller_Comun: iv -> cipher."""
+    return functools.partial(DES.new, key, DES.MODE_CBC)
 
 
 def bytes_to_bitstring(data: bytes) -> str:
@@ -59,6 +64,61 @@ def bytes_to_bitstring(data: bytes) -> str:
     return ''.join(f'{b:08b}' for b in data)
 
 
+class BitView:
+    """Vista perezosa de los bits de un buffer de bytes.
+
+    Se comporta como la cadena de `bytes_to_bitstring` para `len()`, índices y
+    slices, pero sólo genera los caracteres '0'/'1' del tramo pedido. El buffer
+    original no se copia.
+    """
+
+    __slots__ = ('_view',)
+
+    def __init__(self, data):
+        self._view = memoryview(data).cast('B')
+
+    def __len__(self) -> int:
+        return 8 * len(self._view)
+
+    def __getitem__(self, item):
+        n = len(self)
+        if isinstance(item, slice):
+            start, stop, step = item.indices(n)
+            if step != 1:
+                return ''.join(self[i] for i in range(start, stop, step))
+            if start >= stop:
+                return ''
+            first, last = start // 8, (stop + 7) // 8
+            chunk = self._view[first:last]
+            bits = format(int.from_bytes(chunk, 'big'), f'0{8 * len(chunk)}b')
+            return bits[start - 8 * first:stop - 8 * first]
+        if item < 0:
+            item += n
+        if not 0 <= item < n:
+            raise IndexError('índice de bit fuera de rango')
+        return '1' if (self._view[item // 8] >> (7 - item % 8)) & 1 else '0'
+
+    def __str__(self) -> str:
+        return bytes_to_bitstring(self._view)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def release(self) -> None:
+        """Libera la vista (necesario antes de cerrar un mmap subyacente)."""
+        self._view.release()
+
+    def tobytes(self) -> bytes:
+        """Devuelve los bytes representados (sin copia si el origen ya es `bytes`)."""
+        obj = self._view.obj
+        if isinstance(obj, bytes) and len(obj) == len(self._view):
+            return obj
+        return self._view.tobytes()
+
+
 def bitstring_to_bytes(bits: str) -> bytes:
     """Convierte una cadena de bits (longitud múltiplo de 8) a bytes."""
     # rellenar con ceros si no es múltiplo de 8
@@ -83,50 +143,96 @@ def decrypt_des(iv_and_ct: bytes, key: bytes) -> bytes:
     return unpad(pt_padded)
 
 
-def process_image(path: str, key: bytes, do_show: bool = True) -> str:
-    basename = os.path.basename(path)
-    with open(path, 'rb') as f:
-        data = f.read()
+def encrypt_stream(fin, fout, key: bytes, iv: bytes = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Cifra `fin` en `fout` por bloques (DES-CBC); mismo formato que `encrypt_des`.
 
-    # Convertir a representación de bits (string)
-    bits = bytes_to_bitstring(data)
-    print(f"Longitud original (bytes): {len(data)}")
-    print(f"Longitud en bits: {len(bits)}")
-    print(f"Primeros 128 bits (muestra): {bits[:128]}")
+    Devuelve el número de bytes escritos.
+    """
+    if iv is None:
+        iv = get_random_bytes(BLOCK_SIZE)
+    return Taller_Comun.encrypt_stream(fin, fout, _cbc(key), BLOCK_SIZE, iv, chunk_size)
 
-    # (Opcional) convertir la representación de bits de vuelta a bytes para encriptar.
-    # Esto preserva la información original y demuestra la conversión solicitada.
-    data_for_encrypt = bitstring_to_bytes(bits)
 
-    # Cifrar con DES
-    iv_ct = encrypt_des(data_for_encrypt, key)
+def decrypt_stream(fin, fout, key: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+    """Descifra por bloques un flujo IV + ciphertext (DES-CBC). Devuelve los bytes escritos."""
+    return Taller_Comun.decrypt_stream(fin, fout, _cbc(key), BLOCK_SIZE, chunk_size)
+
+
+def encrypt_file(src: str, dst: str, key: bytes, iv: bytes = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Cifra el archivo `src` en `dst` usando `encrypt_stream`."""
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        return encrypt_stream(fin, fout, key, iv=iv, chunk_size=chunk_size)
+
+
+def decrypt_file(src: str, dst: str, key: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+    """Descifra el archivo `src` (IV + ciphertext) en `dst` usando `decrypt_stream`."""
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        return decrypt_stream(fin, fout, key, chunk_size=chunk_size)
 
-    # Codificar en Base64
-    b64 = base64.b64encode(iv_ct).decode('ascii')
-    print('\n--- Texto Base64 (ciphertext) ---')
-    print(b64)
-    print('--- Fin Base64 ---\n')
 
-    # Guardar Base64 en archivo
-    with open(path + '.b64.txt', 'w', encoding='utf-8') as f:
-        f.write(b64)
+def encrypt_file_mmap(src: str, dst: str, key: bytes, iv: bytes = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Cifra `src` en `dst` (DES-CBC) de un archivo mapeado en memoria al otro.
 
-    # Decodificar Base64
-    decoded = base64.b64decode(b64)
+    El formato es el mismo que `encrypt_des` (IV + ciphertext con padding
+    PKCS7). Devuelve el tamaño del archivo escrito.
+    """
+    if iv is None:
+        iv = get_random_bytes(BLOCK_SIZE)
+    return Taller_Comun.encrypt_file_mmap(src, dst, _cbc(key), BLOCK_SIZE, iv, chunk_size)
 
-    # Descifrar
-    recovered = decrypt_des(decoded, key)
 
-    # Guardar la imagen recuperada
+def decrypt_file_mmap(src: str, dst: str, key: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+    """Descifra con memoria mapeada un archivo IV + ciphertext (DES-CBC).
+
+    Devuelve el número de bytes escritos.
+    """
+    return Taller_Comun.decrypt_file_mmap(src, dst, _cbc(key), BLOCK_SIZE, chunk_size)
+
+
+def _report_bits(path: str) -> None:
+    """Muestra la longitud y una muestra de la representación de bits del archivo.
+
+    Sólo se leen los 16 bytes de la muestra.
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f, BitView(f.read(16)) as bits:
+        print(f"Longitud original (bytes): {size}")
+        print(f"Longitud en bits: {8 * size}")
+        print(f"Primeros 128 bits (muestra): {bits[:128]}")
+
+
+def process_image(path: str, key: bytes, do_show: bool = True, preview: int = B64_PREVIEW_CHARS,
+                  use_mmap: bool = False) -> str:
+    """Cifra la imagen con DES, guarda/verifica el Base64, descifra y guarda la imagen recuperada.
+
+    El ciphertext se escribe en `<imagen>.enc` por streaming (o, con
+    `use_mmap`, de un archivo mapeado en memoria al otro), así que la imagen
+    no se carga completa en memoria. Devuelve la ruta del archivo recuperado.
+    """
+    basename = os.path.basename(path)
+    enc_path = path + '.enc'
     recovered_path = os.path.join(os.path.dirname(path), f'recovered_{basename}')
-    with open(recovered_path, 'wb') as f:
-        f.write(recovered)
 
+    # Representación de bits (vista perezosa sobre los primeros bytes)
+    _report_bits(path)
+
+    # Cifrar con DES
+    (encrypt_file_mmap if use_mmap else encrypt_file)(path, enc_path, key)
+    print(f'Ciphertext (IV + datos) guardado en: {enc_path}')
+
+    # Codificar en Base64 por bloques, guardarlo en archivo y verificarlo
+    print()
+    save_b64(enc_path, path + '.b64.txt', preview)
+    print()
+
+    # Descifrar directamente al archivo recuperado
+    (decrypt_file_mmap if use_mmap else decrypt_file)(enc_path, recovered_path, key)
     print(f"Imagen recuperada guardada en: {recovered_path}")
 
-    if do_show:
+    Image = load_pil() if do_show else None
+    if Image is not None:
         try:
-            img = Image.open(BytesIO(recovered))
+            img = Image.open(recovered_path)
             img.show()
         except Exception as e:
             print(f"No se pudo mostrar la imagen automáticamente: {e}")
@@ -134,11 +240,52 @@ def process_image(path: str, key: bytes, do_show: bool = True) -> str:
     return recovered_path
 
 
+# Fábrica de ciphers de cada proceso del pool batch: la clave se envía una vez
+# por worker y se asocia a DES-CBC en el initializer (pycryptodome expande la
+# clave en cada DES.new y no permite reutilizar esa expansión con otro IV)
+_batch_cbc = None
+
+
+def _init_batch_worker(key: bytes) -> None:
+    global _batch_cbc
+    _batch_cbc = _cbc(key)
+
+
+def _encrypt_batch_file(job: tuple) -> dict:
+    src, dst = job
+    start = time.perf_counter()
+    iv = get_random_bytes(BLOCK_SIZE)
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        written = Taller_Comun.encrypt_stream(fin, fout, _batch_cbc, BLOCK_SIZE, iv)
+    return {
+        'file': src,
+        'output': dst,
+        'iv': iv.hex(),
+        'size': os.path.getsize(src),
+        'encrypted_size': written,
+        'seconds': round(time.perf_counter() - start, 6),
+    }
+
+
+def process_batch(paths: list, key: bytes, out_dir: str, workers: int = None) -> list:
+    """Cifra cada archivo de `paths` en `out_dir` (IV + ciphertext) con un pool de procesos.
+
+    Por cada archivo se añade una línea a `<out_dir>/manifest.jsonl` con el IV,
+    tamaños y tiempo. Devuelve la lista de entradas del manifiesto.
+    """
+    return Taller_Comun.run_batch(paths, out_dir, _encrypt_batch_file, _init_batch_worker, (key,), workers)
+
+
 def parse_args():
+    import argparse
     parser = argparse.ArgumentParser(description='Cifrar/descifrar imágenes usando DES (ejercicio)')
-    parser.add_argument('image', nargs='?', help='Ruta a la imagen. Si se omite se genera una imagen de prueba.')
+    parser.add_argument('image', nargs='?', help='Ruta a la imagen, o un directorio / patrón glob para el modo batch. Si se omite se genera una imagen de prueba.')
     parser.add_argument('--key', help='Clave DES en hexadecimal (8 bytes / 16 hex chars). Si se omite se genera aleatoria.')
     parser.add_argument('--no-show', action='store_true', help='No abrir la imagen recuperada automáticamente')
+    parser.add_argument('--mmap', action='store_true', help='Cifrar/descifrar sobre archivos mapeados en memoria (no carga la imagen como bytes)')
+    parser.add_argument('--b64-preview', type=int, default=B64_PREVIEW_CHARS, help=f'Caracteres de Base64 a mostrar en consola (0 = ninguno). Default={B64_PREVIEW_CHARS}')
+    parser.add_argument('--workers', type=int, help='Número de procesos del modo batch (por defecto, todos los núcleos)')
+    parser.add_argument('--out-dir', help='Directorio de salida del modo batch. Default=<entrada>/encrypted')
     return parser.parse_args()
 
 
@@ -154,8 +301,26 @@ def main():
         key = get_random_bytes(8)
         print(f'Clave DES generada (hex): {key.hex()}')
 
+    if args.image and is_batch_spec(args.image):
+        paths = expand_inputs(args.image)
+        if not paths:
+            print(f'No se encontraron archivos en: {args.image}')
+            sys.exit(1)
+        out_dir = batch_out_dir(args.image, args.out_dir)
+        start = time.perf_counter()
+        entries = process_batch(paths, key, out_dir, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        total_mb = sum(e['size'] for e in entries) / (1 << 20)
+        print(f'{len(entries)} archivos ({total_mb:.1f} MB) cifrados en {elapsed:.2f} s '
+              f'({len(entries) / max(elapsed, 1e-9) * 60:.0f} archivos/min)')
+        print(f'Manifiesto guardado en: {os.path.join(out_dir, MANIFEST_NAME)}')
+        return
+
     if not args.image:
         print('No se proporcionó imagen. Generando imagen de prueba (120x80).')
+        Image = load_pil()
+        if Image is None:
+            sys.exit(1)
         img = Image.new('RGB', (120, 80), color=(100, 150, 200))
         for x in range(120):
             for y in range(80):
@@ -167,7 +332,7 @@ def main():
     else:
         image_path = args.image
 
-    process_image(image_path, key, do_show=(not args.no_show))
+    process_image(image_path, key, do_show=(not args.no_show), preview=max(0, args.b64_preview), use_mmap=args.mmap)
 
 
 if __name__ == '__main__':
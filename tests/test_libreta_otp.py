@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Cifrado OTP'))
+
+import Libreta_OTP  # noqa: E402
+
+
+def nueva_libreta(tmp_path, tamaño=4096):
+    ruta = str(tmp_path / 'libreta.bin')
+    Libreta_OTP.generar_libreta(ruta, tamaño)
+    return ruta
+
+
+def test_archivo_ida_y_vuelta(tmp_path):
+    ruta = nueva_libreta(tmp_path)
+    origen = tmp_path / 'mensaje.txt'
+    origen.write_bytes(os.urandom(1000))
+    cifrado = tmp_path / 'mensaje.otp'
+    recuperado = tmp_path / 'recuperado.txt'
+    with Libreta_OTP.LibretaOTP(ruta) as libreta:
+        offset = libreta.cifrar_archivo(str(origen), str(cifrado))
+        assert libreta.consumidos() == [(offset, offset + 1000)]
+    with Libreta_OTP.LibretaOTP(ruta) as libreta:
+        assert libreta.descifrar_archivo(str(cifrado), str(recuperado)) == offset
+    assert recuperado.read_bytes() == origen.read_bytes()
+
+
+def test_archivo_vacio_no_consume_la_libreta(tmp_path):
+    ruta = nueva_libreta(tmp_path)
+    origen = tmp_path / 'vacio.txt'
+    origen.write_bytes(b'')
+    cifrado = tmp_path / 'vacio.otp'
+    recuperado = tmp_path / 'recuperado.txt'
+    with Libreta_OTP.LibretaOTP(ruta) as libreta:
+        assert libreta.cifrar_archivo(str(origen), str(cifrado)) == 0
+        assert libreta.consumidos() == []
+        assert libreta.disponible() == 4096
+        assert cifrado.read_bytes() == Libreta_OTP.CABECERA.pack(Libreta_OTP.MAGIC, 0)
+        assert libreta.descifrar_archivo(str(cifrado), str(recuperado)) == 0
+        assert libreta.consumidos() == []
+    assert recuperado.read_bytes() == b''
+    assert not os.path.exists(ruta + '.indice.json')
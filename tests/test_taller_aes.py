@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Taller AES'))
+
+import Taller_AES  # noqa: E402
+
+KEY = bytes(range(16))
+
+
+def write_container(tmp_path, mode):
+    src = tmp_path / 'plano.bin'
+    src.write_bytes(os.urandom(1000))
+    enc = tmp_path / 'cifrado.taes'
+    Taller_AES.encrypt_file_parallel(str(src), str(enc), KEY, mode=mode, workers=1,
+                                     segment_size=Taller_AES.BLOCK_SIZE * 4)
+    return src, enc
+
+
+def set_segment_size(path, segment_size):
+    raw = bytearray(path.read_bytes())
+    magic, mode_id, nonce, _ = Taller_AES.CONTAINER_HEADER.unpack_from(raw)
+    Taller_AES.CONTAINER_HEADER.pack_into(raw, 0, magic, mode_id, nonce, segment_size)
+    path.write_bytes(bytes(raw))
+
+
+@pytest.mark.parametrize('mode', ['ctr', 'gcm'])
+def test_parallel_round_trip(tmp_path, mode):
+    src, enc = write_container(tmp_path, mode)
+    dst = tmp_path / 'descifrado.bin'
+    assert Taller_AES.decrypt_file_parallel(str(enc), str(dst), KEY, workers=1) == src.stat().st_size
+    assert dst.read_bytes() == src.read_bytes()
+
+
+@pytest.mark.parametrize('mode', ['ctr', 'gcm'])
+@pytest.mark.parametrize('segment_size', [0, 1, Taller_AES.BLOCK_SIZE + 1])
+def test_corrupted_segment_size(tmp_path, mode, segment_size):
+    _, enc = write_container(tmp_path, mode)
+    set_segment_size(enc, segment_size)
+    dst = tmp_path / 'descifrado.bin'
+    with pytest.raises(ValueError, match='contenedor TAES corrupto'):
+        Taller_AES.decrypt_file_parallel(str(enc), str(dst), KEY, workers=1)
+    assert not dst.exists()